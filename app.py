@@ -3,6 +3,7 @@ from flask import Flask
 
 from config import UPLOAD_FOLDER, MAX_CONTENT_LENGTH, ALLOWED_EXTENSIONS
 from routes import register_routes
+from yecc_outbox import start_outbox_worker
 
 
 def create_app():
@@ -15,6 +16,7 @@ def create_app():
     os.makedirs(UPLOAD_FOLDER, exist_ok=True)
     
     register_routes(app)
+    start_outbox_worker()
     
     return app
 
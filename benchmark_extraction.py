@@ -0,0 +1,97 @@
+import re
+import json
+import time
+import argparse
+
+
+SAMPLE_SECTION = """Senior Oracle Fusion Financials Consultant with 8+ years of experience across GL, AP, AR and FA.
+Worked with Infosys Ltd (Jan 2019 - Present) and Wipro Technologies (Jul 2015 - Dec 2018) on 6 implementations.
+- Led requirement gathering, configuration and UAT for a 3 year finance transformation programme.
+- Built FBDI templates and OTBI reports; supported month-end close for 12 ledgers.
+"""
+
+
+def sample_resume(sections):
+    header = ("Priya Sharma\nPune, Maharashtra | +91 98765 43210 | priya.sharma@example.com\n"
+              "https://www.linkedin.com/in/priya-sharma\n\n")
+    return header + "\n".join(SAMPLE_SECTION for _ in range(sections))
+
+
+def sample_response(resume_text):
+    payload = json.dumps({'name': 'Priya Sharma', 'summary': resume_text[:2000], 'job_experience': [
+        {'position': 'Senior Consultant', 'company_name': 'Infosys Ltd', 'short_description': resume_text[:500]}
+    ] * 5})
+    return f"<think>Planning the extraction.</think>\n```json\n{payload}\n```"
+
+
+def legacy_contact_info(text):
+    emails = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+    phones = re.findall(r'[\+\(]?[1-9][0-9 .\-\(\)]{8,}[0-9]', text)
+    linkedin = re.findall(r'(?:https?://)?(?:www\.)?linkedin\.com/in/[\w\-]+', text, re.IGNORECASE)
+    years = re.findall(r'(\d+)[\+]?\s*(?:years?|yrs?)', text.lower())
+    return {
+        'email': emails[0] if emails else None,
+        'phone': phones[0].strip() if phones else None,
+        'linkedin': linkedin[0] if linkedin else None,
+        'years_experience': max(map(int, years)) if years else None
+    }
+
+
+def legacy_fix_json_string(json_str):
+    json_str = re.sub(r'```json\s*', '', json_str)
+    json_str = re.sub(r'```\s*', '', json_str)
+    json_str = re.sub(r'<think>.*?</think>', '', json_str, flags=re.DOTALL)
+    json_str = re.sub(r'<thinking>.*?</thinking>', '', json_str, flags=re.DOTALL)
+    json_str = json_str.strip()
+    start = json_str.find('{')
+    end = json_str.rfind('}')
+    return json_str[start:end+1] if start != -1 and end > start else "{}"
+
+
+def time_call(func, argument, repeat):
+    func(argument)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(argument)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Micro-benchmark contact extraction and JSON clean-up per resume')
+    parser.add_argument('--sections', type=int, default=20, help='Experience paragraphs in the synthetic resume')
+    parser.add_argument('--repeat', type=int, default=2000, help='Timed calls per function')
+    args = parser.parse_args()
+
+    from utils import extract_contact_info
+    from resume_parser import fix_json_string
+
+    resume_text = sample_resume(args.sections)
+    response = sample_response(resume_text)
+
+    new_contact = extract_contact_info(resume_text)
+    old_contact = legacy_contact_info(resume_text)
+    mismatched = [key for key in old_contact if old_contact[key] != new_contact[key]]
+    if fix_json_string(response) != legacy_fix_json_string(response):
+        mismatched.append('fix_json_string')
+
+    rows = [
+        ('Contact extraction', time_call(legacy_contact_info, resume_text, args.repeat),
+         time_call(extract_contact_info, resume_text, args.repeat)),
+        ('fix_json_string', time_call(legacy_fix_json_string, response, args.repeat),
+         time_call(fix_json_string, response, args.repeat)),
+    ]
+
+    print("\n" + "="*60)
+    print("📊 Extraction Micro-benchmark")
+    print("="*60)
+    print(f"Resume: {len(resume_text):,} characters, response: {len(response):,} characters, {args.repeat} calls each")
+    for label, before, after in rows:
+        print(f"{label:<20} before: {before:8.1f} µs   after: {after:8.1f} µs   ({before / after:.2f}x)")
+    print(f"Candidates found: {len(new_contact['emails'])} emails, {len(new_contact['phones'])} phones, "
+          f"{len(new_contact['linkedins'])} LinkedIn URLs, {len(new_contact['years'])} experience mentions")
+    print(f"Results match: {'yes' if not mismatched else 'no (' + ', '.join(mismatched) + ')'}")
+    print("="*60 + "\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+import os
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+
+def sample_resume(number):
+    return {
+        "name": f"Bench Candidate{number}",
+        "email": f"bench{number}@example.com",
+        "phone": f"+91 98{number:08d}",
+        "location": "Pune, Maharashtra",
+        "linkedin": f"https://linkedin.com/in/bench{number}",
+        "summary": "Oracle Fusion Financials consultant with implementation and support experience.",
+        "total_years_experience": "6",
+        "current_role": "Senior Consultant",
+        "current_company": "Infosys",
+        "erp_systems": ["Oracle Fusion", "Oracle E-Business Suite"],
+        "erp_modules": ["GL", "AP", "AR", "FA", "CM"],
+        "technical_skills": ["SQL", "BI Publisher", "OTBI", "FBDI"],
+        "certifications": ["Oracle Financials Cloud: General Ledger 2023 Implementation Professional"],
+        "education": [{"degree": "Bachelor of Commerce", "university": "University of Mumbai", "year": "2016"}],
+        "job_experience": [
+            {"position": "Senior Consultant", "company_name": "Infosys", "from_date": "Jan 2021",
+             "to_date": "Present", "currently_working_here": True, "short_description": "Fusion GL/AP rollouts"},
+            {"position": "Consultant", "company_name": "Wipro", "from_date": "Jul 2018",
+             "to_date": "Dec 2020", "currently_working_here": False, "short_description": "EBS R12 support"}
+        ],
+        "erp_projects_experience": [
+            {"project_name": f"Finance Transformation {i}", "company_name": "Client", "project_domain": "Manufacturing",
+             "project_type": ["Implementation"], "track": "FIN", "product": "Oracle Cloud ERP (Fusion)",
+             "financials_modules": ["GL", "AP", "AR"], "role": "Functional Consultant"}
+            for i in range(3)
+        ]
+    }
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load-test sync_to_yecc_api against a local fake YECC API')
+    parser.add_argument('--resumes', type=int, default=50, help='Number of resumes to sync')
+    parser.add_argument('--concurrency', type=int, default=4, help='Resumes synced at the same time')
+    parser.add_argument('--latency', type=float, default=50, help='Fake server mean latency in ms')
+    parser.add_argument('--jitter', type=float, default=10, help='Fake server latency jitter in ms')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of fake server requests that fail')
+    parser.add_argument('--cold', action='store_true', help='Clear the reference list cache before every resume')
+    args = parser.parse_args()
+
+    from fake_yecc_server import start_fake_server, get_server_stats, reset_server_stats
+    server = start_fake_server(0, args.latency, args.jitter, args.error_rate)
+    os.environ["YECC_BASE_URL"] = f"http://127.0.0.1:{server.server_address[1]}"
+    os.environ["YECC_REFERENCE_CACHE_FILE"] = ""
+
+    import yecc_sync
+
+    def run(number):
+        if args.cold:
+            yecc_sync._reference_cache.clear()
+        start = time.perf_counter()
+        result = yecc_sync.sync_to_yecc_api(sample_resume(number))
+        return time.perf_counter() - start, result is not None
+
+    reset_server_stats()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        results = list(pool.map(run, range(args.resumes)))
+    elapsed = time.perf_counter() - started
+    server.shutdown()
+
+    latencies = [latency * 1000 for latency, _ in results]
+    succeeded = sum(1 for _, ok in results if ok)
+    stats = get_server_stats()
+
+    print("\n" + "="*60)
+    print("📊 YECC Sync Benchmark")
+    print("="*60)
+    print(f"Resumes: {args.resumes} (concurrency {args.concurrency}, {'cold' if args.cold else 'warm'} reference cache)")
+    print(f"Server latency: {args.latency}±{args.jitter} ms, error rate: {args.error_rate:.0%}")
+    print(f"Succeeded: {succeeded}/{args.resumes}")
+    print(f"Sync latency p50: {percentile(latencies, 0.5):.0f} ms, p95: {percentile(latencies, 0.95):.0f} ms, "
+          f"max: {max(latencies):.0f} ms")
+    print(f"Throughput: {args.resumes / elapsed:.2f} resumes/s ({elapsed:.1f}s total)")
+    print(f"Requests per resume: {stats['requests'] / args.resumes:.1f} ({stats['errors']} injected errors)")
+    for route, count in sorted(stats['by_route'].items(), key=lambda item: -item[1]):
+        print(f"   {route}: {count}")
+    print("="*60 + "\n")
+
+
+if __name__ == '__main__':
+    main()
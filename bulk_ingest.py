@@ -0,0 +1,41 @@
+import os
+import json
+import argparse
+import tempfile
+
+from config import UPLOAD_FOLDER
+from ingest import process_resume_paths
+from yecc_outbox import get_outbox_stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bulk-ingest resumes from files, folders or zip archives')
+    parser.add_argument('paths', nargs='+', help='Resume files (.pdf/.docx), folders or .zip archives')
+    parser.add_argument('--summary', help='Write the ingest summary as JSON to this file')
+    args = parser.parse_args()
+
+    os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+    work_dir = tempfile.mkdtemp(prefix='bulk_', dir=UPLOAD_FOLDER)
+
+    print("\n" + "="*60)
+    print(f"📦 Bulk ingest: {len(args.paths)} paths")
+    print("="*60 + "\n")
+
+    summary = process_resume_paths(args.paths, work_dir, on_stage=lambda stage: print(f"⏳ {stage}"))
+
+    print("\n" + "="*60)
+    print(f"✅ Saved: {summary['saved']}/{summary['total']}")
+    for failure in summary['failed']:
+        print(f"❌ {failure['file']}: {failure['error']}")
+    pending = get_outbox_stats()['pending']
+    if pending:
+        print(f"📮 {pending} YECC syncs pending; the web app's outbox worker will deliver them")
+    print("="*60 + "\n")
+
+    if args.summary:
+        with open(args.summary, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
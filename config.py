@@ -8,23 +8,68 @@ UPLOAD_FOLDER = 'uploads'
 MAX_CONTENT_LENGTH = 16 * 1024 * 1024  
 ALLOWED_EXTENSIONS = {'pdf', 'docx', 'doc'}
 
+INGEST_WORKERS = int(os.getenv("INGEST_WORKERS", "4"))
+JOB_RETENTION_LIMIT = 500
+BULK_EXTRACT_WORKERS = int(os.getenv("BULK_EXTRACT_WORKERS", str(os.cpu_count() or 2)))
+BULK_PARSE_CONCURRENCY = int(os.getenv("BULK_PARSE_CONCURRENCY", "4"))
+
 EXCEL_FILE = 'resumes_database.xlsx'
+DATABASE_FILE = 'resumes_database.db'
 LOCAL_DOCS_DIR = 'docs_for_rag'
+VECTOR_INDEX_DIR = 'vector_index'
+VECTOR_DIMENSIONS = 2048
+PARSE_CACHE_FILE = 'parse_cache.db'
+PARSE_CACHE_SIZE = int(os.getenv("PARSE_CACHE_SIZE", "5000"))
 
+LLM_BACKEND = os.getenv("LLM_BACKEND", "gemini")
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 GEMINI_MODEL = "gemini-2.0-flash-exp"
+LOCAL_LLM_URL = os.getenv("LOCAL_LLM_URL", "http://localhost:11434/v1")
+LOCAL_LLM_API_KEY = os.getenv("LOCAL_LLM_API_KEY", "ollama")
+LOCAL_LLM_TIMEOUT = int(os.getenv("LOCAL_LLM_TIMEOUT", "300"))
+BATCH_PARSE_MAX_RESUMES = int(os.getenv("BATCH_PARSE_MAX_RESUMES", "4"))
+BATCH_PARSE_MAX_CHARS = 20000
+BATCH_PARSE_MAX_OUTPUT_TOKENS = 8192
+RULE_PARSE_MIN_SCORE = int(os.getenv("RULE_PARSE_MIN_SCORE", "80"))
+PARSE_TRANSPORT_RETRIES = int(os.getenv("PARSE_TRANSPORT_RETRIES", "3"))
+PARSE_RETRY_BASE_DELAY = 1.0
+PARSE_RETRY_MAX_DELAY = 8.0
+
+AI_SEARCH_SHORTLIST_SIZE = int(os.getenv("AI_SEARCH_SHORTLIST_SIZE", "30"))
+SEMANTIC_SEARCH_TOP_K = 20
+SEARCH_PAGE_SIZE = 20
+SEARCH_MAX_PAGE_SIZE = 200
+SEARCH_SESSION_TTL = 15 * 60
+SEARCH_SESSION_LIMIT = 200
+SEARCH_CACHE_TTL = 10 * 60
+SEARCH_CACHE_SIZE = 256
+SEARCH_RESULT_COLUMNS = [
+    'ID', 'Name', 'Email', 'Phone', 'Current_Role', 'Current_Company', 'Total_Years_Experience',
+    'ERP_Systems', 'ERP_Modules', 'Technical_Skills'
+]
 
 USE_BETA_ENVIRONMENT = True
 
 YECC_API_TOKEN = os.getenv("YECC_API_TOKEN") 
 
 if USE_BETA_ENVIRONMENT:
-    YECC_BASE_URL = "https://api.yecc.tech"
+    YECC_BASE_URL = os.getenv("YECC_BASE_URL", "https://api.yecc.tech")
     FRONTEND_ORIGIN = "https://beta.yecc.tech"
 else:
-    YECC_BASE_URL = "https://api.yecc.tech"
+    YECC_BASE_URL = os.getenv("YECC_BASE_URL", "https://api.yecc.tech")
     FRONTEND_ORIGIN = "https://yecc.tech"
 
+YECC_SYNC_WORKERS = int(os.getenv("YECC_SYNC_WORKERS", "8"))
+YECC_REFERENCE_TTL = int(os.getenv("YECC_REFERENCE_TTL", str(6 * 60 * 60)))
+YECC_REFERENCE_CACHE_FILE = os.getenv("YECC_REFERENCE_CACHE_FILE", "yecc_reference_cache.json")
+YECC_OUTBOX_FILE = 'yecc_outbox.db'
+YECC_OUTBOX_WORKERS = int(os.getenv("YECC_OUTBOX_WORKERS", "2"))
+YECC_SYNC_RATE_PER_MINUTE = int(os.getenv("YECC_SYNC_RATE_PER_MINUTE", "30"))
+YECC_RETRY_BASE_DELAY = 30
+YECC_RETRY_MAX_DELAY = 60 * 60
+YECC_MAX_ATTEMPTS = 8
+YECC_CLAIM_LEASE = 10 * 60
+
 YECC_HEADERS = {
     "Accept": "application/json, text/plain, */*",
     "Authorization": f"{YECC_API_TOKEN}",
@@ -40,3 +85,5 @@ MODEL_CONFIGS = [
 ]
 
 MAX_TEXT_LENGTHS = [5000, 4000, 3000, 2500]
+CHUNK_PARSE_MAX_CHARS = int(os.getenv("CHUNK_PARSE_MAX_CHARS", "16000" if LLM_BACKEND == 'gemini' else str(MAX_TEXT_LENGTHS[0])))
+CHUNK_PARSE_CONCURRENCY = int(os.getenv("CHUNK_PARSE_CONCURRENCY", "4"))
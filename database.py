@@ -1,73 +1,556 @@
 import os
+import re
 import json
+import sqlite3
+import threading
 import pandas as pd
+from contextlib import contextmanager
 from datetime import datetime
-from config import EXCEL_FILE
+from config import EXCEL_FILE, DATABASE_FILE
+from keyword_index import index_candidate, remove_candidate
+
+
+COLUMNS = [
+    'Timestamp', 'Name', 'Email', 'Phone', 'Location', 'LinkedIn', 'Summary',
+    'Total_Years_Experience', 'Current_Role', 'Current_Company',
+    'ERP_Systems', 'ERP_Modules', 'Technical_Skills', 'Certifications',
+    'Education', 'Experience', 'Projects', 'RAG_File_ID', 'Completeness_Score',
+    'YECC_User_ID', 'YECC_Resume_URL', 'YECC_Profile_URL'
+]
+
+_local = threading.local()
+_init_lock = threading.Lock()
+_initialized = False
+
+_candidates_lock = threading.Lock()
+_candidates_cache = {'signature': None, 'df': None}
+
+
+def _get_connection():
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect(DATABASE_FILE, timeout=30, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        _local.conn = conn
+    _init_database(conn)
+    return conn
+
+
+def _init_database(conn):
+    global _initialized
+    if _initialized:
+        return
+
+    with _init_lock:
+        if _initialized:
+            return
+
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'resumes'"
+        ).fetchone()
+
+        if not exists:
+            column_defs = ', '.join(
+                f'{col} INTEGER DEFAULT 0' if col == 'Completeness_Score' else f"{col} TEXT DEFAULT ''"
+                for col in COLUMNS
+            )
+            conn.execute(f'CREATE TABLE resumes (ID INTEGER PRIMARY KEY AUTOINCREMENT, {column_defs})')
+
+        stats_exist = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'resume_stats'"
+        ).fetchone()
+
+        if not stats_exist:
+            conn.execute(
+                'CREATE TABLE resume_stats (ID INTEGER PRIMARY KEY CHECK (ID = 1), '
+                'Resume_Count INTEGER NOT NULL DEFAULT 0, Completeness_Total INTEGER NOT NULL DEFAULT 0)'
+            )
+            conn.execute(
+                'CREATE TABLE erp_system_stats (ERP_System TEXT PRIMARY KEY, Resume_Count INTEGER NOT NULL DEFAULT 0)'
+            )
+            conn.execute('INSERT INTO resume_stats (ID) VALUES (1)')
+
+        stats_columns = [row[1] for row in conn.execute('PRAGMA table_info(resume_stats)')]
+        if 'Data_Version' not in stats_columns:
+            conn.execute('ALTER TABLE resume_stats ADD COLUMN Data_Version INTEGER NOT NULL DEFAULT 0')
+
+        keys_exist = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'candidate_keys'"
+        ).fetchone()
+
+        if not keys_exist:
+            conn.execute('CREATE TABLE candidate_keys (Candidate_Key TEXT PRIMARY KEY, Resume_ID INTEGER NOT NULL)')
+            conn.execute('CREATE INDEX idx_candidate_keys_resume ON candidate_keys (Resume_ID)')
+
+        if not exists:
+            _import_legacy_excel(conn)
+
+        if not stats_exist:
+            with _transaction(conn):
+                _rebuild_stats(conn)
+
+        if not keys_exist:
+            with _transaction(conn):
+                _rebuild_candidate_keys(conn)
+
+        _initialized = True
+
+
+@contextmanager
+def _transaction(conn):
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        yield conn
+        conn.execute('COMMIT')
+    except Exception:
+        conn.execute('ROLLBACK')
+        raise
+
+
+def _split_erp_systems(value):
+    return [s.strip() for s in str(value or '').split(',') if s.strip()]
+
+
+def _count_erp_systems(erp_values):
+    erp_counts = {}
+    for value in erp_values:
+        for system in set(_split_erp_systems(value)):
+            erp_counts[system] = erp_counts.get(system, 0) + 1
+    return erp_counts
+
+
+def _update_stats(conn, rows, removed_rows=()):
+    score_index = COLUMNS.index('Completeness_Score')
+    completeness_total = sum(row[score_index] for row in rows) - sum(row[score_index] for row in removed_rows)
+    conn.execute(
+        'UPDATE resume_stats SET Resume_Count = Resume_Count + ?, Completeness_Total = Completeness_Total + ?, '
+        'Data_Version = Data_Version + 1 WHERE ID = 1',
+        (len(rows) - len(removed_rows), completeness_total)
+    )
+
+    erp_index = COLUMNS.index('ERP_Systems')
+    erp_counts = _count_erp_systems(row[erp_index] for row in rows)
+    for system, count in _count_erp_systems(row[erp_index] for row in removed_rows).items():
+        erp_counts[system] = erp_counts.get(system, 0) - count
+    conn.executemany(
+        'INSERT INTO erp_system_stats (ERP_System, Resume_Count) VALUES (?, ?) '
+        'ON CONFLICT(ERP_System) DO UPDATE SET Resume_Count = Resume_Count + excluded.Resume_Count',
+        [(system, count) for system, count in erp_counts.items() if count]
+    )
+
+
+def _rebuild_stats(conn):
+    count, completeness_total = conn.execute(
+        'SELECT COUNT(*), COALESCE(SUM(Completeness_Score), 0) FROM resumes'
+    ).fetchone()
+    conn.execute(
+        'UPDATE resume_stats SET Resume_Count = ?, Completeness_Total = ?, Data_Version = Data_Version + 1 WHERE ID = 1',
+        (count, completeness_total)
+    )
+
+    erp_counts = _count_erp_systems(row[0] for row in conn.execute('SELECT ERP_Systems FROM resumes'))
+    conn.execute('DELETE FROM erp_system_stats')
+    conn.executemany(
+        'INSERT INTO erp_system_stats (ERP_System, Resume_Count) VALUES (?, ?)',
+        list(erp_counts.items())
+    )
+
+
+def _import_legacy_excel(conn):
+    if not os.path.exists(EXCEL_FILE):
+        return
+
+    try:
+        df = pd.read_excel(EXCEL_FILE).fillna('')
+        rows = [_row_values({col: record.get(col, '') for col in COLUMNS}) for record in df.to_dict('records')]
+        with _transaction(conn):
+            _insert_rows(conn, rows)
+        print(f"✅ Imported {len(rows)} records from {EXCEL_FILE}")
+    except Exception as e:
+        print(f"Warning: Could not import legacy Excel database: {e}")
+
+
+def _flatten_resume(parsed_data):
+    return {
+        'Timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'Name': parsed_data.get('name', ''),
+        'Email': parsed_data.get('email', ''),
+        'Phone': parsed_data.get('phone', ''),
+        'Location': parsed_data.get('location', ''),
+        'LinkedIn': parsed_data.get('linkedin', ''),
+        'Summary': parsed_data.get('summary', ''),
+        'Total_Years_Experience': parsed_data.get('total_years_experience', ''),
+        'Current_Role': parsed_data.get('current_role', ''),
+        'Current_Company': parsed_data.get('current_company', ''),
+        'ERP_Systems': ', '.join(parsed_data.get('erp_systems', [])),
+        'ERP_Modules': ', '.join(parsed_data.get('erp_modules', [])),
+        'Technical_Skills': ', '.join(parsed_data.get('technical_skills', [])),
+        'Certifications': ', '.join(parsed_data.get('certifications', [])),
+        'Education': json.dumps(parsed_data.get('education', [])),
+        'Experience': json.dumps(parsed_data.get('experience', [])),
+        'Projects': json.dumps(parsed_data.get('projects', [])),
+        'RAG_File_ID': parsed_data.get('_rag_file_id', ''),
+        'Completeness_Score': parsed_data.get('_completeness_score', 0),
+        'YECC_User_ID': parsed_data.get('_yecc_user_id', ''),
+        'YECC_Resume_URL': parsed_data.get('_yecc_resume_url', ''),
+        'YECC_Profile_URL': parsed_data.get('_yecc_profile_url', '')
+    }
+
+
+def _row_values(flat_data):
+    values = []
+    for col in COLUMNS:
+        value = flat_data.get(col, '')
+        if value is None:
+            value = ''
+        if col == 'Completeness_Score':
+            try:
+                value = int(float(value or 0))
+            except (TypeError, ValueError):
+                value = 0
+        else:
+            value = str(value)
+        values.append(value)
+    return values
+
+
+def _insert_rows(conn, rows):
+    placeholders = ', '.join('?' for _ in COLUMNS)
+    cursor = conn.executemany(
+        f"INSERT INTO resumes ({', '.join(COLUMNS)}) VALUES ({placeholders})",
+        rows
+    )
+    return cursor
+
+
+def _normalize_email(email):
+    return str(email or '').strip().lower()
+
+
+def _normalize_phone(phone):
+    digits = re.sub(r'\D', '', str(phone or ''))
+    return digits[-10:] if len(digits) >= 7 else ''
+
+
+def _normalize_name(name):
+    words = re.findall(r'[a-z]+', str(name or '').lower())
+    return ' '.join(words) if len(words) >= 2 else ''
+
+
+def _candidate_keys(email, phone, name):
+    keys = []
+    email = _normalize_email(email)
+    phone = _normalize_phone(phone)
+    if email:
+        keys.append(f'email:{email}')
+    if phone:
+        keys.append(f'phone:{phone}')
+    if not keys:
+        name = _normalize_name(name)
+        if name:
+            keys.append(f'name:{name}')
+    return keys
+
+
+def _row_keys(row):
+    return _candidate_keys(row[COLUMNS.index('Email')], row[COLUMNS.index('Phone')], row[COLUMNS.index('Name')])
+
+
+def _store_candidate_keys(conn, resume_id, row):
+    conn.execute('DELETE FROM candidate_keys WHERE Resume_ID = ?', (resume_id,))
+    conn.executemany(
+        'INSERT OR REPLACE INTO candidate_keys (Candidate_Key, Resume_ID) VALUES (?, ?)',
+        [(key, resume_id) for key in _row_keys(row)]
+    )
+
+
+def _rebuild_candidate_keys(conn):
+    conn.execute('DELETE FROM candidate_keys')
+    for resume_id, email, phone, name in conn.execute('SELECT ID, Email, Phone, Name FROM resumes ORDER BY ID').fetchall():
+        conn.executemany(
+            'INSERT OR REPLACE INTO candidate_keys (Candidate_Key, Resume_ID) VALUES (?, ?)',
+            [(key, resume_id) for key in _candidate_keys(email, phone, name)]
+        )
+
+
+def _find_duplicate(conn, row):
+    for key in _row_keys(row):
+        match = conn.execute('SELECT Resume_ID FROM candidate_keys WHERE Candidate_Key = ?', (key,)).fetchone()
+        if match:
+            return match[0]
+    return None
+
+
+def _merge_rows(old_row, new_row):
+    return [new if new not in ('', 0, '[]', '{}') else old for old, new in zip(old_row, new_row)]
+
+
+def _upsert_row(conn, row):
+    resume_id = _find_duplicate(conn, row)
+    old_row = None
+    if resume_id is not None:
+        old_row = conn.execute(
+            f"SELECT {', '.join(COLUMNS)} FROM resumes WHERE ID = ?", (resume_id,)
+        ).fetchone()
+
+    if old_row is None:
+        placeholders = ', '.join('?' for _ in COLUMNS)
+        resume_id = conn.execute(
+            f"INSERT INTO resumes ({', '.join(COLUMNS)}) VALUES ({placeholders})",
+            row
+        ).lastrowid
+    else:
+        old_row = list(old_row)
+        row = _merge_rows(old_row, row)
+        assignments = ', '.join(f'{col} = ?' for col in COLUMNS)
+        conn.execute(f'UPDATE resumes SET {assignments} WHERE ID = ?', row + [resume_id])
+
+    _store_candidate_keys(conn, resume_id, row)
+    return resume_id, row, old_row
+
+
+def _database_mtime():
+    mtimes = [os.path.getmtime(path) for path in (DATABASE_FILE, DATABASE_FILE + '-wal') if os.path.exists(path)]
+    return max(mtimes) if mtimes else 0
+
+
+def _database_signature():
+    signature = []
+    for path in (DATABASE_FILE, DATABASE_FILE + '-wal'):
+        if os.path.exists(path):
+            stat = os.stat(path)
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        else:
+            signature.append(None)
+    return tuple(signature)
+
+
+def invalidate_candidates_cache():
+    with _candidates_lock:
+        _candidates_cache['signature'] = None
+        _candidates_cache['df'] = None
 
 
 def save_to_excel(parsed_data):
     try:
-        flat_data = {
-            'Timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'Name': parsed_data.get('name', ''),
-            'Email': parsed_data.get('email', ''),
-            'Phone': parsed_data.get('phone', ''),
-            'Location': parsed_data.get('location', ''),
-            'LinkedIn': parsed_data.get('linkedin', ''),
-            'Summary': parsed_data.get('summary', ''),
-            'Total_Years_Experience': parsed_data.get('total_years_experience', ''),
-            'Current_Role': parsed_data.get('current_role', ''),
-            'Current_Company': parsed_data.get('current_company', ''),
-            'ERP_Systems': ', '.join(parsed_data.get('erp_systems', [])),
-            'ERP_Modules': ', '.join(parsed_data.get('erp_modules', [])),
-            'Technical_Skills': ', '.join(parsed_data.get('technical_skills', [])),
-            'Certifications': ', '.join(parsed_data.get('certifications', [])),
-            'Education': json.dumps(parsed_data.get('education', [])),
-            'Experience': json.dumps(parsed_data.get('experience', [])),
-            'Projects': json.dumps(parsed_data.get('projects', [])),
-            'RAG_File_ID': parsed_data.get('_rag_file_id', ''),
-            'Completeness_Score': parsed_data.get('_completeness_score', 0),
-            'YECC_User_ID': parsed_data.get('_yecc_user_id', ''),
-            'YECC_Resume_URL': parsed_data.get('_yecc_resume_url', ''),
-            'YECC_Profile_URL': parsed_data.get('_yecc_profile_url', '')
-        }
-        
-        if os.path.exists(EXCEL_FILE):
-            df = pd.read_excel(EXCEL_FILE)
-            df = pd.concat([df, pd.DataFrame([flat_data])], ignore_index=True)
+        flat_data = _flatten_resume(parsed_data)
+
+        row = _row_values(flat_data)
+
+        conn = _get_connection()
+        with _transaction(conn):
+            resume_id, row, old_row = _upsert_row(conn, row)
+            _update_stats(conn, [row], [old_row] if old_row else [])
+        invalidate_candidates_cache()
+        index_candidate(resume_id, dict(zip(COLUMNS, row)))
+        if old_row:
+            print(f"♻️ Updated existing candidate #{resume_id} in {DATABASE_FILE}")
         else:
-            df = pd.DataFrame([flat_data])
-        
-        df.to_excel(EXCEL_FILE, index=False)
-        print(f"✅ Data saved to {EXCEL_FILE}")
-        return True
+            print(f"✅ Data saved to {DATABASE_FILE}")
+        return resume_id
     except Exception as e:
-        print(f"Error saving to Excel: {e}")
-        raise Exception(f"Failed to save data to Excel: {str(e)}")
+        print(f"Error saving to database: {e}")
+        raise Exception(f"Failed to save data to database: {str(e)}")
+
+
+def save_many_to_excel(parsed_list):
+    if not parsed_list:
+        return []
+
+    try:
+        rows = [_row_values(_flatten_resume(parsed_data)) for parsed_data in parsed_list]
+
+        conn = _get_connection()
+        saved = {}
+        added_rows = []
+        removed_rows = []
+        row_ids = []
+        with _transaction(conn):
+            for row in rows:
+                resume_id, row, old_row = _upsert_row(conn, row)
+                added_rows.append(row)
+                if old_row:
+                    removed_rows.append(old_row)
+                saved[resume_id] = row
+                row_ids.append(resume_id)
+            _update_stats(conn, added_rows, removed_rows)
+        invalidate_candidates_cache()
+        for resume_id, row in saved.items():
+            index_candidate(resume_id, dict(zip(COLUMNS, row)))
+        print(f"✅ {len(rows)} records saved to {DATABASE_FILE} ({len(removed_rows)} updated existing candidates)")
+        return row_ids
+    except Exception as e:
+        print(f"Error saving batch to database: {e}")
+        raise Exception(f"Failed to save batch to database: {str(e)}")
+
+
+def update_yecc_ids(resume_id, user_id, resume_url, profile_url):
+    try:
+        conn = _get_connection()
+        with _transaction(conn):
+            cursor = conn.execute(
+                'UPDATE resumes SET YECC_User_ID = ?, YECC_Resume_URL = ?, YECC_Profile_URL = ? WHERE ID = ?',
+                (str(user_id or ''), str(resume_url or ''), str(profile_url or ''), resume_id)
+            )
+            if cursor.rowcount:
+                conn.execute('UPDATE resume_stats SET Data_Version = Data_Version + 1 WHERE ID = 1')
+        invalidate_candidates_cache()
+        return cursor.rowcount > 0
+    except Exception as e:
+        print(f"Error updating YECC IDs: {e}")
+        raise Exception(f"Failed to update YECC IDs: {str(e)}")
 
 
 def get_resume_count():
     try:
-        if os.path.exists(EXCEL_FILE):
-            df = pd.read_excel(EXCEL_FILE)
-            return len(df)
-        return 0
+        if not os.path.exists(DATABASE_FILE) and not os.path.exists(EXCEL_FILE):
+            return 0
+        conn = _get_connection()
+        return conn.execute('SELECT Resume_Count FROM resume_stats WHERE ID = 1').fetchone()[0]
     except Exception as e:
         print(f"Error getting resume count: {e}")
         return 0
 
 
+def get_database_version():
+    try:
+        if not os.path.exists(DATABASE_FILE) and not os.path.exists(EXCEL_FILE):
+            return 0
+        conn = _get_connection()
+        return conn.execute('SELECT Data_Version FROM resume_stats WHERE ID = 1').fetchone()[0]
+    except Exception as e:
+        print(f"Error getting database version: {e}")
+        return None
+
+
+def get_database_stats():
+    try:
+        if not os.path.exists(DATABASE_FILE) and not os.path.exists(EXCEL_FILE):
+            return {'count': 0, 'average_completeness': 0, 'erp_systems': {}}
+
+        conn = _get_connection()
+        count, completeness_total = conn.execute(
+            'SELECT Resume_Count, Completeness_Total FROM resume_stats WHERE ID = 1'
+        ).fetchone()
+        erp_systems = dict(conn.execute(
+            'SELECT ERP_System, Resume_Count FROM erp_system_stats WHERE Resume_Count > 0 '
+            'ORDER BY Resume_Count DESC, ERP_System'
+        ).fetchall())
+
+        return {
+            'count': count,
+            'average_completeness': round(completeness_total / count, 1) if count else 0,
+            'erp_systems': erp_systems
+        }
+    except Exception as e:
+        print(f"Error getting database stats: {e}")
+        return {'count': 0, 'average_completeness': 0, 'erp_systems': {}}
+
+
+def load_candidates_df():
+    if not os.path.exists(DATABASE_FILE) and not os.path.exists(EXCEL_FILE):
+        return pd.DataFrame(columns=['ID'] + COLUMNS)
+
+    conn = _get_connection()
+    return pd.read_sql_query('SELECT * FROM resumes ORDER BY ID', conn)
+
+
+def get_candidates_df():
+    if not os.path.exists(DATABASE_FILE) and not os.path.exists(EXCEL_FILE):
+        return pd.DataFrame(columns=['ID'] + COLUMNS)
+
+    _get_connection()
+    signature = _database_signature()
+    if _candidates_cache['signature'] == signature and _candidates_cache['df'] is not None:
+        return _candidates_cache['df']
+
+    with _candidates_lock:
+        signature = _database_signature()
+        if _candidates_cache['signature'] != signature or _candidates_cache['df'] is None:
+            df = load_candidates_df().fillna('')
+            _candidates_cache['df'] = df
+            _candidates_cache['signature'] = signature
+            print(f"📚 Loaded {len(df)} candidates into memory")
+        return _candidates_cache['df']
+
+
+def export_to_excel():
+    if not os.path.exists(DATABASE_FILE) and not os.path.exists(EXCEL_FILE):
+        return None
+
+    conn = _get_connection()
+    if os.path.exists(EXCEL_FILE) and os.path.getmtime(EXCEL_FILE) >= _database_mtime():
+        return EXCEL_FILE
+
+    df = pd.read_sql_query(f"SELECT {', '.join(COLUMNS)} FROM resumes ORDER BY ID", conn)
+    df.to_excel(EXCEL_FILE, index=False)
+    print(f"✅ Exported {len(df)} records to {EXCEL_FILE}")
+    return EXCEL_FILE
+
+
 def clean_database():
     try:
-        if not os.path.exists(EXCEL_FILE):
+        if not os.path.exists(DATABASE_FILE) and not os.path.exists(EXCEL_FILE):
             return False, "No database found"
-        
-        df = pd.read_excel(EXCEL_FILE)
-        original_count = len(df)
-        
-        df = df.fillna('')
-        df.to_excel(EXCEL_FILE, index=False)
-        
+
+        conn = _get_connection()
+        with _transaction(conn):
+            original_count = conn.execute('SELECT COUNT(*) FROM resumes').fetchone()[0]
+            for col in COLUMNS:
+                default = '0' if col == 'Completeness_Score' else "''"
+                conn.execute(f'UPDATE resumes SET {col} = {default} WHERE {col} IS NULL')
+            _rebuild_stats(conn)
+        invalidate_candidates_cache()
+
         return True, f'Database cleaned successfully. {original_count} records processed.'
     except Exception as e:
-        return False, str(e)
\ No newline at end of file
+        return False, str(e)
+
+
+def deduplicate_database():
+    try:
+        if not os.path.exists(DATABASE_FILE) and not os.path.exists(EXCEL_FILE):
+            return False, "No database found"
+
+        conn = _get_connection()
+        with _transaction(conn):
+            rows = conn.execute(f"SELECT ID, {', '.join(COLUMNS)} FROM resumes ORDER BY ID").fetchall()
+
+            kept = {}
+            owners = {}
+            merged_ids = set()
+            removed_ids = []
+            for resume_id, *row in rows:
+                target = next((owners[key] for key in _row_keys(row) if key in owners), None)
+                if target is None:
+                    kept[resume_id] = row
+                    target = resume_id
+                else:
+                    kept[target] = _merge_rows(kept[target], row)
+                    merged_ids.add(target)
+                    removed_ids.append(resume_id)
+                for key in _row_keys(kept[target]):
+                    owners[key] = target
+
+            if removed_ids:
+                assignments = ', '.join(f'{col} = ?' for col in COLUMNS)
+                conn.executemany(
+                    f'UPDATE resumes SET {assignments} WHERE ID = ?',
+                    [kept[resume_id] + [resume_id] for resume_id in merged_ids]
+                )
+                conn.executemany('DELETE FROM resumes WHERE ID = ?', [(resume_id,) for resume_id in removed_ids])
+                _rebuild_candidate_keys(conn)
+                _rebuild_stats(conn)
+
+        if removed_ids:
+            invalidate_candidates_cache()
+            for resume_id in removed_ids:
+                remove_candidate(resume_id)
+            for resume_id in merged_ids:
+                index_candidate(resume_id, dict(zip(COLUMNS, kept[resume_id])))
+
+        print(f"✅ Deduplicated database: {len(removed_ids)} duplicate records merged")
+        return True, f'Database deduplicated successfully. {len(removed_ids)} duplicate records merged, {len(kept)} candidates remain.'
+    except Exception as e:
+        return False, str(e)
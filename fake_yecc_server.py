@@ -0,0 +1,163 @@
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+
+REFERENCE_LISTS = {
+    "resumeCountry": ["India", "United States", "United Kingdom", "United Arab Emirates", "Singapore"],
+    "resumeState": ["Gujarat", "Maharashtra", "Karnataka", "Telangana", "Tamil Nadu"],
+    "resumeCity": ["Ahmedabad", "Mumbai", "Pune", "Bangalore", "Hyderabad", "Chennai"],
+    "resumeDegree": ["Bachelor of Technology", "Bachelor of Commerce", "Master of Business Administration",
+                     "Chartered Accountant", "Master of Computer Applications"],
+    "resumeUniversity": ["Gujarat Technological University", "University of Mumbai", "Anna University",
+                         "Savitribai Phule Pune University"],
+    "resumeLanguages": ["English", "Hindi", "Gujarati", "Marathi"],
+    "resumeCompany": ["Infosys", "Tata Consultancy Services", "Wipro", "Accenture", "Deloitte", "Oracle"],
+    "resumePosition": ["Consultant", "Senior Consultant", "Functional Consultant", "Technical Consultant",
+                       "Solution Architect", "Project Manager"],
+    "resumeTrack": ["Financials", "Supply Chain Management", "Human Capital Management"],
+    "resumeProduct": ["Oracle Cloud ERP (Fusion)", "Oracle E-Business Suite", "SAP S/4HANA",
+                      "Microsoft Dynamics 365", "NetSuite", "Workday"],
+    "resumeModules": ["General Ledger (GL)", "Accounts Payable (AP)", "Accounts Receivable (AR)",
+                      "Fixed Assets (FA)", "Cash Management (CM)", "Inventory Management (INV)",
+                      "Purchasing (PO)", "Order Management (OM)", "Core HR", "Payroll", "Absence Management",
+                      "Benefits", "Recruiting", "Oracle Time and Labor (OTL)"],
+    "resumeDomain": ["Manufacturing", "Retail", "Banking", "Healthcare", "Telecom", "ERP Implementation"],
+    "resumeRole": ["Functional Consultant", "Technical Consultant", "Solution Architect", "Team Lead",
+                   "Project Manager"]
+}
+
+_stats_lock = threading.Lock()
+_stats = {'requests': 0, 'errors': 0, 'by_route': {}}
+_settings = {'latency_ms': 0.0, 'jitter_ms': 0.0, 'error_rate': 0.0}
+_next_user = {'id': 1000}
+
+
+def _route_name(method, path):
+    parts = path.strip('/').split('/')
+    if parts[0] == 'ResumeBuilder' and len(parts) > 2:
+        return f"{method} /ResumeBuilder/{parts[1]}"
+    if parts[0] == 'ResumeBuilder':
+        return f"{method} /ResumeBuilder/<url>"
+    return f"{method} /{parts[0]}"
+
+
+def get_server_stats():
+    with _stats_lock:
+        return {'requests': _stats['requests'], 'errors': _stats['errors'], 'by_route': dict(_stats['by_route'])}
+
+
+def reset_server_stats():
+    with _stats_lock:
+        _stats.update({'requests': 0, 'errors': 0, 'by_route': {}})
+
+
+class FakeYeccHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body):
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return json.loads(self.rfile.read(length) or b'null') if length else None
+
+    def _handle(self, method):
+        body = self._read_body()
+        path = self.path.split('?')[0]
+
+        if path == '/__stats':
+            return self._send(200, get_server_stats())
+        if path == '/__reset':
+            reset_server_stats()
+            return self._send(200, {'success': True})
+
+        route = _route_name(method, path)
+        delay = _settings['latency_ms'] + random.uniform(-1, 1) * _settings['jitter_ms']
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+        failed = random.random() < _settings['error_rate']
+        with _stats_lock:
+            _stats['requests'] += 1
+            _stats['errors'] += int(failed)
+            _stats['by_route'][route] = _stats['by_route'].get(route, 0) + 1
+
+        if failed:
+            return self._send(500, {'success': False, 'message': 'Injected error'})
+
+        parts = path.strip('/').split('/')
+        if method == 'GET' and parts[0] in REFERENCE_LISTS:
+            items = [{'ID': i + 1, 'Title': title} for i, title in enumerate(REFERENCE_LISTS[parts[0]])]
+            return self._send(200, {'success': True, 'data': items})
+
+        if method == 'POST' and path == '/users':
+            with _stats_lock:
+                _next_user['id'] += 1
+                user_id = _next_user['id']
+            return self._send(200, {'success': True, 'data': {'UserID': user_id, 'token': f'fake-token-{user_id}'}})
+
+        if method == 'POST' and parts[:2] == ['ResumeBuilder', 'generateResumeUrl'] and len(parts) == 3:
+            return self._send(200, {'success': True, 'data': f'resume-{parts[2]}'})
+
+        if method == 'GET' and parts[0] == 'ResumeBuilder' and len(parts) == 2:
+            return self._send(200, {'success': True, 'data': {'ResumeURL': parts[1]}})
+
+        if method == 'PUT' and parts[0] == 'ResumeBuilder' and len(parts) == 3:
+            return self._send(200, {'success': True, 'data': {'section': parts[1], 'entries': len(body or [])}})
+
+        return self._send(404, {'success': False, 'message': f'Unknown endpoint {method} {path}'})
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def do_PUT(self):
+        self._handle('PUT')
+
+
+def start_fake_server(port=0, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0):
+    _settings.update({'latency_ms': latency_ms, 'jitter_ms': jitter_ms, 'error_rate': error_rate})
+    server = ThreadingHTTPServer(('127.0.0.1', port), FakeYeccHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='fake-yecc', daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local stand-in for the YECC API used by yecc_sync.py')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=50, help='Mean latency per request in ms')
+    parser.add_argument('--jitter', type=float, default=10, help='Latency jitter (+/-) in ms')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with HTTP 500')
+    args = parser.parse_args()
+
+    server = start_fake_server(args.port, args.latency, args.jitter, args.error_rate)
+    print("\n" + "="*60)
+    print(f"🧪 Fake YECC API listening on http://127.0.0.1:{server.server_address[1]}")
+    print(f"   Latency: {args.latency}±{args.jitter} ms, error rate: {args.error_rate:.0%}")
+    print(f"   Run the app with YECC_BASE_URL=http://127.0.0.1:{server.server_address[1]}")
+    print("="*60 + "\n")
+
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,248 @@
+import os
+import shutil
+import zipfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from werkzeug.utils import secure_filename
+
+from config import MAX_CONTENT_LENGTH, BULK_EXTRACT_WORKERS, BULK_PARSE_CONCURRENCY
+from utils import allowed_file, extract_text_from_file
+from resume_parser import (
+    parse_resume_with_skyq, enhance_parsed_data, score_resume_completeness, pack_resume_batches, parse_resume_batch
+)
+from yecc_outbox import enqueue_yecc_sync, enqueue_yecc_syncs
+from rag_handler import upload_resume_to_docs
+from parse_cache import get_cached_parse, store_cached_parse
+from rule_parser import parse_resume_with_rules
+from database import save_to_excel, save_many_to_excel
+
+
+PREVIEW_FIELDS = ('name', 'email', 'phone', 'location', 'current_role', 'current_company')
+
+
+def _no_stage(stage, **fields):
+    pass
+
+
+def extract_resume_text(filepath, filename):
+    resume_text = extract_text_from_file(filepath)
+
+    print(f"📝 Extracted {len(resume_text)} characters from {filename}")
+
+    if len(resume_text) < 50:
+        raise Exception("File appears empty or corrupted")
+
+    return resume_text
+
+
+def process_resume_file(filepath, filename, on_stage=_no_stage):
+    try:
+        on_stage('extracting')
+        try:
+            resume_text = extract_resume_text(filepath, filename)
+        except Exception as e:
+            raise Exception(f'Text extraction failed: {str(e)}')
+
+        return process_resume_text(resume_text, filename, on_stage)
+    finally:
+        if os.path.exists(filepath):
+            os.remove(filepath)
+
+
+def process_resume_text(resume_text, filename, on_stage=_no_stage):
+    parsed_data = parse_resume_text(resume_text, filename, on_stage)
+
+    on_stage('saving')
+    try:
+        resume_id = save_to_excel(parsed_data)
+    except Exception as e:
+        raise Exception(f'Database save failed: {str(e)}')
+
+    on_stage('syncing')
+    try:
+        enqueue_yecc_sync(resume_id, parsed_data)
+        parsed_data['_yecc_sync'] = 'queued'
+    except Exception as e:
+        print(f"⚠️ Could not queue YECC sync: {str(e)}")
+
+    return parsed_data
+
+
+def parse_resume_text(resume_text, filename, on_stage=_no_stage):
+    try:
+        on_stage('parsing')
+        parsed_data = get_cached_parse(resume_text)
+        if parsed_data is None:
+            parsed_data = parse_resume_with_rules(resume_text)
+        if parsed_data is None:
+            preview = {}
+
+            def on_field(key, value):
+                if key in PREVIEW_FIELDS and value and isinstance(value, str):
+                    preview[key] = value
+                    on_stage('parsing', preview=dict(preview))
+
+            parsed_data = parse_resume_with_skyq(resume_text, filename, on_field=on_field)
+
+            if not parsed_data:
+                raise Exception('No data returned from AI')
+
+            store_cached_parse(resume_text, parsed_data)
+
+    except Exception as e:
+        raise Exception(f'AI parsing failed: {str(e)}')
+
+    return finish_parsed_resume(parsed_data, resume_text, filename, on_stage)
+
+
+def finish_parsed_resume(parsed_data, resume_text, filename, on_stage=_no_stage):
+    try:
+        parsed_data = enhance_parsed_data(parsed_data, resume_text)
+        print("✅ Data enhanced with post-processing")
+
+        completeness_score = score_resume_completeness(parsed_data)
+        print(f"📊 Resume completeness: {completeness_score}%")
+        parsed_data['_completeness_score'] = completeness_score
+
+    except Exception as e:
+        raise Exception(f'AI parsing failed: {str(e)}')
+
+    on_stage('indexing')
+    upload_resume_to_docs(resume_text, filename, parsed_data)
+
+    return parsed_data
+
+
+def collect_resume_files(paths, work_dir):
+    files = []
+    os.makedirs(work_dir, exist_ok=True)
+
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files.extend(collect_resume_files([os.path.join(root, name) for name in sorted(names)], work_dir))
+        elif path.lower().endswith('.zip'):
+            files.extend(_extract_zip(path, work_dir))
+        elif allowed_file(path):
+            files.append((path, os.path.basename(path)))
+        else:
+            print(f"⚠️ Skipping unsupported file: {path}")
+
+    return files
+
+
+def _extract_zip(zip_path, work_dir):
+    files = []
+    with zipfile.ZipFile(zip_path) as archive:
+        for number, info in enumerate(archive.infolist()):
+            if info.is_dir():
+                continue
+
+            filename = secure_filename(os.path.basename(info.filename))
+            if not filename or not allowed_file(filename):
+                print(f"⚠️ Skipping unsupported archive entry: {info.filename}")
+                continue
+            if info.file_size > MAX_CONTENT_LENGTH:
+                print(f"⚠️ Skipping oversized archive entry: {info.filename}")
+                continue
+
+            target = os.path.join(work_dir, f"{number}_{filename}")
+            with archive.open(info) as source, open(target, 'wb') as dest:
+                shutil.copyfileobj(source, dest)
+            files.append((target, filename))
+
+    print(f"📦 Extracted {len(files)} resumes from {os.path.basename(zip_path)}")
+    return files
+
+
+def process_resume_batch(files, on_stage=_no_stage, cleanup_dir=None):
+    summary = {'total': len(files), 'saved': 0, 'failed': [], 'candidates': []}
+
+    try:
+        on_stage(f'extracting 0/{len(files)}')
+        texts = []
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=BULK_EXTRACT_WORKERS, mp_context=context) as pool:
+            futures = [(pool.submit(extract_text_from_file, filepath), filename) for filepath, filename in files]
+            for done, (future, filename) in enumerate(futures, start=1):
+                try:
+                    resume_text = future.result()
+                    if len(resume_text) < 50:
+                        raise Exception("File appears empty or corrupted")
+                    texts.append((resume_text, filename))
+                except Exception as e:
+                    summary['failed'].append({'file': filename, 'error': f'Text extraction failed: {str(e)}'})
+                on_stage(f'extracting {done}/{len(files)}')
+
+        print(f"📝 Extracted text from {len(texts)}/{len(files)} resumes")
+
+        on_stage(f'parsing 0/{len(texts)}')
+        parsed_results = {}
+        pending = []
+        for number, (resume_text, filename) in enumerate(texts):
+            parsed_data = get_cached_parse(resume_text)
+            if parsed_data is None:
+                parsed_data = parse_resume_with_rules(resume_text)
+            if parsed_data is not None:
+                parsed_results[number] = parsed_data
+            else:
+                pending.append((number, resume_text))
+
+        done = len(parsed_results)
+        batches = pack_resume_batches(pending)
+        print(f"🤖 Parsing {len(pending)} resumes in {len(batches)} batches ({done} from cache or rule-based parsing)")
+        with ThreadPoolExecutor(max_workers=BULK_PARSE_CONCURRENCY, thread_name_prefix='bulk-parse') as pool:
+            for results, errors in pool.map(parse_resume_batch, batches):
+                for number, parsed_data in results.items():
+                    store_cached_parse(texts[number][0], parsed_data)
+                    parsed_results[number] = parsed_data
+                for number, error in errors.items():
+                    summary['failed'].append({'file': texts[number][1], 'error': f'AI parsing failed: {error}'})
+                done += len(results) + len(errors)
+                on_stage(f'parsing {done}/{len(texts)}')
+
+        parsed_list = []
+        for number in sorted(parsed_results):
+            resume_text, filename = texts[number]
+            try:
+                parsed_list.append(finish_parsed_resume(parsed_results[number], resume_text, filename))
+            except Exception as e:
+                summary['failed'].append({'file': filename, 'error': str(e)})
+
+        on_stage('saving')
+        try:
+            row_ids = save_many_to_excel(parsed_list)
+        except Exception as e:
+            raise Exception(f'Database save failed: {str(e)}')
+
+        on_stage('syncing')
+        try:
+            enqueue_yecc_syncs(list(dict(zip(row_ids, parsed_list)).items()))
+        except Exception as e:
+            print(f"⚠️ Could not queue YECC syncs: {str(e)}")
+
+        summary['saved'] = len(parsed_list)
+        summary['candidates'] = [
+            {'name': parsed_data.get('name', ''), 'email': parsed_data.get('email', '')}
+            for parsed_data in parsed_list
+        ]
+        print(f"✅ Bulk ingest: {summary['saved']} saved, {len(summary['failed'])} failed")
+        return summary
+    finally:
+        if cleanup_dir and os.path.exists(cleanup_dir):
+            shutil.rmtree(cleanup_dir, ignore_errors=True)
+
+
+def process_resume_paths(paths, work_dir, on_stage=_no_stage):
+    on_stage('collecting')
+    try:
+        files = collect_resume_files(paths, work_dir)
+    except Exception:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        raise
+
+    if not files:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        raise Exception('No supported resume files found')
+
+    return process_resume_batch(files, on_stage, cleanup_dir=work_dir)
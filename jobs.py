@@ -0,0 +1,75 @@
+import time
+import uuid
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from config import INGEST_WORKERS, JOB_RETENTION_LIMIT
+
+
+_executor = ThreadPoolExecutor(max_workers=INGEST_WORKERS, thread_name_prefix='ingest')
+_lock = threading.Lock()
+_jobs = OrderedDict()
+
+
+def submit_job(func, *args, description=''):
+    job_id = uuid.uuid4().hex
+    now = time.time()
+    job = {
+        'id': job_id,
+        'description': description,
+        'status': 'queued',
+        'stage': 'queued',
+        'preview': {},
+        'created': now,
+        'updated': now,
+        'result': None,
+        'error': None
+    }
+
+    with _lock:
+        _jobs[job_id] = job
+        _prune_jobs()
+
+    _executor.submit(_run_job, job_id, func, args)
+    print(f"📥 Job {job_id} queued: {description}")
+    return job_id
+
+
+def _prune_jobs():
+    finished = [job_id for job_id, job in _jobs.items() if job['status'] in ('completed', 'failed')]
+    while len(_jobs) > JOB_RETENTION_LIMIT and finished:
+        del _jobs[finished.pop(0)]
+
+
+def _update_job(job_id, **fields):
+    with _lock:
+        job = _jobs.get(job_id)
+        if job is not None:
+            job.update(fields)
+            job['updated'] = time.time()
+
+
+def _run_job(job_id, func, args):
+    _update_job(job_id, status='running', stage='started')
+    try:
+        result = func(*args, on_stage=lambda stage, **fields: _update_job(job_id, stage=stage, **fields))
+        _update_job(job_id, status='completed', stage='done', result=result)
+        print(f"✅ Job {job_id} completed")
+    except Exception as e:
+        print(f"❌ Job {job_id} failed: {str(e)}")
+        _update_job(job_id, status='failed', error=str(e))
+
+
+def get_job(job_id):
+    with _lock:
+        job = _jobs.get(job_id)
+        return dict(job) if job is not None else None
+
+
+def get_job_stats():
+    with _lock:
+        stats = {'queued': 0, 'running': 0, 'completed': 0, 'failed': 0}
+        for job in _jobs.values():
+            stats[job['status']] += 1
+        stats['workers'] = INGEST_WORKERS
+        return stats
@@ -0,0 +1,223 @@
+import re
+import math
+import threading
+import numpy as np
+
+
+INDEXED_FIELDS = ['Name', 'Current_Role', 'ERP_Systems', 'ERP_Modules', 'Technical_Skills', 'Location']
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9+#]+')
+NUMBER_PATTERN = re.compile(r'^\d+\+?$')
+QUERY_STOPWORDS = {
+    'a', 'an', 'and', 'the', 'with', 'in', 'of', 'for', 'or', 'to', 'on', 'at', 'who', 'has',
+    'having', 'year', 'years', 'yrs', 'yr', 'experience', 'exp', 'plus'
+}
+
+_lock = threading.Lock()
+_index = {}
+
+
+def _reset_index():
+    _index.update({
+        'postings': {},
+        'term_arrays': {},
+        'doc_ids': [],
+        'doc_positions': {},
+        'doc_hashes': {},
+        'doc_lengths': [],
+        'lengths_array': np.zeros(0),
+        'total_length': 0,
+        'removed': set(),
+        'removed_array': np.zeros(0, dtype=bool),
+        'source': None
+    })
+
+
+_reset_index()
+
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall(str(text or '').lower())
+
+
+def parse_query(query):
+    terms = []
+    for token in tokenize(query):
+        if token in QUERY_STOPWORDS or NUMBER_PATTERN.match(token):
+            continue
+        if token not in terms:
+            terms.append(token)
+    return terms
+
+
+def _record_hash(values):
+    return hash(tuple(str(value) for value in values))
+
+
+def _add_document(doc_id, record):
+    tokens = []
+    for field in INDEXED_FIELDS:
+        tokens.extend(tokenize(record.get(field, '')))
+
+    pos = len(_index['doc_ids'])
+    _index['doc_ids'].append(doc_id)
+    _index['doc_positions'][doc_id] = pos
+    _index['doc_hashes'][doc_id] = _record_hash(record.get(field, '') for field in INDEXED_FIELDS)
+    _index['doc_lengths'].append(len(tokens))
+    _index['total_length'] += len(tokens)
+
+    term_counts = {}
+    for token in tokens:
+        term_counts[token] = term_counts.get(token, 0) + 1
+
+    postings = _index['postings']
+    for term, tf in term_counts.items():
+        positions, tfs = postings.setdefault(term, ([], []))
+        positions.append(pos)
+        tfs.append(tf)
+
+
+def _term_arrays(term):
+    positions, tfs = _index['postings'][term]
+    cached = _index['term_arrays'].get(term)
+    if cached is None or len(cached[0]) != len(positions):
+        cached = (np.array(positions, dtype=np.int64), np.array(tfs, dtype=np.float64))
+        _index['term_arrays'][term] = cached
+    return cached
+
+
+def _lengths_array():
+    if len(_index['lengths_array']) != len(_index['doc_lengths']):
+        _index['lengths_array'] = np.array(_index['doc_lengths'], dtype=np.float64)
+    return _index['lengths_array']
+
+
+def _remove_document(doc_id):
+    pos = _index['doc_positions'].pop(doc_id, None)
+    _index['doc_hashes'].pop(doc_id, None)
+    if pos is None:
+        return
+    _index['removed'].add(pos)
+    _index['total_length'] -= _index['doc_lengths'][pos]
+
+
+def _removed_array():
+    removed = _index['removed_array']
+    if len(removed) != len(_index['doc_ids']) or int(removed.sum()) != len(_index['removed']):
+        removed = np.zeros(len(_index['doc_ids']), dtype=bool)
+        removed[list(_index['removed'])] = True
+        _index['removed_array'] = removed
+    return removed
+
+
+def _compact_index():
+    removed = _index['removed']
+    keep = [pos for pos in range(len(_index['doc_ids'])) if pos not in removed]
+    new_positions = {pos: i for i, pos in enumerate(keep)}
+
+    postings = {}
+    for term, (positions, tfs) in _index['postings'].items():
+        live = [(new_positions[pos], tf) for pos, tf in zip(positions, tfs) if pos not in removed]
+        if live:
+            postings[term] = ([pos for pos, _ in live], [tf for _, tf in live])
+
+    _index.update({
+        'postings': postings,
+        'term_arrays': {},
+        'doc_ids': [_index['doc_ids'][pos] for pos in keep],
+        'doc_positions': {doc_id: new_positions[pos] for doc_id, pos in _index['doc_positions'].items()},
+        'doc_lengths': [_index['doc_lengths'][pos] for pos in keep],
+        'lengths_array': np.zeros(0),
+        'removed': set(),
+        'removed_array': np.zeros(0, dtype=bool)
+    })
+
+
+def _compact_if_needed():
+    if len(_index['removed']) > len(_index['doc_ids']) // 2:
+        _compact_index()
+
+
+def index_candidate(doc_id, record):
+    with _lock:
+        _remove_document(doc_id)
+        _add_document(doc_id, record)
+        _compact_if_needed()
+
+
+def remove_candidate(doc_id):
+    with _lock:
+        _remove_document(doc_id)
+        _compact_if_needed()
+
+
+def sync_keyword_index(df):
+    if _index['source'] is df:
+        return
+
+    with _lock:
+        if _index['source'] is df:
+            return
+
+        ids = [int(doc_id) for doc_id in df['ID']]
+        hashes = [_record_hash(values) for values in zip(*(df[field] for field in INDEXED_FIELDS))]
+        doc_hashes = _index['doc_hashes']
+        if sum(doc_id in doc_hashes for doc_id in ids) != len(doc_hashes):
+            _reset_index()
+            doc_hashes = _index['doc_hashes']
+
+        stale = [i for i, (doc_id, row_hash) in enumerate(zip(ids, hashes)) if doc_hashes.get(doc_id) != row_hash]
+        changed = sum(ids[i] in doc_hashes for i in stale)
+        for record in df.iloc[stale][['ID'] + INDEXED_FIELDS].to_dict('records'):
+            _remove_document(int(record['ID']))
+            _add_document(int(record['ID']), record)
+        _compact_if_needed()
+
+        _index['source'] = df
+        if stale:
+            print(f"📇 Keyword index: added {len(stale) - changed}, re-indexed {changed} changed candidates "
+                  f"({len(_index['doc_positions'])} indexed)")
+
+
+def search_keyword_index(query, mode='and', limit=None):
+    terms = parse_query(query)
+    if not terms:
+        return []
+
+    with _lock:
+        doc_count = len(_index['doc_positions'])
+        if not doc_count:
+            return []
+
+        matched_terms = [term for term in terms if term in _index['postings']]
+        if not matched_terms or (mode == 'and' and len(matched_terms) < len(terms)):
+            return []
+
+        lengths = _lengths_array()
+        avg_length = _index['total_length'] / doc_count or 1
+        scores = np.zeros(len(_index['doc_ids']))
+        term_hits = np.zeros(len(_index['doc_ids']), dtype=np.int32)
+
+        removed = _removed_array() if _index['removed'] else None
+        for term in matched_terms:
+            positions, tfs = _term_arrays(term)
+            live = len(positions) - (int(removed[positions].sum()) if removed is not None else 0)
+            idf = math.log(1 + (doc_count - live + 0.5) / (live + 0.5))
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[positions] / avg_length)
+            scores[positions] += idf * tfs * (BM25_K1 + 1) / (tfs + norm)
+            term_hits[positions] += 1
+
+        required = len(terms) if mode == 'and' else 1
+        if removed is not None:
+            term_hits[removed] = 0
+        candidates = np.flatnonzero(term_hits >= required)
+        doc_ids = _index['doc_ids']
+
+    if limit and len(candidates) > limit:
+        candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+    candidates = candidates[np.argsort(-scores[candidates], kind='stable')]
+
+    return [(doc_ids[pos], float(scores[pos])) for pos in candidates]
@@ -0,0 +1,91 @@
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from config import PARSE_CACHE_FILE, PARSE_CACHE_SIZE
+from resume_parser import PROMPT_VERSION, MODEL_SIGNATURE
+
+
+_local = threading.local()
+_stats_lock = threading.Lock()
+_cache_stats = {'hits': 0, 'misses': 0}
+
+
+def _get_connection():
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect(PARSE_CACHE_FILE, timeout=30, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS parse_cache (Cache_Key TEXT PRIMARY KEY, Parsed_Data TEXT NOT NULL, '
+            'Created REAL NOT NULL, Last_Used REAL NOT NULL)'
+        )
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_parse_cache_last_used ON parse_cache (Last_Used)')
+        _local.conn = conn
+    return conn
+
+
+def parse_cache_key(resume_text):
+    payload = f"{PROMPT_VERSION}\n{MODEL_SIGNATURE}\n{resume_text}"
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def get_cached_parse(resume_text):
+    cache_key = parse_cache_key(resume_text)
+    try:
+        conn = _get_connection()
+        row = conn.execute('SELECT Parsed_Data FROM parse_cache WHERE Cache_Key = ?', (cache_key,)).fetchone()
+        if row is not None:
+            conn.execute('UPDATE parse_cache SET Last_Used = ? WHERE Cache_Key = ?', (time.time(), cache_key))
+    except Exception as e:
+        print(f"⚠️ Parse cache lookup failed: {str(e)}")
+        row = None
+
+    with _stats_lock:
+        _cache_stats['hits' if row is not None else 'misses'] += 1
+
+    if row is None:
+        return None
+
+    print(f"♻️ Parse cache hit ({cache_key[:12]})")
+    return json.loads(row[0])
+
+
+def store_cached_parse(resume_text, parsed_data):
+    cache_key = parse_cache_key(resume_text)
+    now = time.time()
+    try:
+        conn = _get_connection()
+        conn.execute(
+            'INSERT OR REPLACE INTO parse_cache (Cache_Key, Parsed_Data, Created, Last_Used) VALUES (?, ?, ?, ?)',
+            (cache_key, json.dumps(parsed_data), now, now)
+        )
+
+        overflow = conn.execute('SELECT COUNT(*) FROM parse_cache').fetchone()[0] - PARSE_CACHE_SIZE
+        if overflow > 0:
+            conn.execute(
+                'DELETE FROM parse_cache WHERE Cache_Key IN '
+                '(SELECT Cache_Key FROM parse_cache ORDER BY Last_Used LIMIT ?)',
+                (overflow,)
+            )
+    except Exception as e:
+        print(f"⚠️ Parse cache store failed: {str(e)}")
+
+
+def get_parse_cache_stats():
+    try:
+        size = _get_connection().execute('SELECT COUNT(*) FROM parse_cache').fetchone()[0]
+    except Exception as e:
+        print(f"⚠️ Parse cache size lookup failed: {str(e)}")
+        size = 0
+
+    with _stats_lock:
+        lookups = _cache_stats['hits'] + _cache_stats['misses']
+        return {
+            'hits': _cache_stats['hits'],
+            'misses': _cache_stats['misses'],
+            'hit_rate': round(_cache_stats['hits'] / lookups, 3) if lookups else 0,
+            'size': size
+        }
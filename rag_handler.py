@@ -1,6 +1,8 @@
 import os
+import hashlib
 from config import LOCAL_DOCS_DIR
 from utils import safe_join
+from vector_index import add_document
 
 
 def upload_resume_to_docs(resume_text, filename, parsed_data):
@@ -23,13 +25,22 @@ FULL RESUME TEXT:
 """
         
         os.makedirs(LOCAL_DOCS_DIR, exist_ok=True)
-        local_filename = f"resume_{filename.replace('.pdf', '').replace('.docx', '')}.txt"
+        content_hash = hashlib.sha1(resume_text.encode('utf-8')).hexdigest()[:10]
+        local_filename = f"resume_{filename.replace('.pdf', '').replace('.docx', '')}_{content_hash}.txt"
         local_path = os.path.join(LOCAL_DOCS_DIR, local_filename)
         
         with open(local_path, 'w', encoding='utf-8') as f:
             f.write(doc_content)
         
         print(f"✅ Document saved locally: {local_path}")
+        parsed_data['_rag_file_id'] = local_filename
+        
+        try:
+            add_document(local_filename, doc_content)
+            print(f"✅ Document embedded in vector index")
+        except Exception as e:
+            print(f"Warning: Could not add document to vector index: {e}")
+        
         return True
         
     except Exception as e:
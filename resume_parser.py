@@ -1,12 +1,46 @@
 import json
 import time
+import random
 import re
+import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 import google.generativeai as genai
-from config import GEMINI_API_KEY, GEMINI_MODEL
-from utils import clean_array, extract_email, extract_phone, extract_linkedin, extract_years_experience
+from google.api_core import exceptions as google_exceptions
+from config import (
+    LLM_BACKEND, GEMINI_API_KEY, GEMINI_MODEL, LOCAL_LLM_URL, LOCAL_LLM_API_KEY, LOCAL_LLM_TIMEOUT, MODEL_CONFIGS,
+    BATCH_PARSE_MAX_RESUMES, BATCH_PARSE_MAX_CHARS, BATCH_PARSE_MAX_OUTPUT_TOKENS,
+    MAX_TEXT_LENGTHS, CHUNK_PARSE_MAX_CHARS, CHUNK_PARSE_CONCURRENCY, PARSE_TRANSPORT_RETRIES, PARSE_RETRY_BASE_DELAY, PARSE_RETRY_MAX_DELAY
+)
+from utils import clean_array, extract_contact_info
+
+if LLM_BACKEND not in ('gemini', 'local'):
+    raise Exception(f"Unknown LLM_BACKEND '{LLM_BACKEND}' (expected 'gemini' or 'local')")
 
 genai.configure(api_key=GEMINI_API_KEY)
 
+PROMPT_VERSION = 3
+
+SECTION_HEADINGS = {
+    'summary', 'professional summary', 'profile', 'professional profile', 'career objective', 'objective',
+    'experience', 'work experience', 'professional experience', 'employment history', 'employment',
+    'career history', 'work history', 'organizational experience', 'projects', 'project experience',
+    'key projects', 'erp projects', 'projects worked on', 'implementation projects', 'support projects',
+    'education', 'educational qualifications', 'academic qualifications', 'qualifications', 'academics',
+    'skills', 'technical skills', 'key skills', 'core competencies', 'functional skills', 'erp skills',
+    'certifications', 'certificates', 'trainings', 'training and certifications', 'achievements', 'awards',
+    'languages', 'personal details', 'personal information', 'declaration'
+}
+HEADER_CONTEXT_LENGTH = 600
+THINK_PATTERN = re.compile(r'<think>.*?</think>|<thinking>.*?</thinking>', re.DOTALL)
+FENCE_PATTERN = re.compile(r'```(?:json)?\s*')
+BASIC_FIELDS = ('name', 'email', 'phone', 'erp_systems', 'job_experience')
+TRANSPORT_ERRORS = (
+    google_exceptions.ServiceUnavailable, google_exceptions.ResourceExhausted, google_exceptions.TooManyRequests,
+    google_exceptions.DeadlineExceeded, google_exceptions.InternalServerError, ConnectionError, TimeoutError,
+    requests.exceptions.ConnectionError, requests.exceptions.Timeout, requests.exceptions.ChunkedEncodingError
+)
+
 gemini_model = genai.GenerativeModel(
     model_name=GEMINI_MODEL,
     generation_config={
@@ -16,20 +50,28 @@ gemini_model = genai.GenerativeModel(
     }
 )
 
+batch_gemini_model = genai.GenerativeModel(
+    model_name=GEMINI_MODEL,
+    generation_config={
+        "temperature": 0.1,
+        "top_p": 0.9,
+        "max_output_tokens": BATCH_PARSE_MAX_OUTPUT_TOKENS,
+    }
+)
+
+ACTIVE_MODEL_CONFIGS = [{"model": GEMINI_MODEL}] if LLM_BACKEND == 'gemini' else MODEL_CONFIGS
+MODEL_SIGNATURE = GEMINI_MODEL if LLM_BACKEND == 'gemini' else f"local:{','.join(config['model'] for config in MODEL_CONFIGS)}"
+
+_local_session = requests.Session()
+_local_session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+_local_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
 def fix_json_string(json_str):
     if not json_str or not json_str.strip():
         return "{}"
     
-    json_str = re.sub(r'```json\s*', '', json_str)
-    json_str = re.sub(r'```\s*', '', json_str)
-    
-    json_str = re.sub(r'<think>.*?</think>', '', json_str, flags=re.DOTALL)
-    json_str = re.sub(r'<thinking>.*?</thinking>', '', json_str, flags=re.DOTALL)
-    
-    json_str = json_str.strip()
-    
-    if not json_str:
-        return "{}"
+    if '<think' in json_str:
+        json_str = THINK_PATTERN.sub('', json_str)
     
     start = json_str.find('{')
     end = json_str.rfind('}')
@@ -39,8 +81,150 @@ def fix_json_string(json_str):
     
     json_str = json_str[start:end+1]
     
+    if '```' in json_str:
+        json_str = FENCE_PATTERN.sub('', json_str)
+    
     return json_str
 
+def new_json_stream(on_field=None):
+    return {
+        'buffer': '',
+        'pos': 0,
+        'start': None,
+        'end': None,
+        'stack': [],
+        'expect': [],
+        'in_string': False,
+        'escape': False,
+        'string_start': None,
+        'primitive_start': None,
+        'key': None,
+        'value_start': None,
+        'safe': None,
+        'safe_stack': None,
+        'fields': {},
+        'repaired': False,
+        'on_field': on_field
+    }
+
+def _json_value_done(state, end):
+    stack = state['stack']
+    state['expect'][-1] = 'after'
+    state['safe'] = end
+    state['safe_stack'] = list(stack)
+    
+    if len(stack) == 1 and state['value_start'] is not None:
+        try:
+            value = json.loads(state['buffer'][state['value_start']:end])
+            state['fields'][state['key']] = value
+            if state['on_field']:
+                state['on_field'](state['key'], value)
+        except Exception:
+            pass
+        state['value_start'] = None
+
+def feed_json_stream(state, text):
+    state['buffer'] += text
+    buffer = state['buffer']
+    stack = state['stack']
+    expect = state['expect']
+    
+    i = state['pos']
+    while i < len(buffer) and state['end'] is None:
+        c = buffer[i]
+        
+        if state['start'] is None:
+            if c == '{':
+                state['start'] = i
+                stack.append('{')
+                expect.append('key')
+                state['safe'] = i + 1
+                state['safe_stack'] = ['{']
+            i += 1
+            continue
+        
+        if state['in_string']:
+            if state['escape']:
+                state['escape'] = False
+            elif c == '\\':
+                state['escape'] = True
+            elif c == '"':
+                state['in_string'] = False
+                if stack[-1] == '{' and expect[-1] == 'key':
+                    if len(stack) == 1:
+                        state['key'] = json.loads(buffer[state['string_start']:i + 1])
+                    expect[-1] = 'colon'
+                else:
+                    _json_value_done(state, i + 1)
+            i += 1
+            continue
+        
+        if state['primitive_start'] is not None:
+            if c not in ',}] \t\r\n':
+                i += 1
+                continue
+            state['primitive_start'] = None
+            _json_value_done(state, i)
+        
+        if c == '"':
+            state['in_string'] = True
+            state['string_start'] = i
+            if len(stack) == 1 and expect[-1] == 'value':
+                state['value_start'] = i
+        elif c in '{[':
+            if len(stack) == 1 and expect[-1] == 'value':
+                state['value_start'] = i
+            stack.append(c)
+            expect.append('key' if c == '{' else 'value')
+            state['safe'] = i + 1
+            state['safe_stack'] = list(stack)
+        elif c in '}]':
+            stack.pop()
+            expect.pop()
+            if stack:
+                _json_value_done(state, i + 1)
+            else:
+                state['end'] = i + 1
+        elif c == ':':
+            expect[-1] = 'value'
+        elif c == ',':
+            expect[-1] = 'key' if stack[-1] == '{' else 'value'
+        elif not c.isspace():
+            state['primitive_start'] = i
+            if len(stack) == 1 and expect[-1] == 'value':
+                state['value_start'] = i
+        i += 1
+    
+    state['pos'] = i
+    return state['fields']
+
+def finish_json_stream(state):
+    buffer = state['buffer']
+    if state['start'] is None:
+        raise json.JSONDecodeError("No JSON object found", buffer, 0)
+    
+    if state['end'] is not None:
+        return json.loads(buffer[state['start']:state['end']])
+    
+    if state['primitive_start'] is not None and not state['in_string']:
+        try:
+            json.loads(buffer[state['primitive_start']:])
+            state['primitive_start'] = None
+            _json_value_done(state, len(buffer))
+        except json.JSONDecodeError:
+            pass
+    
+    repaired = buffer[state['start']:state['safe']].rstrip().rstrip(',')
+    closers = ''.join('}' if opener == '{' else ']' for opener in reversed(state['safe_stack']))
+    state['repaired'] = True
+    print(f"      ⚠️  Repaired truncated JSON ({state['safe'] - state['start']}/{len(buffer) - state['start']} chars kept)")
+    return json.loads(repaired + closers)
+
+def repair_json(content):
+    state = new_json_stream()
+    feed_json_stream(state, content)
+    return finish_json_stream(state)
+
 def safe_json_parse(content, max_attempts=4):
     
     if not content or not content.strip():
@@ -75,16 +259,7 @@ def safe_json_parse(content, max_attempts=4):
                 return json.loads(fixed)
             
             else:
-                fixed = fix_json_string(content)
-                for i in range(len(fixed), 100, -100):
-                    try:
-                        test = fixed[:i].rstrip()
-                        if test.endswith('}'):
-                            result = json.loads(test)
-                            print(f"      ⚠️  Recovered partial JSON ({i}/{len(fixed)} chars)")
-                            return result
-                    except:
-                        continue
+                return repair_json(THINK_PATTERN.sub('', content))
                         
         except json.JSONDecodeError as e:
             if attempt == max_attempts - 1:
@@ -104,10 +279,7 @@ def safe_json_parse(content, max_attempts=4):
     
     raise json.JSONDecodeError("Could not parse JSON after all attempts", content, 0)
 
-def create_original_prompt(resume_text):
-    
-    return f"""Extract information from this ERP Consultant resume. Return ONLY valid JSON (no markdown, no explanations, no thinking process).
-{{
+EXTRACTION_RULES = """{
   "name": "",
   "email": "",
   "phone": "",
@@ -122,14 +294,14 @@ def create_original_prompt(resume_text):
   "technical_skills": [],
   "certifications": [],
   "education": [
-    {{
+    {
       "degree": "",
       "university": "",
       "year": ""
-    }}
+    }
   ],
   "job_experience": [
-    {{
+    {
       "position": "",
       "country": "",
       "company_name": "",
@@ -138,10 +310,10 @@ def create_original_prompt(resume_text):
       "from_date": "",
       "to_date": "",
       "short_description": ""
-    }}
+    }
   ],
   "erp_projects_experience": [
-    {{
+    {
       "company_name": "",
       "project_name": "",
       "project_domain": "",
@@ -157,9 +329,9 @@ def create_original_prompt(resume_text):
       "hcm_modules": [],
       "scm_modules": [],
       "role": ""
-    }}
+    }
   ]
-}}
+}
 
 EXTRACTION RULES (STRICT & ROBUST):
 A. GENERAL RULES
@@ -241,48 +413,194 @@ Extract ALL mentioned skills including:
 - Software tools (Microsoft Office, Tableau, Salesforce, etc.)
 - Soft skills related to consulting (Client Handling, Training, Communication, Documentation)
 
+"""
+
+RESPONSE_SCHEMA = json.loads(EXTRACTION_RULES.split('\n\nEXTRACTION RULES')[0])
+LIST_FIELDS = [key for key, value in RESPONSE_SCHEMA.items() if isinstance(value, list)]
+
+def create_original_prompt(resume_text):
+    
+    return f"""Extract information from this ERP Consultant resume. Return ONLY valid JSON (no markdown, no explanations, no thinking process).
+{EXTRACTION_RULES}Resume:
+{resume_text}
+
+Return ONLY the JSON object with no additional text:"""
+
+def create_section_prompt(resume_text, sections):
+    
+    schema = json.dumps({key: RESPONSE_SCHEMA[key] for key in sections}, indent=2)
+    return f"""Extract ONLY the following fields from this ERP Consultant resume. Return ONLY valid JSON with exactly these keys (no markdown, no explanations, no thinking process).
+{schema}
+
+If a field is not found, return "" or []. All values must come directly from the resume text; do not invent companies, roles, modules, or degrees.
+
 Resume:
 {resume_text}
 
 Return ONLY the JSON object with no additional text:"""
 
-def parse_resume_with_gemini(resume_text, candidate_name="Unknown", retry_count=0):
+def _with_backoff(func, *args):
+    for attempt in range(PARSE_TRANSPORT_RETRIES + 1):
+        try:
+            return func(*args)
+        except TRANSPORT_ERRORS as e:
+            if attempt >= PARSE_TRANSPORT_RETRIES:
+                raise
+            delay = min(PARSE_RETRY_BASE_DELAY * (2 ** attempt), PARSE_RETRY_MAX_DELAY) * random.uniform(0.5, 1.0)
+            print(f"   ⚠️  {type(e).__name__}: {str(e)[:100]}; retrying in {delay:.1f}s "
+                  f"(attempt {attempt + 2}/{PARSE_TRANSPORT_RETRIES + 1})")
+            time.sleep(delay)
+
+def _stream_response_text(response):
+    for chunk in response:
+        try:
+            text = chunk.text
+        except ValueError:
+            continue
+        if text:
+            yield text
+
+def _stream_local_text(prompt, model_config):
+    response = _local_session.post(
+        f"{LOCAL_LLM_URL.rstrip('/')}/chat/completions",
+        headers={"Authorization": f"Bearer {LOCAL_LLM_API_KEY}"},
+        json={
+            "model": model_config["model"],
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": model_config.get("temperature", 0.1),
+            "max_tokens": model_config.get("max_tokens", 1500),
+            "stream": True
+        },
+        stream=True,
+        timeout=LOCAL_LLM_TIMEOUT
+    )
+    with response:
+        if response.status_code == 429 or response.status_code >= 500:
+            raise ConnectionError(f"Local LLM returned HTTP {response.status_code}")
+        if response.status_code != 200:
+            raise Exception(f"Local LLM returned HTTP {response.status_code}: {response.text[:200]}")
+        
+        pending = ''
+        for line in response.iter_lines():
+            line = line.decode('utf-8').strip()
+            if not line.startswith('data:'):
+                continue
+            data = line[5:].strip()
+            if data == '[DONE]':
+                break
+            
+            choices = json.loads(data).get('choices') or [{}]
+            text = (choices[0].get('delta') or {}).get('content') or ''
+            if pending is None:
+                if text:
+                    yield text
+                continue
+            
+            pending += text
+            if pending.lstrip().startswith('<think>') or '<think>'.startswith(pending.lstrip()):
+                if '</think>' not in pending:
+                    continue
+                pending = pending.split('</think>', 1)[1]
+            if pending:
+                yield pending
+            pending = None
+
+def _stream_json(prompt, on_field=None, model_config=None):
+    if LLM_BACKEND == 'gemini':
+        texts = _stream_response_text(gemini_model.generate_content(prompt, stream=True))
+    else:
+        texts = _stream_local_text(prompt, model_config)
+    
+    stream = new_json_stream(on_field)
+    for text in texts:
+        feed_json_stream(stream, text)
+    return stream
+
+def _read_stream(stream):
+    content = stream['buffer'].strip()
+    if not content:
+        raise Exception("Empty response from the model - it returned no content")
+    
+    try:
+        parsed = finish_json_stream(stream)
+    except json.JSONDecodeError:
+        parsed = safe_json_parse(content)
+    
+    if not isinstance(parsed, dict):
+        raise Exception(f"Expected dict, got {type(parsed).__name__}")
+    return parsed
+
+def _has_basic_data(parsed):
+    return any(parsed.get(field) for field in BASIC_FIELDS)
+
+def _section_ok(key, value):
+    return value is not None and (not isinstance(RESPONSE_SCHEMA[key], list) or isinstance(value, list))
+
+def _missing_sections(parsed, stream=None):
+    truncated = stream is not None and stream['repaired']
+    missing = [key for key in RESPONSE_SCHEMA
+               if (truncated or key in parsed) and not _section_ok(key, parsed.get(key))]
+    
+    if truncated:
+        key = stream['key']
+        if key in RESPONSE_SCHEMA and key not in stream['fields'] and key not in missing:
+            missing.append(key)
+    
+    if not _has_basic_data(parsed):
+        missing.extend(field for field in BASIC_FIELDS if field not in missing)
+    
+    return missing
+
+def _reask_sections(resume_text, parsed, sections, model_config=None):
+    print(f"   🔁 Re-asking for {len(sections)} section(s): {', '.join(sections)}")
+    system_instruction = "You are a resume parser. Return ONLY valid JSON with no additional text, no markdown, no explanations."
+    prompt = f"{system_instruction}\n\n{create_section_prompt(resume_text, sections)}"
+    
+    try:
+        answer = _read_stream(_with_backoff(_stream_json, prompt, None, model_config))
+    except Exception as e:
+        print(f"   ⚠️  Section re-ask failed: {str(e)[:100]}")
+        return parsed
+    
+    for key in sections:
+        value = answer.get(key)
+        if _section_ok(key, value) and (value or not _section_ok(key, parsed.get(key))):
+            parsed[key] = value
+    return parsed
+
+def parse_resume_with_model(resume_text, candidate_name="Unknown", on_field=None, model_config=None):
+    model_config = model_config or ACTIVE_MODEL_CONFIGS[0]
     
     print(f"\n{'='*70}")
-    print(f"📄 Parsing Resume with Gemini")
+    print(f"📄 Parsing Resume with {'Gemini' if LLM_BACKEND == 'gemini' else 'local LLM'}")
     print(f"{'='*70}")
     print(f"Candidate: {candidate_name}")
     print(f"Resume length: {len(resume_text):,} characters")
-    print(f"Model: {GEMINI_MODEL}")
+    print(f"Model: {model_config['model']}")
     print(f"{'='*70}\n")
     
-    print(f"🤖 Sending full resume to Gemini...")
+    print(f"🤖 Sending full resume to {model_config['model']}...")
     
     prompt = create_original_prompt(resume_text)
     system_instruction = "You are a resume parser. Return ONLY valid JSON with no additional text, no markdown, no explanations."
     full_prompt = f"{system_instruction}\n\n{prompt}"
     
     try:
-        response = gemini_model.generate_content(full_prompt)
-        
-        if not response.text:
-            raise Exception("Empty response from Gemini API - model returned no content")
-        
-        content = response.text.strip()
-        parsed = safe_json_parse(content)
-        
-        if not isinstance(parsed, dict):
-            raise Exception(f"Expected dict, got {type(parsed).__name__}")
+        try:
+            stream = _with_backoff(_stream_json, full_prompt, on_field, model_config)
+            parsed = _read_stream(stream)
+        except TRANSPORT_ERRORS:
+            raise
+        except Exception as e:
+            print(f"   ⚠️  Unusable response ({str(e)[:100]}), asking once more")
+            stream = _with_backoff(_stream_json, full_prompt, on_field, model_config)
+            parsed = _read_stream(stream)
         
-        has_basic_data = any([
-            parsed.get('name'),
-            parsed.get('email'),
-            parsed.get('phone'),
-            parsed.get('erp_systems'),
-            parsed.get('job_experience')
-        ])
+        missing = _missing_sections(parsed, stream)
+        if missing:
+            parsed = _reask_sections(resume_text, parsed, missing, model_config)
         
-        if not has_basic_data:
+        if not _has_basic_data(parsed):
             raise Exception("Parsed JSON has no useful data - all fields empty")
         
         score = score_resume_completeness(parsed)
@@ -291,18 +609,210 @@ def parse_resume_with_gemini(resume_text, candidate_name="Unknown", retry_count=
         return parsed
         
     except Exception as e:
-        error_type = type(e).__name__
         error_msg = str(e)[:200]
         print(f"   ❌ Failed: {error_msg}\n")
+        raise Exception(f"{model_config['model']} parse failed. Error: {error_msg}")
+
+def parse_resume_with_llm(resume_text, candidate_name="Unknown", on_field=None):
+    errors = []
+    for number, model_config in enumerate(ACTIVE_MODEL_CONFIGS, start=1):
+        try:
+            return parse_resume_with_model(resume_text, candidate_name, on_field, model_config)
+        except Exception as e:
+            errors.append(str(e)[:200])
+            if number < len(ACTIVE_MODEL_CONFIGS):
+                print(f"⚠️  Falling back to {ACTIVE_MODEL_CONFIGS[number]['model']}")
+    
+    raise Exception(errors[-1] if len(errors) == 1 else f"All {len(errors)} models failed. Last error: {errors[-1]}")
+
+def _is_section_heading(line):
+    words = re.findall(r'[a-z]+', line.lower())
+    return 0 < len(words) <= 5 and len(line) <= 60 and ' '.join(words) in SECTION_HEADINGS
+
+def _split_long_section(section, max_length):
+    pieces = []
+    current = ''
+    for line in section.splitlines(keepends=True):
+        while len(line) > max_length:
+            if current:
+                pieces.append(current)
+                current = ''
+            pieces.append(line[:max_length])
+            line = line[max_length:]
+        if current and len(current) + len(line) > max_length:
+            pieces.append(current)
+            current = ''
+        current += line
+    if current.strip():
+        pieces.append(current)
+    return pieces
+
+def chunk_resume_text(resume_text, max_length=CHUNK_PARSE_MAX_CHARS):
+    if len(resume_text) <= max_length:
+        return [resume_text]
+    
+    sections = []
+    current = []
+    for line in resume_text.splitlines(keepends=True):
+        if current and _is_section_heading(line.strip()):
+            sections.append(''.join(current))
+            current = []
+        current.append(line)
+    sections.append(''.join(current))
+    
+    header = sections[0][:HEADER_CONTEXT_LENGTH].strip()
+    budget = max(max_length - len(header) - 2, max_length // 2)
+    
+    chunks = []
+    current = ''
+    for section in sections:
+        for piece in (_split_long_section(section, budget) if len(section) > budget else [section]):
+            if current and len(current) + len(piece) > budget:
+                chunks.append(current)
+                current = ''
+            current += piece
+    if current.strip():
+        chunks.append(current)
+    
+    return [chunk if chunk.startswith(header) else f"{header}\n\n{chunk}" for chunk in chunks]
+
+def _parse_chunk(chunk, candidate_name, on_field=None):
+    try:
+        return [parse_resume_with_llm(chunk, candidate_name, on_field=on_field)]
+    except Exception as e:
+        smaller = [length for length in MAX_TEXT_LENGTHS if length < len(chunk)]
+        if not smaller:
+            raise
+        print(f"⚠️  Chunk failed ({str(e)[:100]}), re-splitting at {smaller[0]} characters")
+        results = []
+        for sub_chunk in chunk_resume_text(chunk, smaller[0]):
+            results.extend(_parse_chunk(sub_chunk, candidate_name, on_field))
+            on_field = None
+        return results
+
+def parse_resume_chunked(resume_text, candidate_name="Unknown", on_field=None):
+    chunks = chunk_resume_text(resume_text)
+    if len(chunks) == 1:
+        return parse_resume_with_llm(resume_text, candidate_name, on_field=on_field)
+    
+    print(f"✂️  Splitting {len(resume_text):,}-character resume into {len(chunks)} chunks")
+    
+    results = []
+    errors = []
+    with ThreadPoolExecutor(max_workers=min(len(chunks), CHUNK_PARSE_CONCURRENCY), thread_name_prefix='chunk-parse') as pool:
+        futures = [
+            pool.submit(_parse_chunk, chunk, f"{candidate_name} (part {number}/{len(chunks)})",
+                        on_field if number == 1 else None)
+            for number, chunk in enumerate(chunks, start=1)
+        ]
+        for future in futures:
+            try:
+                results.extend(future.result())
+            except Exception as e:
+                errors.append(str(e)[:200])
+    
+    if not results:
+        raise Exception(f"All {len(chunks)} chunks failed. Error: {errors[0] if errors else 'unknown'}")
+    if errors:
+        print(f"⚠️  {len(errors)}/{len(chunks)} chunks failed; merging the rest")
+    
+    merged = merge_parsed_chunks(results)
+    print(f"✅ Merged {len(results)} chunk results\n")
+    return merged
+
+parse_resume_with_skyq = parse_resume_chunked
+
+def create_batch_prompt(resumes):
+    
+    resume_blocks = "\n\n".join(
+        f"<<<RESUME id={resume_id}>>>\n{resume_text}\n<<<END RESUME id={resume_id}>>>"
+        for resume_id, resume_text in resumes
+    )
+    
+    return f"""Extract information from each of the {len(resumes)} ERP Consultant resumes below. Each resume is delimited by <<<RESUME id=...>>> and <<<END RESUME id=...>>>; treat every resume independently and never mix data between them.
+Return ONLY a valid JSON array (no markdown, no explanations, no thinking process) with one element per resume, in the form {{"resume_id": "<id>", "data": <object>}}, where <object> follows this structure:
+{EXTRACTION_RULES}Resumes:
+{resume_blocks}
+
+Return ONLY the JSON array with no additional text:"""
+
+def pack_resume_batches(resumes):
+    batches = []
+    current = []
+    current_chars = 0
+    
+    for resume_id, resume_text in resumes:
+        if LLM_BACKEND != 'gemini' or len(resume_text) > min(BATCH_PARSE_MAX_CHARS, MAX_TEXT_LENGTHS[0]):
+            batches.append([(resume_id, resume_text)])
+            continue
         
-        if retry_count < 3:
-            print(f"⚠️  Retrying... (attempt {retry_count + 2}/4)\n")
-            time.sleep(2)
-            return parse_resume_with_gemini(resume_text, candidate_name, retry_count + 1)
+        if current and (len(current) >= BATCH_PARSE_MAX_RESUMES or current_chars + len(resume_text) > BATCH_PARSE_MAX_CHARS):
+            batches.append(current)
+            current = []
+            current_chars = 0
         
-        raise Exception(f"All attempts failed after {retry_count+1} tries. Error: {error_msg}")
+        current.append((resume_id, resume_text))
+        current_chars += len(resume_text)
+    
+    if current:
+        batches.append(current)
+    
+    return batches
+
+def _parse_batch_response(content):
+    content = FENCE_PATTERN.sub('', THINK_PATTERN.sub('', content or '')).strip()
+    start = content.find('[')
+    end = content.rfind(']')
+    if start == -1 or end <= start:
+        raise json.JSONDecodeError("No JSON array found", content, 0)
+    
+    items = json.loads(content[start:end+1])
+    results = {}
+    for item in items:
+        if isinstance(item, dict) and isinstance(item.get('data'), dict):
+            results[str(item.get('resume_id', ''))] = item['data']
+    return results
 
-parse_resume_with_skyq = parse_resume_with_gemini
+def parse_resume_batch(resumes):
+    
+    if len(resumes) == 1:
+        resume_id, resume_text = resumes[0]
+        try:
+            return {resume_id: parse_resume_chunked(resume_text, resume_id)}, {}
+        except Exception as e:
+            return {}, {resume_id: str(e)}
+    
+    print(f"🤖 Sending batch of {len(resumes)} resumes to Gemini ({sum(len(t) for _, t in resumes):,} characters)...")
+    
+    system_instruction = "You are a resume parser. Return ONLY valid JSON with no additional text, no markdown, no explanations."
+    full_prompt = f"{system_instruction}\n\n{create_batch_prompt(resumes)}"
+    
+    try:
+        response = _with_backoff(batch_gemini_model.generate_content, full_prompt)
+        parsed_items = _parse_batch_response(response.text)
+    except Exception as e:
+        middle = len(resumes) // 2
+        print(f"   ⚠️ Batch of {len(resumes)} failed ({str(e)[:100]}), splitting into {middle} + {len(resumes) - middle}")
+        first_results, first_errors = parse_resume_batch(resumes[:middle])
+        second_results, second_errors = parse_resume_batch(resumes[middle:])
+        return {**first_results, **second_results}, {**first_errors, **second_errors}
+    
+    results = {}
+    errors = {}
+    for resume_id, resume_text in resumes:
+        parsed = parsed_items.get(str(resume_id))
+        if parsed and _has_basic_data(parsed):
+            results[resume_id] = parsed
+            continue
+        
+        print(f"   ⚠️ No usable batch result for {resume_id}, parsing it on its own")
+        try:
+            results[resume_id] = parse_resume_with_llm(resume_text, resume_id)
+        except Exception as e:
+            errors[resume_id] = str(e)
+    
+    print(f"   ✅ Batch parsed: {len(results)} ok, {len(errors)} failed\n")
+    return results, errors
 
 def enhance_parsed_data(parsed_data, resume_text):
     
@@ -310,20 +820,16 @@ def enhance_parsed_data(parsed_data, resume_text):
         if field in parsed_data:
             parsed_data[field] = clean_array(parsed_data[field])
     
-    if not parsed_data.get('email'):
-        email = extract_email(resume_text)
-        if email:
-            parsed_data['email'] = email
+    contact = extract_contact_info(resume_text)
     
-    if not parsed_data.get('phone'):
-        phone = extract_phone(resume_text)
-        if phone:
-            parsed_data['phone'] = phone
+    if not parsed_data.get('email') and contact['email']:
+        parsed_data['email'] = contact['email']
     
-    if not parsed_data.get('linkedin'):
-        linkedin = extract_linkedin(resume_text)
-        if linkedin:
-            parsed_data['linkedin'] = linkedin
+    if not parsed_data.get('phone') and contact['phone']:
+        parsed_data['phone'] = contact['phone']
+    
+    if not parsed_data.get('linkedin') and contact['linkedin']:
+        parsed_data['linkedin'] = contact['linkedin']
     
     erp_mappings = {
         'D365': 'Microsoft Dynamics 365',
@@ -343,10 +849,8 @@ def enhance_parsed_data(parsed_data, resume_text):
             normalized_erp.append(normalized)
     parsed_data['erp_systems'] = normalized_erp
     
-    if not parsed_data.get('total_years_experience'):
-        years = extract_years_experience(resume_text)
-        if years:
-            parsed_data['total_years_experience'] = str(years)
+    if not parsed_data.get('total_years_experience') and contact['years_experience']:
+        parsed_data['total_years_experience'] = str(contact['years_experience'])
     
     for field in ['technical_skills', 'certifications', 'erp_systems', 'erp_modules']:
         if not parsed_data.get(field):
@@ -399,9 +903,17 @@ def deduplicate_items(items, key_fields):
     
     return unique
 
+def _normalize_list_fields(result):
+    result = dict(result)
+    for key in LIST_FIELDS:
+        if not isinstance(result.get(key), list):
+            result[key] = []
+    return result
+
 def merge_parsed_chunks(chunks_results):
     if not chunks_results:
         return {}
+    chunks_results = [_normalize_list_fields(result) for result in chunks_results]
     if len(chunks_results) == 1:
         return chunks_results[0]
     
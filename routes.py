@@ -1,14 +1,17 @@
 import os
-from flask import render_template, request, jsonify, send_file
+import json
+import uuid
+from flask import render_template, request, jsonify, send_file, Response, stream_with_context
 from werkzeug.utils import secure_filename
 
-from config import UPLOAD_FOLDER, EXCEL_FILE
-from utils import allowed_file, extract_text_from_pdf, extract_text_from_docx
-from resume_parser import parse_resume_with_skyq, enhance_parsed_data, score_resume_completeness
-from yecc_sync import sync_to_yecc_api
-from rag_handler import upload_resume_to_docs
-from database import save_to_excel, get_resume_count, clean_database
-from search import search_with_rag
+from config import UPLOAD_FOLDER, SEARCH_RESULT_COLUMNS, SEARCH_PAGE_SIZE, SEARCH_MAX_PAGE_SIZE
+from utils import allowed_file
+from ingest import process_resume_file, process_resume_paths
+from jobs import submit_job, get_job, get_job_stats
+from database import get_database_stats, clean_database, deduplicate_database, export_to_excel
+from parse_cache import get_parse_cache_stats
+from yecc_outbox import get_outbox_stats, retry_failed_syncs
+from search import create_search_session, get_search_session, get_results_page, iter_results, get_search_cache_stats
 
 
 def register_routes(app):
@@ -23,7 +26,7 @@ def register_routes(app):
     
     @app.route('/search')
     def search_page():
-        return render_template('Search.html')
+        return render_template('Search.html', page_size=SEARCH_PAGE_SIZE)
     
     @app.route('/upload', methods=['POST'])
     def upload_resume():
@@ -39,85 +42,136 @@ def register_routes(app):
                 return jsonify({'success': False, 'error': 'Invalid file type'}), 400
             
             filename = secure_filename(file.filename)
-            filepath = os.path.join(UPLOAD_FOLDER, filename)
+            filepath = os.path.join(UPLOAD_FOLDER, f"{uuid.uuid4().hex}_{filename}")
             file.save(filepath)
             print(f"\n📄 File saved: {filepath}")
             
-            try:
-                if filename.lower().endswith('.pdf'):
-                    resume_text = extract_text_from_pdf(filepath)
-                else:
-                    resume_text = extract_text_from_docx(filepath)
-                
-                print(f"📝 Extracted {len(resume_text)} characters")
-                
-                if len(resume_text) < 50:
-                    raise Exception("File appears empty or corrupted")
-                
-            except Exception as e:
-                os.remove(filepath)
-                return jsonify({'success': False, 'error': f'Text extraction failed: {str(e)}'}), 500
+            job_id = submit_job(process_resume_file, filepath, filename, description=filename)
             
-            try:
-                parsed_data = parse_resume_with_skyq(resume_text, filename)
-                
-                if not parsed_data:
-                    raise Exception('No data returned from AI')
-                
-                parsed_data = enhance_parsed_data(parsed_data, resume_text)
-                print("✅ Data enhanced with post-processing")
-                
-                completeness_score = score_resume_completeness(parsed_data)
-                print(f"📊 Resume completeness: {completeness_score}%")
-                parsed_data['_completeness_score'] = completeness_score
-                
-                yecc_result = sync_to_yecc_api(parsed_data)
-                if yecc_result:
-                    parsed_data['_yecc_user_id'] = yecc_result.get('user_id')
-                    parsed_data['_yecc_resume_url'] = yecc_result.get('resume_url')
-                    parsed_data['_yecc_profile_url'] = yecc_result.get('yecc_profile_url')
-                
-            except Exception as e:
-                os.remove(filepath)
-                return jsonify({'success': False, 'error': f'AI parsing failed: {str(e)}'}), 500
+            return jsonify({
+                'success': True,
+                'message': 'Resume queued for parsing',
+                'job_id': job_id,
+                'status': 'queued',
+                'status_url': f'/jobs/{job_id}'
+            }), 202
+        
+        except Exception as e:
+            print(f"❌ Unexpected error: {str(e)}")
+            return jsonify({'success': False, 'error': f'Unexpected error: {str(e)}'}), 500
+    
+    @app.route('/upload-bulk', methods=['POST'])
+    def upload_resumes_bulk():
+        try:
+            files = [file for file in request.files.getlist('resumes') if file.filename]
+            if not files:
+                return jsonify({'success': False, 'error': 'No files uploaded'}), 400
             
-            upload_resume_to_docs(resume_text, filename, parsed_data)
+            batch_dir = os.path.join(UPLOAD_FOLDER, f"batch_{uuid.uuid4().hex}")
+            os.makedirs(batch_dir)
             
-            try:
-                save_to_excel(parsed_data)
-            except Exception as e:
-                os.remove(filepath)
-                return jsonify({'success': False, 'error': f'Database save failed: {str(e)}'}), 500
+            paths = []
+            for number, file in enumerate(files):
+                filename = secure_filename(file.filename)
+                if not filename.lower().endswith('.zip') and not allowed_file(filename):
+                    print(f"⚠️ Skipping unsupported upload: {file.filename}")
+                    continue
+                filepath = os.path.join(batch_dir, f"{number}_{filename}")
+                file.save(filepath)
+                paths.append(filepath)
+            
+            if not paths:
+                os.rmdir(batch_dir)
+                return jsonify({'success': False, 'error': 'Invalid file type'}), 400
             
-            os.remove(filepath)
+            print(f"\n📦 Bulk upload saved: {len(paths)} files in {batch_dir}")
+            job_id = submit_job(process_resume_paths, paths, batch_dir, description=f'bulk upload ({len(paths)} files)')
             
             return jsonify({
                 'success': True,
-                'message': 'Resume parsed and saved successfully',
-                'data': parsed_data
-            })
+                'message': 'Resumes queued for bulk parsing',
+                'job_id': job_id,
+                'status': 'queued',
+                'status_url': f'/jobs/{job_id}'
+            }), 202
         
         except Exception as e:
             print(f"❌ Unexpected error: {str(e)}")
             return jsonify({'success': False, 'error': f'Unexpected error: {str(e)}'}), 500
     
+    @app.route('/jobs/<job_id>')
+    def job_status(job_id):
+        job = get_job(job_id)
+        if job is None:
+            return jsonify({'success': False, 'error': 'Job not found'}), 404
+        
+        return jsonify({
+            'success': True,
+            'job_id': job['id'],
+            'status': job['status'],
+            'stage': job['stage'],
+            'preview': job['preview'],
+            'error': job['error'],
+            'data': job['result']
+        })
+    
     @app.route('/search', methods=['POST'])
     def search():
         try:
             data = request.get_json()
             query = data.get('query', '')
+            mode = data.get('mode', 'ai')
+            fields = data.get('fields', 'all')
+            search_id = data.get('search_id')
+            stream = data.get('stream', False) or request.accept_mimetypes.best == 'application/x-ndjson'
             
-            if not query:
+            if not query and not search_id:
                 return jsonify({'success': False, 'error': 'Search query required'}), 400
             
-            print(f"\n🔍 Searching for: {query}")
+            try:
+                offset = max(int(data.get('offset', 0)), 0)
+                limit = data.get('limit')
+                limit = min(max(int(limit), 1), SEARCH_MAX_PAGE_SIZE) if limit is not None else None
+            except (TypeError, ValueError):
+                return jsonify({'success': False, 'error': 'offset and limit must be integers'}), 400
+            
+            if fields == 'summary':
+                columns = SEARCH_RESULT_COLUMNS
+            elif isinstance(fields, list):
+                columns = fields
+            else:
+                columns = None
+            
+            if search_id:
+                session = get_search_session(search_id)
+                if session is None:
+                    return jsonify({'success': False, 'error': 'Search expired, please search again'}), 410
+            else:
+                print(f"\n🔍 Searching for: {query} ({mode})")
+                search_id, session = create_search_session(query, mode)
+            
+            total = len(session['ids'])
             
-            results = search_with_rag(query)
+            if stream:
+                def generate():
+                    yield json.dumps({'type': 'meta', 'search_id': search_id, 'total': total, 'offset': offset}) + '\n'
+                    for record in iter_results(session, offset, limit, columns):
+                        yield json.dumps({'type': 'result', 'data': record}, default=str) + '\n'
+                
+                return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+            
+            results = get_results_page(session, offset, limit, columns)
+            next_offset = min(offset + limit, total) if limit is not None else total
             
             return jsonify({
                 'success': True,
                 'results': results,
-                'count': len(results)
+                'count': len(results),
+                'total': total,
+                'offset': offset,
+                'next_offset': next_offset if next_offset < total else None,
+                'has_more': next_offset < total,
+                'search_id': search_id
             })
         except Exception as e:
             print(f"❌ Search error: {str(e)}")
@@ -125,15 +179,21 @@ def register_routes(app):
     
     @app.route('/download-database')
     def download_database():
-        if os.path.exists(EXCEL_FILE):
-            return send_file(EXCEL_FILE, as_attachment=True)
+        try:
+            excel_path = export_to_excel()
+        except Exception as e:
+            return jsonify({'error': f'Database export failed: {str(e)}'}), 500
+        if excel_path:
+            return send_file(os.path.abspath(excel_path), as_attachment=True)
         return jsonify({'error': 'No database found'}), 404
     
     @app.route('/api/stats')
     def get_stats():
         try:
-            count = get_resume_count()
-            return jsonify({'success': True, 'count': count})
+            stats = get_database_stats()
+            return jsonify({'success': True, **stats, 'search_cache': get_search_cache_stats(),
+                            'parse_cache': get_parse_cache_stats(), 'yecc_outbox': get_outbox_stats(),
+                            'jobs': get_job_stats()})
         except Exception as e:
             return jsonify({'success': False, 'count': 0, 'error': str(e)})
     
@@ -146,4 +206,23 @@ def register_routes(app):
             else:
                 return jsonify({'success': False, 'error': message}), 404
         except Exception as e:
-            return jsonify({'success': False, 'error': str(e)}), 500
\ No newline at end of file
+            return jsonify({'success': False, 'error': str(e)}), 500
+    
+    @app.route('/api/deduplicate-database', methods=['POST'])
+    def deduplicate_database_route():
+        try:
+            success, message = deduplicate_database()
+            if success:
+                return jsonify({'success': True, 'message': message})
+            else:
+                return jsonify({'success': False, 'error': message}), 404
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
+    
+    @app.route('/api/yecc-sync/retry', methods=['POST'])
+    def retry_yecc_sync_route():
+        try:
+            count = retry_failed_syncs()
+            return jsonify({'success': True, 'message': f'{count} failed YECC syncs queued for retry'})
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
@@ -0,0 +1,407 @@
+import re
+from datetime import datetime
+from config import RULE_PARSE_MIN_SCORE
+from utils import extract_contact_info
+from resume_parser import SECTION_HEADINGS, score_resume_completeness
+
+
+WORD_PATTERN = re.compile(r'[a-z]+')
+SECTION_KINDS = [
+    ('projects', ('project',)),
+    ('experience', ('experience', 'employment', 'work history', 'career history')),
+    ('education', ('education', 'academic', 'qualification')),
+    ('certifications', ('certif', 'training')),
+    ('skills', ('skill', 'competenc')),
+    ('summary', ('summary', 'profile', 'objective')),
+]
+
+MONTH = r'(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)'
+DATE = rf"(?:{MONTH}\.?[\s,'’\-]*\d{{2,4}}|\d{{1,2}}[/.\-]\d{{2,4}}|(?:19|20)\d{{2}})"
+CURRENT = r'(?:present|current(?:ly)?|till\s+(?:date|now)|to\s+date|now|ongoing)'
+DATE_RANGE_PATTERN = re.compile(rf"\b({DATE})\s*(?:-|–|—|to|till|until)\s*({DATE}|{CURRENT})\b", re.IGNORECASE)
+CURRENT_PATTERN = re.compile(rf'^{CURRENT}$', re.IGNORECASE)
+YEAR_PATTERN = re.compile(r"(?:19|20)\d{2}|(?<=['’])\d{2}\b")
+
+BULLETS = '•-*▪●◦–·➢✓>'
+PART_SPLIT_PATTERN = re.compile(r'\s*(?:\||;|,|\s[-–—]\s|\s@\s|\sat\s|\(|\))\s*')
+LABEL_PATTERN = re.compile(r'^([A-Za-z][A-Za-z /&]{1,30})\s*:\s*(.*)$')
+ROLE_PATTERN = re.compile(
+    r'\b(?:consultant|analyst|manager|lead|engineer|developer|architect|specialist|associate|intern|executive|'
+    r'director|head|administrator|accountant|officer|trainee|advisor|coordinator|programmer|supervisor)\b', re.IGNORECASE
+)
+COMPANY_PATTERN = re.compile(
+    r'\b(?:ltd|limited|pvt|private|inc|llc|llp|corp|corporation|company|technologies|technology|solutions|services|'
+    r'consulting|consultancy|systems|infotech|software|group|bank|labs|industries|enterprises|infosys|wipro|'
+    r'accenture|deloitte|tcs|capgemini|cognizant|ibm|oracle|kpmg|pwc|hcl|mahindra)\b', re.IGNORECASE
+)
+NAME_PATTERN = re.compile(r"^[A-Za-z][A-Za-z.'\-]*(?:\s+[A-Za-z][A-Za-z.'\-]*){1,3}$")
+NAME_LABELS = ('name', 'full name', 'candidate name')
+NAME_STOPWORDS = {
+    'curriculum', 'vitae', 'resume', 'cv', 'biodata', 'bio', 'profile', 'personal', 'contact', 'details',
+    'information', 'info', 'summary', 'objective', 'address', 'phone', 'mobile', 'email', 'linkedin'
+}
+LOCATION_PATTERN = re.compile(r'^[A-Z][a-z]+(?:\s[A-Z][a-z]+)?,\s*[A-Z][a-z]+(?:\s[A-Z][a-z]+)?$')
+SENTENCE_PATTERN = re.compile(r'(?<=[.!?])\s+')
+SKILL_SPLIT_PATTERN = re.compile(r'\s*[,;|•]\s*')
+
+DEGREE_PATTERN = re.compile(
+    r"\b(?:bachelor|master|b\.?\s?tech|m\.?\s?tech|b\.\s?e\b|m\.\s?e\b|b\.?\s?com|m\.?\s?com|b\.?\s?sc|m\.?\s?sc|"
+    r"bba|mba|bca|mca|pgdm|pgdbm|ph\.?\s?d|diploma|chartered accountant|icwa|cma|hsc|ssc|graduat|post[\s-]?graduat)",
+    re.IGNORECASE
+)
+INSTITUTION_PATTERN = re.compile(
+    r'\b(?:university|college|institute|school|academy|iit|nit|iim|vidyalaya|polytechnic)\b', re.IGNORECASE
+)
+
+ERP_SYSTEM_PATTERNS = [
+    ('Oracle Fusion', re.compile(r'\b(?:oracle\s+)?fusion\b|\boracle\s+(?:erp\s+)?cloud\b', re.IGNORECASE)),
+    ('Oracle E-Business Suite', re.compile(r'\be-?business\s+suite\b|\bEBS\b|\boracle\s+apps\b|\bR12\b|\b11i\b', re.IGNORECASE)),
+    ('SAP S/4HANA', re.compile(r'\bS/?4\s?HANA\b', re.IGNORECASE)),
+    ('SAP', re.compile(r'\bSAP\b')),
+    ('NetSuite', re.compile(r'\bnet\s?suite\b', re.IGNORECASE)),
+    ('Microsoft Dynamics 365', re.compile(r'\bdynamics\s*365\b|\bD365\b|\b(?:ms|microsoft)\s+dynamics\b', re.IGNORECASE)),
+    ('Workday', re.compile(r'\bworkday\b', re.IGNORECASE)),
+    ('PeopleSoft', re.compile(r'\bpeople\s?soft\b', re.IGNORECASE)),
+    ('JD Edwards', re.compile(r'\bjd\s?edwards\b|\bJDE\b', re.IGNORECASE)),
+    ('Salesforce', re.compile(r'\bsalesforce\b', re.IGNORECASE)),
+]
+
+ERP_MODULE_PATTERNS = [
+    ('GL', 'FIN', re.compile(r'\bGL\b|(?i:\bgeneral\s+ledger\b)')),
+    ('AP', 'FIN', re.compile(r'\bAP\b|(?i:\baccounts?\s+payables?\b)')),
+    ('AR', 'FIN', re.compile(r'\bAR\b|(?i:\baccounts?\s+receivables?\b)')),
+    ('FA', 'FIN', re.compile(r'\bFA\b|(?i:\bfixed\s+assets?\b)')),
+    ('CM', 'FIN', re.compile(r'\bCM\b|(?i:\bcash\s+management\b)')),
+    ('INV', 'SCM', re.compile(r'\bINV\b|(?i:\binventory\s+management\b)')),
+    ('PO', 'SCM', re.compile(r'\bPO\b|(?i:\bpurchasing\b|\bprocurement\b)')),
+    ('OM', 'SCM', re.compile(r'\bOM\b|(?i:\border\s+management\b)')),
+    ('OTL', 'HCM', re.compile(r'\bOTL\b|(?i:\btime\s+and\s+labou?r\b)')),
+    ('Core HR', 'HCM', re.compile(r'(?i:\bcore\s+hr\b)')),
+    ('Payroll', 'HCM', re.compile(r'(?i:\bpayroll\b)')),
+    ('Absence Management', 'HCM', re.compile(r'(?i:\babsence\s+management\b)')),
+    ('Benefits', 'HCM', re.compile(r'(?i:\bbenefits\s+(?:module|administration|management)\b)')),
+    ('Recruiting', 'HCM', re.compile(r'(?i:\brecruiting\b|\btaleo\b)')),
+]
+TRACK_MODULE_FIELDS = {'FIN': 'financials_modules', 'HCM': 'hcm_modules', 'SCM': 'scm_modules'}
+
+PROJECT_START_PATTERN = re.compile(r'^project\s*(?:name|title)?\s*(?:#?\d+)?\s*[:\-–.]\s*(.+)$', re.IGNORECASE)
+PROJECT_TYPES = [('Implementation', 'implement'), ('Support', 'support'), ('Upgrade', 'upgrad'),
+                 ('Rollout', 'rollout'), ('Migration', 'migration')]
+PROJECT_PHASES = [('Requirement Gathering', 'requirement'), ('Design', 'design'), ('Configuration', 'configur'),
+                  ('Data Migration', 'data migration'), ('Testing', 'testing'), ('UAT', 'uat'),
+                  ('Go-Live', 'go-live'), ('Training', 'training'), ('Post Go-Live Support', 'post go-live')]
+WORK_LOCATION_TYPES = [('Onsite', 'onsite'), ('Offshore', 'offshore'), ('Remote', 'remote'), ('Hybrid', 'hybrid')]
+
+
+def _section_kind(line):
+    words = WORD_PATTERN.findall(line.lower())
+    heading = ' '.join(words)
+    if not (0 < len(words) <= 5 and len(line) <= 60 and heading in SECTION_HEADINGS):
+        return None
+    for kind, keywords in SECTION_KINDS:
+        if any(keyword in heading for keyword in keywords):
+            return kind
+    return 'other'
+
+
+def split_sections(resume_text):
+    sections = {'header': []}
+    kind = 'header'
+    for line in resume_text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+
+        heading = _section_kind(line)
+        rest = ''
+        if heading is None and ':' in line[:40]:
+            label, rest = line.split(':', 1)
+            heading = _section_kind(label.strip())
+        if heading == 'other' and kind == 'header' and not sections['header']:
+            heading = None
+        if heading:
+            kind = heading
+            sections.setdefault(kind, [])
+            line = rest.strip()
+            if not line:
+                continue
+        sections.setdefault(kind, []).append(line)
+    return sections
+
+
+def _strip_bullet(line):
+    return line.lstrip(BULLETS + ' \t').strip()
+
+
+def _is_bullet(line):
+    return line[:1] in BULLETS
+
+
+def _year(date_text):
+    if CURRENT_PATTERN.match(date_text.strip()):
+        return datetime.now().year
+    match = YEAR_PATTERN.search(date_text)
+    if not match:
+        return None
+    year = int(match.group())
+    return year if year > 100 else 2000 + year if year < 50 else 1900 + year
+
+
+def _date_range(line):
+    match = DATE_RANGE_PATTERN.search(line)
+    if not match:
+        return None
+    start, end = ' '.join(match.group(1).split()), ' '.join(match.group(2).split())
+    current = bool(CURRENT_PATTERN.match(end))
+    return match, start, 'Present' if current else end, current
+
+
+def _parts(text):
+    return [part.strip(' .:-–') for part in PART_SPLIT_PATTERN.split(text) if part and part.strip(' .:-–')]
+
+
+def _detect(text, entries):
+    return [name for name, keyword in entries if re.search(rf'\b{re.escape(keyword)}', text)]
+
+
+def detect_erp_systems(text):
+    return [name for name, pattern in ERP_SYSTEM_PATTERNS if pattern.search(text)]
+
+
+def detect_erp_modules(text):
+    return [(name, track) for name, track, pattern in ERP_MODULE_PATTERNS if pattern.search(text)]
+
+
+def _is_trusted_name(name, email):
+    local = re.sub(r'[^a-z]', '', email.split('@')[0].lower())
+    return any(len(token) >= 3 and token in local for token in WORD_PATTERN.findall(name.lower()))
+
+
+def _extract_name(header, email=''):
+    for line in header[:8]:
+        label = LABEL_PATTERN.match(line)
+        labelled = bool(label and label.group(1).strip().lower() in NAME_LABELS)
+        if labelled:
+            line = label.group(2)
+        line = line.split('|')[0].strip()
+        words = WORD_PATTERN.findall(line.lower())
+        if ' '.join(words) in SECTION_HEADINGS or NAME_STOPWORDS.intersection(words):
+            continue
+        if NAME_PATTERN.match(line) and not ROLE_PATTERN.search(line) and not COMPANY_PATTERN.search(line):
+            if not labelled and not _is_trusted_name(line, email):
+                return ''
+            return line.title() if line.isupper() else line
+    return ''
+
+
+def _extract_location(header, name):
+    for line in header[:10]:
+        label = LABEL_PATTERN.match(line)
+        if label and label.group(1).strip().lower() in ('location', 'address', 'current location', 'city'):
+            return label.group(2).strip()[:80]
+        for part in re.split(r'\s*[|•]\s*', line):
+            if part != name and LOCATION_PATTERN.match(part):
+                return part
+    return ''
+
+
+def _extract_phone(phones):
+    for phone, _ in phones:
+        if not DATE_RANGE_PATTERN.search(phone) and 10 <= sum(c.isdigit() for c in phone) <= 13:
+            return phone
+    return ''
+
+
+def _find_role_and_company(parts, position='', company=''):
+    if not position:
+        position = next((part for part in parts if ROLE_PATTERN.search(part) and len(part) <= 60), '')
+    if not company:
+        company = next((part for part in parts if part != position and COMPANY_PATTERN.search(part)), '')
+    return position, company
+
+
+def _extract_experience(lines):
+    date_lines = [i for i, line in enumerate(lines) if DATE_RANGE_PATTERN.search(line)]
+    blocks = []
+    for i in date_lines:
+        previous = lines[i - 1] if i > 0 else ''
+        starts_here = not blocks or i - 1 > blocks[-1][1]
+        if previous and starts_here and not DATE_RANGE_PATTERN.search(previous) and not _is_bullet(previous) \
+                and len(previous) <= 80 and not previous.endswith('.'):
+            blocks.append((i - 1, i))
+        else:
+            blocks.append((i, i))
+
+    entries = []
+    for number, (first, i) in enumerate(blocks):
+        stop = blocks[number + 1][0] if number + 1 < len(blocks) else len(lines)
+        match, start, end, current = _date_range(lines[i])
+        header = lines[first:i] + [lines[i][:match.start()] + ' ' + lines[i][match.end():]]
+        parts = [part for text in header for part in _parts(text)]
+        position, company = _find_role_and_company(parts)
+
+        body = i + 1
+        if (not position or not company) and body < stop and not _is_bullet(lines[body]) and len(lines[body]) <= 80:
+            found = _find_role_and_company(_parts(lines[body]), position, company)
+            if found != (position, company):
+                position, company = found
+                header.append(lines[body])
+                body += 1
+        if not company:
+            company = next((part for part in parts if part != position and len(part) <= 60), '')
+        if not position and not company:
+            continue
+
+        header_text = ' '.join(header)
+        entries.append({
+            'position': position,
+            'country': '',
+            'company_name': company,
+            'employment_type': 'Internship' if re.search(r'\bintern', position, re.IGNORECASE)
+            else 'Contract' if re.search(r'\bcontract', header_text, re.IGNORECASE) else '',
+            'currently_working_here': current,
+            'from_date': start,
+            'to_date': end,
+            'short_description': ' '.join(_strip_bullet(line) for line in lines[body:stop])[:600].strip()
+        })
+    return entries
+
+
+def _build_project(name, lines):
+    fields = {}
+    description = []
+    for line in lines:
+        label = LABEL_PATTERN.match(_strip_bullet(line))
+        if label:
+            fields.setdefault(label.group(1).strip().lower(), label.group(2).strip())
+        description.append(_strip_bullet(line))
+
+    text = ' '.join([name] + description)
+    lower = text.lower()
+    dates = _date_range(fields.get('duration') or fields.get('period') or text)
+    modules = detect_erp_modules(text)
+    tracks = [track for _, track in modules]
+    systems = detect_erp_systems(text)
+
+    project = {
+        'company_name': fields.get('client') or fields.get('customer') or fields.get('company') or '',
+        'project_name': name,
+        'project_domain': fields.get('domain') or fields.get('industry') or '',
+        'project_type': _detect(lower, PROJECT_TYPES),
+        'currently_working_on_this_project': dates[3] if dates else False,
+        'from_date': dates[1] if dates else '',
+        'to_date': dates[2] if dates else '',
+        'project_phases_involved': _detect(lower, PROJECT_PHASES),
+        'work_location_type': _detect(lower, WORK_LOCATION_TYPES),
+        'product': systems[0] if systems else '',
+        'track': max(set(tracks), key=tracks.count) if tracks else '',
+        'financials_modules': [],
+        'hcm_modules': [],
+        'scm_modules': [],
+        'role': fields.get('role') or fields.get('designation') or ''
+    }
+    for module, track in modules:
+        project[TRACK_MODULE_FIELDS[track]].append(module)
+    return project
+
+
+def _extract_projects(lines):
+    projects = []
+    name = None
+    current = []
+    for line in lines:
+        match = PROJECT_START_PATTERN.match(_strip_bullet(line))
+        if match:
+            if name:
+                projects.append(_build_project(name, current))
+            name, current = match.group(1).strip(), []
+        elif name:
+            current.append(line)
+    if name:
+        projects.append(_build_project(name, current))
+    return projects
+
+
+def _extract_education(lines):
+    education = []
+    for i, line in enumerate(lines):
+        if not DEGREE_PATTERN.search(line):
+            continue
+        parts = _parts(_strip_bullet(line))
+        following = lines[i + 1] if i + 1 < len(lines) and not DEGREE_PATTERN.search(lines[i + 1]) else ''
+        degree = next((part for part in parts if DEGREE_PATTERN.search(part)), '')
+        university = next((part for part in parts + _parts(_strip_bullet(following))
+                           if INSTITUTION_PATTERN.search(part) and part != degree), '')
+        years = re.findall(r'\b(?:19|20)\d{2}\b', f"{line} {following}")
+        education.append({'degree': degree, 'university': university, 'year': years[-1] if years else ''})
+    return education
+
+
+def _extract_list(lines, split=True):
+    items = []
+    for line in lines:
+        line = _strip_bullet(line)
+        label = LABEL_PATTERN.match(line)
+        if split and label and label.group(2):
+            line = label.group(2)
+        for item in (SKILL_SPLIT_PATTERN.split(line) if split else [line]):
+            item = item.strip(' .')
+            if 2 <= len(item) <= (50 if split else 200) and item not in items:
+                items.append(item)
+    return items[:50]
+
+
+def rule_parse_resume(resume_text):
+    sections = split_sections(resume_text)
+    header = sections.get('header', [])
+
+    contact = extract_contact_info(resume_text)
+    name = _extract_name(header, contact['email'] or '')
+    summary = ' '.join(SENTENCE_PATTERN.split(' '.join(sections.get('summary', [])))[:3])[:600]
+    jobs = _extract_experience(sections.get('experience', []))
+    projects = _extract_projects(sections.get('projects', []) or sections.get('experience', []))
+
+    years = contact['years_experience']
+    if not years or years > 45:
+        spans = [(_year(job['from_date']), _year(job['to_date'])) for job in jobs]
+        spans = [(start, end) for start, end in spans if start and end and start <= end]
+        years = max(end for _, end in spans) - min(start for start, _ in spans) if spans else None
+    current_job = next((job for job in jobs if job['currently_working_here']), jobs[0] if jobs else {})
+
+    return {
+        'name': name,
+        'email': contact['email'] or '',
+        'phone': _extract_phone(contact['phones']),
+        'location': _extract_location(header, name),
+        'linkedin': contact['linkedin'] or '',
+        'summary': summary,
+        'total_years_experience': str(years) if years else '',
+        'current_role': current_job.get('position', ''),
+        'current_company': current_job.get('company_name', ''),
+        'erp_systems': detect_erp_systems(resume_text),
+        'erp_modules': [module for module, _ in detect_erp_modules(resume_text)],
+        'technical_skills': _extract_list(sections.get('skills', [])),
+        'certifications': _extract_list(sections.get('certifications', []), split=False),
+        'education': _extract_education(sections.get('education', [])),
+        'job_experience': jobs,
+        'erp_projects_experience': projects
+    }
+
+
+def parse_resume_with_rules(resume_text, min_score=RULE_PARSE_MIN_SCORE):
+    if min_score > 100:
+        return None
+
+    try:
+        parsed = rule_parse_resume(resume_text)
+    except Exception as e:
+        print(f"⚠️  Rule-based parse failed: {str(e)[:100]}")
+        return None
+
+    score = score_resume_completeness(parsed)
+    if score < min_score or not parsed['name'] or not (parsed['email'] or parsed['phone']) or not parsed['job_experience']:
+        print(f"📐 Rule-based parse scored {score}/100 (needs {min_score}), using the LLM")
+        return None
+
+    print(f"⚡ Rule-based parse scored {score}/100, skipping the LLM")
+    return parsed
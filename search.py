@@ -1,8 +1,18 @@
-import os
 import json
+import time
+import uuid
+import threading
+import numpy as np
 import pandas as pd
+from collections import OrderedDict
 import google.generativeai as genai
-from config import GEMINI_API_KEY, GEMINI_MODEL, EXCEL_FILE
+from config import (
+    GEMINI_API_KEY, GEMINI_MODEL, AI_SEARCH_SHORTLIST_SIZE, SEMANTIC_SEARCH_TOP_K,
+    SEARCH_SESSION_TTL, SEARCH_SESSION_LIMIT, SEARCH_CACHE_TTL, SEARCH_CACHE_SIZE
+)
+from database import get_candidates_df, get_database_version
+from keyword_index import sync_keyword_index, search_keyword_index
+from vector_index import search_similar
 
 genai.configure(api_key=GEMINI_API_KEY)
 gemini_model = genai.GenerativeModel(
@@ -13,115 +23,321 @@ gemini_model = genai.GenerativeModel(
     }
 )
 
+RRF_K = 60
 
-def search_with_rag(search_query):
-    if not os.path.exists(EXCEL_FILE):
-        return []
+_rag_positions = {'source': None, 'positions': {}}
+_id_positions = {'source': None, 'index': None}
+
+_cache_lock = threading.Lock()
+_result_cache = OrderedDict()
+_cache_stats = {'hits': 0, 'misses': 0}
+
+_sessions_lock = threading.Lock()
+_search_sessions = OrderedDict()
+
+
+def search_with_rag(search_query, columns=None):
+    df, positions, scores, reasons = rank_candidates(search_query, mode='ai')
+    return _materialize_results(df, positions, scores, reasons, columns=columns)
+
+
+def rank_candidates(search_query, mode='ai'):
+    version = get_database_version()
+    df = get_candidates_df()
+    if get_database_version() != version:
+        version = None
+    cache_key = (mode, ' OR ' in search_query, ' '.join(search_query.lower().split()), version)
+    
+    cached = _get_cached_ranking(cache_key) if version is not None else None
+    if cached is not None:
+        print(f"⚡ Search cache hit ({len(cached[0])} results)")
+        return (df,) + cached
+    
+    if df.empty:
+        return df, [], [], []
+    
+    ranking, cacheable = _rank(df, search_query, mode)
+    if cacheable and version is not None:
+        _store_cached_ranking(cache_key, ranking)
+    return (df,) + ranking
+
+
+def _rank(df, search_query, mode):
+    cacheable = True
+    if mode == 'semantic':
+        try:
+            ranking = _rank_semantic(df, search_query)
+            if ranking[0]:
+                print(f"✅ Semantic search found {len(ranking[0])} matches")
+                return ranking, True
+        except Exception as e:
+            print(f"Semantic search error: {e}")
+            cacheable = False
+    elif mode != 'keyword':
+        try:
+            ranking = _rank_with_ai(df, search_query)
+            if ranking[0]:
+                print(f"✅ AI search found {len(ranking[0])} matches")
+                return ranking, True
+        except Exception as e:
+            print(f"AI search error: {e}")
+            cacheable = False
     
     try:
-        df = pd.read_excel(EXCEL_FILE)
-        df = df.fillna('')
-        
-        candidates_summary = []
-        for idx, row in df.iterrows():
-            summary = f"{idx+1}. {row.get('Name', 'Unknown')} | {row.get('Current_Role', 'N/A')} | "
-            summary += f"ERP: {row.get('ERP_Systems', 'N/A')} | Modules: {row.get('ERP_Modules', 'N/A')} | "
-            summary += f"Skills: {str(row.get('Technical_Skills', ''))[:100]} | {row.get('Total_Years_Experience', 'N/A')} yrs"
-            candidates_summary.append(summary)
+        return _rank_keyword(df, search_query), cacheable
+    except Exception as e:
+        print(f"Fallback search error: {e}")
+        return ([], [], []), False
+
+
+def _get_cached_ranking(cache_key):
+    with _cache_lock:
+        entry = _result_cache.get(cache_key)
+        if entry is not None and time.time() - entry[0] > SEARCH_CACHE_TTL:
+            del _result_cache[cache_key]
+            entry = None
         
-        if not candidates_summary:
-            return []
+        if entry is None:
+            _cache_stats['misses'] += 1
+            return None
         
-        prompt = f"""Search query: "{search_query}"
+        _result_cache.move_to_end(cache_key)
+        _cache_stats['hits'] += 1
+        return entry[1]
+
+
+def _store_cached_ranking(cache_key, ranking):
+    with _cache_lock:
+        for key in [key for key in _result_cache if key[-1] < cache_key[-1]]:
+            del _result_cache[key]
+        _result_cache[cache_key] = (time.time(), ranking)
+        _result_cache.move_to_end(cache_key)
+        while len(_result_cache) > SEARCH_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+
+
+def get_search_cache_stats():
+    with _cache_lock:
+        lookups = _cache_stats['hits'] + _cache_stats['misses']
+        return {
+            'hits': _cache_stats['hits'],
+            'misses': _cache_stats['misses'],
+            'hit_rate': round(_cache_stats['hits'] / lookups, 3) if lookups else 0,
+            'size': len(_result_cache)
+        }
+
+
+def create_search_session(search_query, mode='ai'):
+    df, positions, scores, reasons = rank_candidates(search_query, mode)
+    session = {
+        'query': search_query,
+        'mode': mode,
+        'version': get_database_version(),
+        'ids': [int(doc_id) for doc_id in df['ID'].iloc[list(positions)]],
+        'scores': list(scores),
+        'reasons': list(reasons),
+        'created': time.time()
+    }
+    
+    search_id = uuid.uuid4().hex
+    with _sessions_lock:
+        _expire_search_sessions()
+        _search_sessions[search_id] = session
+        while len(_search_sessions) > SEARCH_SESSION_LIMIT:
+            _search_sessions.popitem(last=False)
+    
+    return search_id, session
+
+
+def get_search_session(search_id):
+    with _sessions_lock:
+        _expire_search_sessions()
+        session = _search_sessions.get(search_id)
+        if session is not None:
+            _search_sessions.move_to_end(search_id)
+        return session
+
+
+def _expire_search_sessions():
+    cutoff = time.time() - SEARCH_SESSION_TTL
+    expired = [search_id for search_id, session in _search_sessions.items() if session['created'] < cutoff]
+    for search_id in expired:
+        del _search_sessions[search_id]
+
+
+def _candidate_positions(df, ids):
+    if _id_positions['source'] is not df:
+        _id_positions['index'] = pd.Index(df['ID'])
+        _id_positions['source'] = df
+    return _id_positions['index'].get_indexer(ids)
+
+
+def get_results_page(session, offset=0, limit=None, columns=None):
+    end = len(session['ids']) if limit is None else offset + limit
+    df = get_candidates_df()
+    positions = _candidate_positions(df, session['ids'][offset:end])
+    keep = [i for i, pos in enumerate(positions) if pos >= 0]
+    return _materialize_results(
+        df,
+        [int(positions[i]) for i in keep],
+        [session['scores'][offset + i] for i in keep],
+        [session['reasons'][offset + i] for i in keep],
+        columns=columns
+    )
+
+
+def iter_results(session, offset=0, limit=None, columns=None, chunk_size=50):
+    end = len(session['ids']) if limit is None else min(len(session['ids']), offset + limit)
+    for start in range(offset, end, chunk_size):
+        for record in get_results_page(session, start, min(chunk_size, end - start), columns):
+            yield record
+
+
+def _rank_with_ai(df, search_query):
+    shortlist = _shortlist_candidates(df, search_query, AI_SEARCH_SHORTLIST_SIZE)
+    if not shortlist:
+        return [], [], []
+    
+    rows = df.iloc[shortlist][['Name', 'Current_Role', 'ERP_Systems', 'ERP_Modules', 'Technical_Skills', 'Total_Years_Experience']]
+    candidates_summary = [
+        f"{number}. {name or 'Unknown'} | {role or 'N/A'} | "
+        f"ERP: {systems or 'N/A'} | Modules: {modules or 'N/A'} | "
+        f"Skills: {str(skills)[:100]} | {years or 'N/A'} yrs"
+        for number, (name, role, systems, modules, skills, years) in enumerate(rows.itertuples(index=False), start=1)
+    ]
+    
+    prompt = f"""Search query: "{search_query}"
 Find matching candidates from this list. Return ONLY a JSON array:
 [
   {{"candidate_number": 1, "score": 95, "reason": "Strong SAP FICO match"}},
   {{"candidate_number": 3, "score": 80, "reason": "Relevant modules"}}
 ]
 Candidates:
-{chr(10).join(candidates_summary[:30])}
+{chr(10).join(candidates_summary)}
 IMPORTANT: Return ONLY the JSON array, no explanations."""
 
-        print(f"🔍 AI search with {len(candidates_summary)} candidates")
-        
-        response = gemini_model.generate_content(prompt)
+    print(f"🔍 AI search with {len(shortlist)} of {len(df)} candidates")
+    
+    response = gemini_model.generate_content(prompt)
+    
+    positions, scores, reasons = [], [], []
+    if response.text:
+        content = response.text.strip()
         
-        if response.text:
-            content = response.text.strip()
-            
-            if content.startswith('```json'):
-                content = content[7:]
-            elif content.startswith('```'):
-                content = content[3:]
-            if content.endswith('```'):
-                content = content[:-3]
-            
-            content = content.strip()
-            matches = json.loads(content)
-            
-            results = []
-            for match in matches:
-                idx = match.get('candidate_number', 0) - 1
-                if 0 <= idx < len(df):
-                    resume_data = df.iloc[idx].to_dict()
-                    
-                    for key, value in resume_data.items():
-                        if pd.isna(value):
-                            resume_data[key] = ''
-                    
-                    resume_data['relevance_score'] = match.get('score', 80)
-                    resume_data['match_reason'] = match.get('reason', 'AI matched')
-                    results.append(resume_data)
-            
-            if results:
-                print(f"✅ AI search found {len(results)} matches")
-                return results
+        if content.startswith('```json'):
+            content = content[7:]
+        elif content.startswith('```'):
+            content = content[3:]
+        if content.endswith('```'):
+            content = content[:-3]
         
-        return fallback_excel_search(search_query)
+        content = content.strip()
+        matches = json.loads(content)
         
-    except Exception as e:
-        print(f"AI search error: {e}")
-        return fallback_excel_search(search_query)
-
-
-def search_with_ai(search_query):
-    return search_with_rag(search_query)
+        for match in matches:
+            number = match.get('candidate_number', 0) - 1
+            if 0 <= number < len(shortlist):
+                positions.append(shortlist[number])
+                scores.append(match.get('score', 80))
+                reasons.append(match.get('reason', 'AI matched'))
+    
+    return positions, scores, reasons
 
 
-def fallback_excel_search(search_query):
-    if not os.path.exists(EXCEL_FILE):
+def _materialize_results(df, positions, scores, reasons, columns=None):
+    if not len(positions):
         return []
     
+    selected = df.iloc[positions]
+    if columns:
+        selected = selected[[col for col in columns if col in selected.columns]]
+    
+    return selected.assign(relevance_score=scores, match_reason=reasons).to_dict('records')
+
+
+def _rag_file_positions(df):
+    if _rag_positions['source'] is not df:
+        _rag_positions['positions'] = {key: pos for pos, key in enumerate(df['RAG_File_ID']) if key}
+        _rag_positions['source'] = df
+    return _rag_positions['positions']
+
+
+def _semantic_hits(df, search_query, limit):
     try:
-        df = pd.read_excel(EXCEL_FILE)
-        df = df.fillna('')
-        
-        search_lower = search_query.lower()
-        
-        matched_candidates = []
-        for idx, row in df.iterrows():
-            searchable_text = ' '.join([
-                str(row.get('Name', '')),
-                str(row.get('Current_Role', '')),
-                str(row.get('ERP_Systems', '')),
-                str(row.get('ERP_Modules', '')),
-                str(row.get('Technical_Skills', '')),
-                str(row.get('Location', ''))
-            ]).lower()
-            
-            if search_lower in searchable_text:
-                candidate_data = row.to_dict()
-                
-                for key, value in candidate_data.items():
-                    if pd.isna(value):
-                        candidate_data[key] = ''
-                
-                candidate_data['relevance_score'] = 70
-                candidate_data['match_reason'] = f"Keyword match: {search_query}"
-                matched_candidates.append(candidate_data)
-        
-        print(f"Keyword search found {len(matched_candidates)} matches")
-        return matched_candidates
+        hits = search_similar(search_query, top_k=limit)
     except Exception as e:
-        print(f"Fallback search error: {e}")
-        return []
\ No newline at end of file
+        print(f"Vector search error: {e}")
+        return []
+    positions = _rag_file_positions(df)
+    return [(positions[key], score) for key, score in hits if key in positions]
+
+
+def _shortlist_candidates(df, search_query, limit):
+    sync_keyword_index(df)
+    keyword_hits = search_keyword_index(search_query, mode='or', limit=limit)
+    keyword_positions = pd.Index(df['ID']).get_indexer([doc_id for doc_id, _ in keyword_hits])
+    semantic_positions = [pos for pos, _ in _semantic_hits(df, search_query, limit)]
+    
+    fused = {}
+    for ranked in ([int(pos) for pos in keyword_positions if pos >= 0], semantic_positions):
+        for rank, pos in enumerate(ranked):
+            fused[pos] = fused.get(pos, 0) + 1 / (RRF_K + rank + 1)
+    shortlist = sorted(fused, key=fused.get, reverse=True)[:limit]
+    
+    if len(shortlist) < limit:
+        chosen = set(shortlist)
+        completeness = pd.to_numeric(df['Completeness_Score'], errors='coerce').fillna(0).to_numpy()
+        for pos in np.argsort(-completeness, kind='stable'):
+            if len(shortlist) >= limit:
+                break
+            if int(pos) not in chosen:
+                shortlist.append(int(pos))
+    
+    return shortlist
+
+
+def _rank_semantic(df, search_query):
+    hits = _semantic_hits(df, search_query, SEMANTIC_SEARCH_TOP_K)
+    positions = [pos for pos, _ in hits]
+    scores = [int(round(100 * min(score, 1.0))) for _, score in hits]
+    reasons = [f"Semantic match (similarity {score:.2f})" for _, score in hits]
+    return positions, scores, reasons
+
+
+def semantic_search(search_query, columns=None):
+    df, positions, scores, reasons = rank_candidates(search_query, mode='semantic')
+    return _materialize_results(df, positions, scores, reasons, columns=columns)
+
+
+def search_with_ai(search_query, columns=None):
+    return search_with_rag(search_query, columns=columns)
+
+
+def _rank_keyword(df, search_query):
+    sync_keyword_index(df)
+    
+    mode = 'or' if ' OR ' in search_query else 'and'
+    hits = search_keyword_index(search_query, mode=mode)
+    if not hits and mode == 'and':
+        mode = 'or'
+        hits = search_keyword_index(search_query, mode=mode)
+    
+    if not hits:
+        print("Keyword search found 0 matches")
+        return [], [], []
+    
+    top_score = hits[0][1] or 1
+    positions = pd.Index(df['ID']).get_indexer([doc_id for doc_id, _ in hits])
+    keep = positions >= 0
+    raw_scores = np.array([score for _, score in hits])[keep]
+    
+    scores = np.rint(50 + 49 * raw_scores / top_score).astype(int)
+    reason = f"Keyword match: {search_query}" if mode == 'and' else f"Partial keyword match: {search_query}"
+    
+    print(f"Keyword search found {int(keep.sum())} matches")
+    return positions[keep].tolist(), scores.tolist(), [reason] * int(keep.sum())
+
+
+def fallback_excel_search(search_query, columns=None):
+    df, positions, scores, reasons = rank_candidates(search_query, mode='keyword')
+    return _materialize_results(df, positions, scores, reasons, columns=columns)
@@ -0,0 +1,30 @@
+import json
+import pytest
+import database
+
+
+@pytest.fixture
+def fresh_database(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(database, '_initialized', False)
+    monkeypatch.setattr(database, '_local', database.threading.local())
+    database.invalidate_candidates_cache()
+    yield
+    database.invalidate_candidates_cache()
+
+
+def test_merge_rows_keeps_old_values_over_empty_ones():
+    old = ['Priya Sharma', '[{"degree": "B.Com"}]', '{"a": 1}', 80, 'GL']
+    new = ['', '[]', '{}', 0, 'GL, AP']
+    assert database._merge_rows(old, new) == ['Priya Sharma', '[{"degree": "B.Com"}]', '{"a": 1}', 80, 'GL, AP']
+
+
+def test_upsert_keeps_education_when_reparse_has_none(fresh_database):
+    resume = {'name': 'Priya Sharma', 'email': 'priya.sharma@gmail.com', 'phone': '+91 98765 43210',
+              'education': [{'degree': 'B.Com', 'university': 'University of Pune', 'year': '2015'}]}
+    first_id = database.save_to_excel(resume)
+    second_id = database.save_to_excel(dict(resume, education=[], projects=[]))
+
+    assert first_id == second_id
+    row = database.get_candidates_df().iloc[0]
+    assert json.loads(row['Education'])[0]['degree'] == 'B.Com'
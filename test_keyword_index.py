@@ -0,0 +1,53 @@
+import pytest
+import keyword_index
+
+
+CANDIDATES = {
+    1: {'Name': 'Priya Sharma', 'Current_Role': 'SAP FICO Consultant', 'ERP_Systems': 'SAP', 'Location': 'Pune'},
+    2: {'Name': 'Anita Rao', 'Current_Role': 'SAP MM Lead', 'ERP_Systems': 'SAP', 'Location': 'Mumbai'},
+    3: {'Name': 'Rahul Mehta', 'Current_Role': 'Oracle GL Consultant', 'ERP_Systems': 'Oracle Fusion'},
+    4: {'Name': 'Kiran Patel', 'Current_Role': 'Workday HCM Analyst', 'ERP_Systems': 'Workday'},
+    5: {'Name': 'Sneha Iyer', 'Current_Role': 'Oracle Payroll Consultant', 'ERP_Systems': 'Oracle EBS'},
+}
+
+
+@pytest.fixture(autouse=True)
+def empty_index():
+    keyword_index._reset_index()
+    for doc_id, record in CANDIDATES.items():
+        keyword_index.index_candidate(doc_id, record)
+    yield
+    keyword_index._reset_index()
+
+
+def test_and_query_ranks_best_match_first():
+    hits = keyword_index.search_keyword_index('SAP FICO')
+    assert [doc_id for doc_id, _ in hits] == [1]
+    assert hits[0][1] > 0
+
+
+def test_or_query_matches_any_term():
+    hits = keyword_index.search_keyword_index('workday OR fico', mode='or')
+    assert sorted(doc_id for doc_id, _ in hits) == [1, 4]
+
+
+def test_reindexing_keeps_scores_positive():
+    before = keyword_index.search_keyword_index('SAP', mode='or')
+    for _ in range(4):
+        for doc_id in (1, 2, 3, 4):
+            keyword_index.index_candidate(doc_id, CANDIDATES[doc_id])
+
+    after = keyword_index.search_keyword_index('SAP', mode='or')
+    assert [doc_id for doc_id, _ in after] == [doc_id for doc_id, _ in before]
+    assert all(score > 0 for _, score in after)
+    assert after == pytest.approx(before)
+    assert len(keyword_index._index['removed']) <= len(keyword_index._index['doc_ids']) // 2
+
+
+def test_updated_and_removed_candidates_drop_out():
+    keyword_index.index_candidate(1, dict(CANDIDATES[1], Current_Role='Workday Consultant', ERP_Systems='Workday'))
+    keyword_index.remove_candidate(2)
+
+    assert keyword_index.search_keyword_index('fico') == []
+    assert keyword_index.search_keyword_index('sap') == []
+    assert sorted(doc_id for doc_id, _ in keyword_index.search_keyword_index('workday')) == [1, 4]
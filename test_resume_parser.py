@@ -0,0 +1,117 @@
+import resume_parser
+from resume_parser import chunk_resume_text, merge_parsed_chunks
+
+
+HEADER = "Priya Sharma\nPune | priya.sharma@gmail.com | +91 98765 43210\n"
+
+
+def _resume(sections, body_length):
+    return HEADER + ''.join(f"\n{heading}\n{'x' * body_length}\n" for heading in sections)
+
+
+def test_short_resume_is_one_chunk():
+    resume = _resume(['Summary', 'Experience', 'Education'], 2000)
+    assert chunk_resume_text(resume) == [resume]
+
+
+def test_long_resume_splits_at_headings_and_keeps_header():
+    resume = _resume(['Summary', 'Experience', 'Projects', 'Education'], 3000)
+    chunks = chunk_resume_text(resume, 5000)
+    assert len(chunks) > 1
+    assert all(chunk.startswith(HEADER.strip()) and len(chunk) <= 5000 for chunk in chunks)
+    assert all('Summary' in chunk or 'Experience' in chunk or 'Projects' in chunk or 'Education' in chunk
+               for chunk in chunks)
+
+
+def test_merge_treats_null_lists_as_empty():
+    merged = merge_parsed_chunks([
+        {'name': 'Priya Sharma', 'erp_modules': ['GL'], 'education': None, 'job_experience': []},
+        {'name': '', 'erp_modules': None, 'technical_skills': ['OTBI'],
+         'education': [{'degree': 'B.Com', 'university': 'University of Pune'}]},
+    ])
+    assert merged['name'] == 'Priya Sharma'
+    assert merged['erp_modules'] == ['GL']
+    assert merged['technical_skills'] == ['OTBI']
+    assert merged['education'] == [{'degree': 'B.Com', 'university': 'University of Pune'}]
+    assert merged['certifications'] == []
+
+
+def test_failed_chunk_is_resplit_at_smaller_length(monkeypatch):
+    calls = []
+
+    def fake_parse(text, candidate_name="Unknown", on_field=None):
+        calls.append(len(text))
+        if len(text) > 4000:
+            raise Exception('response truncated')
+        return {'name': 'Priya Sharma', 'erp_modules': [f'M{len(calls)}']}
+
+    monkeypatch.setattr(resume_parser, 'parse_resume_with_llm', fake_parse)
+    results = resume_parser._parse_chunk(_resume(['Summary', 'Experience', 'Projects'], 2500), 'Priya')
+    assert calls[0] > 5000
+    assert len(results) > 1 and all(length <= 5000 for length in calls[1:])
+
+
+def _stream(chunks, on_field=None):
+    state = resume_parser.new_json_stream(on_field)
+    for chunk in chunks:
+        resume_parser.feed_json_stream(state, chunk)
+    return state
+
+
+def test_stream_matches_json_loads_when_fed_char_by_char():
+    document = ('```json\n{"name": "Priya \\"PS\\" Sharma", "summary": "GL \\\\ AP\\nFA caf\\u00e9", '
+                '"total_years_experience": 8, "erp_modules": ["GL", "AP"], '
+                '"job_experience": [{"position": "Lead", "currently_working_here": true}]}\n```')
+    state = _stream(document)
+    expected = resume_parser.json.loads(document[document.index('{'):document.rindex('}') + 1])
+    assert resume_parser.finish_json_stream(state) == expected
+    assert state['fields'] == expected
+    assert not state['repaired']
+
+
+def test_escapes_split_across_chunks():
+    document = '{"summary": "say \\"hi\\" \\\\ caf\\u00e9", "name": "P"}'
+    for split in range(1, len(document)):
+        state = _stream([document[:split], document[split:]])
+        assert resume_parser.finish_json_stream(state) == {'summary': 'say "hi" \\ café', 'name': 'P'}, split
+        assert state['fields'] == {'summary': 'say "hi" \\ café', 'name': 'P'}
+
+
+def test_truncated_inside_string_keeps_completed_fields():
+    state = _stream(['{"name": "Priya", "email": "p@x.com", "summary": "Oracle consu'])
+    assert resume_parser.finish_json_stream(state) == {'name': 'Priya', 'email': 'p@x.com'}
+    assert state['repaired'] and state['key'] == 'summary'
+
+
+def test_truncated_inside_array_keeps_completed_items():
+    state = _stream(['{"name": "Priya", "erp_modules": ["GL", "AP", "F'])
+    assert resume_parser.finish_json_stream(state) == {'name': 'Priya', 'erp_modules': ['GL', 'AP']}
+    assert 'erp_modules' not in state['fields']
+    assert state['key'] == 'erp_modules'
+
+
+def test_truncated_inside_nested_object():
+    state = _stream(['{"job_experience": [{"position": "Lead", "company_name": "Info'])
+    assert resume_parser.finish_json_stream(state) == {'job_experience': [{'position': 'Lead'}]}
+
+
+def test_truncated_inside_key_or_after_colon():
+    for text in ('{"name": "Priya", "ema', '{"name": "Priya", "email": ', '{"name": "Priya",'):
+        assert resume_parser.finish_json_stream(_stream([text])) == {'name': 'Priya'}
+
+
+def test_truncated_number_is_kept():
+    assert resume_parser.finish_json_stream(_stream(['{"name": "P", "total_years_experience": 12'])) == \
+        {'name': 'P', 'total_years_experience': 12}
+
+
+def test_on_field_emits_top_level_fields_in_order_as_they_complete():
+    emitted = []
+    state = resume_parser.new_json_stream(lambda key, value: emitted.append((key, value)))
+    resume_parser.feed_json_stream(state, '{"name": "Priya", "total_years_experience": 8')
+    assert emitted == [('name', 'Priya')]
+    resume_parser.feed_json_stream(state, ', "erp_modules": ["GL", {"x": 1}], "job_experience": [{"position": "Lead"}')
+    assert emitted == [('name', 'Priya'), ('total_years_experience', 8), ('erp_modules', ['GL', {'x': 1}])]
+    resume_parser.feed_json_stream(state, ']}')
+    assert [key for key, _ in emitted] == ['name', 'total_years_experience', 'erp_modules', 'job_experience']
+    assert emitted[-1] == ('job_experience', [{'position': 'Lead'}])
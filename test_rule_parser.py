@@ -0,0 +1,57 @@
+from rule_parser import parse_resume_with_rules, rule_parse_resume
+
+
+RESUME = """PRIYA SHARMA
+Pune, Maharashtra | +91 98765 43210 | priya.sharma@gmail.com
+https://www.linkedin.com/in/priya-sharma
+
+Professional Summary
+Oracle Fusion Financials consultant with 8 years of experience across GL, AP, AR and FA. Delivered 6 implementations.
+
+Work Experience
+Senior Consultant | Infosys Ltd
+Jan 2019 - Present
+- Led configuration and UAT for Oracle Fusion GL and AP.
+Consultant | Wipro Technologies
+Jul 2015 - Dec 2018
+- Supported month-end close on Oracle EBS R12.
+
+Projects
+Project: Finance Transformation
+Client: Acme Retail
+Duration: Jan 2020 - Dec 2021
+Implementation of Oracle Fusion GL, AP and AR, onsite, requirement gathering, configuration and UAT.
+
+Education
+B.Com, University of Pune, 2015
+
+Technical Skills
+Oracle Fusion, OTBI, FBDI, SQL
+
+Certifications
+Oracle Financials Cloud: General Ledger 2021 Certified Implementation Specialist
+"""
+
+
+def test_plain_resume_uses_rules():
+    parsed = parse_resume_with_rules(RESUME)
+    assert parsed is not None
+    assert parsed['name'] == 'Priya Sharma'
+
+
+def test_boilerplate_headers_are_not_names():
+    for heading in ('CURRICULUM VITAE', 'Resume', 'Resume of', 'CV', 'Bio-Data', 'Personal Profile',
+                    'Contact Details', 'Personal Details'):
+        parsed = rule_parse_resume(f"{heading}\n{RESUME}")
+        assert parsed['name'] == 'Priya Sharma', heading
+
+
+def test_name_label_is_trusted():
+    resume = RESUME.replace('PRIYA SHARMA', 'CURRICULUM VITAE\nName: Anita Rao').replace('priya.sharma', 'jobs2024')
+    assert rule_parse_resume(resume)['name'] == 'Anita Rao'
+
+
+def test_untrusted_name_falls_back_to_llm():
+    resume = RESUME.replace('PRIYA SHARMA', 'Anita Rao').replace('priya.sharma', 'jobs2024')
+    assert rule_parse_resume(resume)['name'] == ''
+    assert parse_resume_with_rules(resume) is None
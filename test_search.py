@@ -0,0 +1,65 @@
+import sqlite3
+import threading
+import pytest
+import database
+import keyword_index
+import search
+
+
+@pytest.fixture
+def candidates(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(database, '_initialized', False)
+    monkeypatch.setattr(database, '_local', threading.local())
+    database.invalidate_candidates_cache()
+    keyword_index._reset_index()
+    search._result_cache.clear()
+    for number, name in enumerate(['Priya Sharma', 'Anita Rao', 'Rahul Mehta']):
+        database.save_to_excel({'name': name, 'email': f'candidate{number}@example.com',
+                                'current_role': 'SAP FICO Consultant'})
+    yield
+    database.invalidate_candidates_cache()
+    keyword_index._reset_index()
+    search._result_cache.clear()
+
+
+def test_session_keeps_ids_not_dataframes(candidates):
+    _, session = search.create_search_session('sap fico', mode='keyword')
+    assert 'df' not in session
+    assert session['ids'] == [1, 2, 3]
+    assert session['version'] == database.get_database_version()
+
+
+def test_pages_read_current_data(candidates):
+    _, session = search.create_search_session('sap fico', mode='keyword')
+
+    conn = sqlite3.connect(database.DATABASE_FILE)
+    conn.execute("UPDATE resumes SET Name = 'Priya S' WHERE ID = 1")
+    conn.execute('DELETE FROM resumes WHERE ID = 2')
+    conn.commit()
+    conn.close()
+    database.invalidate_candidates_cache()
+
+    assert [row['Name'] for row in search.get_results_page(session, columns=['Name'])] == ['Priya S', 'Rahul Mehta']
+    assert [row['Name'] for row in search.iter_results(session, 1, 2, columns=['Name'])] == ['Rahul Mehta']
+
+
+def test_ranking_from_a_newer_snapshot_is_not_cached_under_the_old_version(candidates, monkeypatch):
+    version = database.get_database_version()
+    load = database.get_candidates_df
+
+    def load_after_write():
+        database.save_to_excel({'name': 'Kiran Patel', 'email': 'kiran@example.com', 'current_role': 'SAP FICO Lead'})
+        return load()
+
+    monkeypatch.setattr(search, 'get_candidates_df', load_after_write)
+    df, positions, _, _ = search.rank_candidates('sap fico', mode='keyword')
+    assert len(positions) == 4
+    assert all(key[-1] != version for key in search._result_cache)
+
+
+def test_storing_a_ranking_keeps_newer_versions(candidates):
+    search._store_cached_ranking(('keyword', False, 'sap', 7), ([0], [99], ['new']))
+    search._store_cached_ranking(('keyword', False, 'fico', 5), ([0], [99], ['old']))
+    search._store_cached_ranking(('keyword', False, 'gl', 6), ([0], [99], ['mid']))
+    assert [key[-1] for key in search._result_cache] == [7, 6]
@@ -0,0 +1,92 @@
+import json
+import threading
+import pytest
+import yecc_sync
+import yecc_outbox
+from fake_yecc_server import start_fake_server, get_server_stats, reset_server_stats
+
+
+RESUME = {
+    'name': 'Priya Sharma', 'email': 'priya.sharma@gmail.com', 'phone': '+91 98765 43210', 'location': 'Pune, MH',
+    'technical_skills': ['OTBI', 'FBDI'], 'erp_modules': ['GL'], 'erp_systems': ['Oracle Fusion'],
+    'job_experience': [{'position': 'Senior Consultant', 'company_name': 'Infosys', 'from_date': 'Jan 2019'}],
+    'education': [{'degree': 'B.Com', 'university': 'University of Pune', 'year': '2015'}],
+    'certifications': ['Oracle Financials Cloud Certified']
+}
+
+
+@pytest.fixture
+def fake_yecc(tmp_path, monkeypatch):
+    server = start_fake_server(0)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(yecc_sync, 'YECC_BASE_URL', f"http://127.0.0.1:{server.server_address[1]}")
+    monkeypatch.setattr(yecc_sync, 'YECC_REFERENCE_CACHE_FILE', '')
+    monkeypatch.setattr(yecc_sync, '_reference_cache', {})
+    monkeypatch.setattr(yecc_outbox, '_local', threading.local())
+    monkeypatch.setattr(yecc_outbox, '_worker', dict(yecc_outbox._worker, slots=threading.BoundedSemaphore(1)))
+    reset_server_stats()
+    yield server
+    server.shutdown()
+
+
+def _fail_once(monkeypatch, name):
+    original = getattr(yecc_sync, name)
+    calls = []
+
+    def flaky(*args):
+        calls.append(args)
+        return False if len(calls) == 1 else original(*args)
+
+    monkeypatch.setattr(yecc_sync, name, flaky)
+    return calls
+
+
+def _route_count(route):
+    return get_server_stats()['by_route'].get(route, 0)
+
+
+def test_failed_section_fails_the_sync(fake_yecc, monkeypatch):
+    _fail_once(monkeypatch, '_update_skills')
+    progress = {}
+    assert yecc_sync.sync_to_yecc_api(RESUME, progress) is None
+    assert progress['user_id'] and progress['resume_url']
+    assert 'skills' not in progress['sections']
+    assert len(progress['sections']) == 5
+
+
+def test_retry_only_resends_missing_steps(fake_yecc, monkeypatch):
+    calls = _fail_once(monkeypatch, '_update_skills')
+    progress = {}
+    assert yecc_sync.sync_to_yecc_api(RESUME, progress) is None
+
+    result = yecc_sync.sync_to_yecc_api(RESUME, progress)
+    assert result['user_id'] == progress['user_id']
+    assert len(calls) == 2
+    assert _route_count('POST /users') == 1
+    assert _route_count('POST /ResumeBuilder/generateResumeUrl') == 1
+    assert _route_count('PUT /ResumeBuilder/PersonalInfo') == 1
+
+
+def test_outbox_retries_with_saved_progress(fake_yecc, monkeypatch):
+    _fail_once(monkeypatch, '_update_experience')
+    synced = []
+    monkeypatch.setattr(yecc_outbox, 'update_yecc_ids', lambda *args: synced.append(args))
+    yecc_outbox.enqueue_yecc_sync(7, RESUME)
+
+    def process_next():
+        conn = yecc_outbox._get_connection()
+        row = conn.execute('SELECT ID, Resume_ID, Payload, Progress, Attempts FROM yecc_outbox').fetchone()
+        yecc_outbox._worker['slots'].acquire()
+        yecc_outbox._process(*row)
+        return conn.execute('SELECT Status, Attempts, Progress FROM yecc_outbox').fetchone()
+
+    status, attempts, progress = process_next()
+    assert (status, attempts) == ('pending', 1)
+    assert 'experience' not in json.loads(progress)['sections']
+    assert not synced
+
+    status, attempts, progress = process_next()
+    assert (status, attempts) == ('done', 2)
+    assert synced == [(7, json.loads(progress)['user_id'], json.loads(progress)['resume_url'],
+                       f"https://yecc.tech/Resume/{json.loads(progress)['resume_url']}")]
+    assert _route_count('POST /users') == 1
@@ -0,0 +1,94 @@
+import re
+import threading
+from collections import OrderedDict
+
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+MIN_MATCH_SCORE = 0.35
+MAX_CACHED_MATCHES = 2048
+
+_matches_lock = threading.Lock()
+
+
+def normalize_title(text):
+    return ' '.join(TOKEN_PATTERN.findall(str(text or '').lower()))
+
+
+def _trigrams(normalized):
+    padded = f'  {normalized} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def build_title_index(items):
+    index = {'items': items, 'exact': {}, 'tokens': {}, 'trigrams': {}, 'features': [], 'matches': OrderedDict()}
+
+    for pos, item in enumerate(items):
+        normalized = normalize_title(item.get('Title', ''))
+        tokens = set(normalized.split())
+        trigrams = _trigrams(normalized) if normalized else set()
+        index['features'].append((normalized, len(trigrams)))
+        if not normalized:
+            continue
+
+        index['exact'].setdefault(normalized, pos)
+        for token in tokens:
+            index['tokens'].setdefault(token, []).append(pos)
+        for trigram in trigrams:
+            index['trigrams'].setdefault(trigram, []).append(pos)
+
+    return index
+
+
+def _score(query, query_tokens, query_trigrams, features, shared_tokens, shared_trigrams):
+    normalized, trigram_count = features
+    token_score = shared_tokens / len(query_tokens)
+    trigram_score = 2 * shared_trigrams / (len(query_trigrams) + trigram_count)
+    containment = 1.0 if f' {query} ' in f' {normalized} ' or f' {normalized} ' in f' {query} ' else 0.0
+    return round(0.4 * token_score + 0.4 * trigram_score + 0.2 * containment, 4)
+
+
+def match_title(index, name, min_score=MIN_MATCH_SCORE):
+    query = normalize_title(name)
+    if not query:
+        return None, 0.0
+
+    key = (query, min_score)
+    with _matches_lock:
+        cached = index['matches'].get(key)
+        if cached is not None:
+            index['matches'].move_to_end(key)
+            return cached
+
+    pos = index['exact'].get(query)
+    if pos is not None:
+        result = (index['items'][pos], 1.0)
+    else:
+        query_tokens = set(query.split())
+        query_trigrams = _trigrams(query)
+
+        shared_tokens = {}
+        for token in query_tokens:
+            for pos in index['tokens'].get(token, ()):
+                shared_tokens[pos] = shared_tokens.get(pos, 0) + 1
+        shared_trigrams = {}
+        for trigram in query_trigrams:
+            for pos in index['trigrams'].get(trigram, ()):
+                shared_trigrams[pos] = shared_trigrams.get(pos, 0) + 1
+
+        best_pos, best_score = None, 0.0
+        for pos in sorted(shared_trigrams):
+            score = _score(query, query_tokens, query_trigrams, index['features'][pos],
+                           shared_tokens.get(pos, 0), shared_trigrams[pos])
+            if score > best_score:
+                best_pos, best_score = pos, score
+
+        if best_pos is None or best_score < min_score:
+            result = (None, best_score)
+        else:
+            result = (index['items'][best_pos], best_score)
+
+    with _matches_lock:
+        index['matches'][key] = result
+        if len(index['matches']) > MAX_CACHED_MATCHES:
+            index['matches'].popitem(last=False)
+    return result
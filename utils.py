@@ -35,6 +35,12 @@ def extract_text_from_docx(file_path):
         raise Exception(f"Failed to extract text from Word document: {str(e)}")
 
 
+def extract_text_from_file(file_path):
+    if file_path.lower().endswith('.pdf'):
+        return extract_text_from_pdf(file_path)
+    return extract_text_from_docx(file_path)
+
+
 def clean_array(arr):
     if not arr:
         return []
@@ -49,28 +55,93 @@ def clean_array(arr):
     return cleaned
 
 
+EMAIL_REGEX = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+LINKEDIN_REGEX = re.compile(r'(?:https?://)?(?:www\.)?linkedin\.com/in/[\w\-]+', re.IGNORECASE)
+PHONE_REGEX = re.compile(r'[\+\(]?[1-9][0-9 .\-\(\)]{8,}[0-9]')
+YEARS_REGEX = re.compile(r'(?P<years_value>\d+)[\+]?\s*(?:years?|yrs?)', re.IGNORECASE)
+CONTACT_TRIGGER_PATTERN = r'@|linkedin\.com/in/|year|yr|[\+\(1-9][0-9 .\-\(\)]{8,}[0-9]'
+CONTACT_TRIGGER_REGEX = re.compile(CONTACT_TRIGGER_PATTERN)
+CONTACT_TRIGGER_REGEX_IGNORECASE = re.compile(CONTACT_TRIGGER_PATTERN, re.IGNORECASE)
+MAX_EMAIL_LOCAL_LENGTH = 64
+MAX_EMAIL_DOMAIN_LENGTH = 255
+LINKEDIN_PREFIX_LENGTH = len('https://www.')
+
+
+def _years_start(text, end):
+    start = end
+    while start > 0 and text[start - 1].isspace():
+        start -= 1
+    if start > 0 and text[start - 1] == '+':
+        start -= 1
+    digits_end = start
+    while start > 0 and text[start - 1].isdigit():
+        start -= 1
+    return start if start < digits_end else None
+
+
+def extract_contact_info(text):
+    text = text or ''
+    found = {'emails': [], 'phones': [], 'linkedins': [], 'years': []}
+    email_end = 0
+    linkedin_end = 0
+
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        triggers = CONTACT_TRIGGER_REGEX.finditer(lowered)
+    else:
+        triggers = CONTACT_TRIGGER_REGEX_IGNORECASE.finditer(text)
+
+    for trigger in triggers:
+        pos = trigger.start()
+        first = trigger.group()[0].lower()
+
+        if first == '@':
+            match = EMAIL_REGEX.search(text, max(email_end, pos - MAX_EMAIL_LOCAL_LENGTH), pos + MAX_EMAIL_DOMAIN_LENGTH)
+            if match and match.start() <= pos < match.end():
+                found['emails'].append((match.group(), match.start()))
+                email_end = match.end()
+        elif first == 'l':
+            match = LINKEDIN_REGEX.search(text, max(linkedin_end, pos - LINKEDIN_PREFIX_LENGTH))
+            if match:
+                found['linkedins'].append((match.group(), match.start()))
+                linkedin_end = match.end()
+        elif first == 'y':
+            start = _years_start(text, pos)
+            match = YEARS_REGEX.match(text, start) if start is not None else None
+            if match:
+                found['years'].append((int(match.group('years_value')), start))
+        else:
+            match = PHONE_REGEX.search(text, pos, trigger.end())
+            if match:
+                found['phones'].append((match.group().strip(), match.start()))
+
+    return {
+        'email': found['emails'][0][0] if found['emails'] else None,
+        'phone': found['phones'][0][0] if found['phones'] else None,
+        'linkedin': found['linkedins'][0][0] if found['linkedins'] else None,
+        'years_experience': max(years for years, _ in found['years']) if found['years'] else None,
+        **found
+    }
+
+
 def extract_email(text):
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, text)
-    return emails[0] if emails else None
+    match = EMAIL_REGEX.search(text)
+    return match.group() if match else None
 
 
 def extract_phone(text):
-    phone_pattern = r'[\+\(]?[1-9][0-9 .\-\(\)]{8,}[0-9]'
-    phones = re.findall(phone_pattern, text)
-    return phones[0].strip() if phones else None
+    match = PHONE_REGEX.search(text)
+    return match.group().strip() if match else None
 
 
 def extract_linkedin(text):
-    linkedin_pattern = r'(?:https?://)?(?:www\.)?linkedin\.com/in/[\w\-]+'
-    linkedin = re.findall(linkedin_pattern, text, re.IGNORECASE)
-    return linkedin[0] if linkedin else None
+    match = LINKEDIN_REGEX.search(text)
+    return match.group() if match else None
 
 
 def extract_years_experience(text):
-    years_pattern = r'(\d+)[\+]?\s*(?:years?|yrs?)'
-    years_matches = re.findall(years_pattern, text.lower())
-    return max(map(int, years_matches)) if years_matches else None
+    years_matches = [int(match.group('years_value')) for match in YEARS_REGEX.finditer(text)]
+    return max(years_matches) if years_matches else None
 
 
 def safe_join(arr):
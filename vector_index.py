@@ -0,0 +1,211 @@
+import os
+import json
+import zlib
+import threading
+import numpy as np
+from config import VECTOR_INDEX_DIR, VECTOR_DIMENSIONS
+from keyword_index import tokenize
+
+
+INITIAL_CAPACITY = 1024
+
+_lock = threading.Lock()
+_state = {
+    'signature': None,
+    'vectors': None,
+    'doc_freq': None,
+    'doc_keys': [],
+    'doc_rows': {},
+    'count': 0
+}
+
+
+def _paths():
+    return {
+        'meta': os.path.join(VECTOR_INDEX_DIR, 'meta.json'),
+        'vectors': os.path.join(VECTOR_INDEX_DIR, 'vectors.npy'),
+        'doc_freq': os.path.join(VECTOR_INDEX_DIR, 'doc_freq.npy'),
+        'keys': os.path.join(VECTOR_INDEX_DIR, 'doc_keys.txt')
+    }
+
+
+def _meta_signature():
+    path = _paths()['meta']
+    if not os.path.exists(path):
+        return None
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _hashed_counts(text):
+    tokens = tokenize(text)
+    features = tokens + [f'{a} {b}' for a, b in zip(tokens, tokens[1:])]
+
+    counts = {}
+    for feature in features:
+        bucket = zlib.crc32(feature.encode('utf-8')) % VECTOR_DIMENSIONS
+        counts[bucket] = counts.get(bucket, 0) + 1
+    return counts
+
+
+def _to_vector(counts, weights=None):
+    vector = np.zeros(VECTOR_DIMENSIONS, dtype=np.float32)
+    if not counts:
+        return vector
+
+    buckets = np.fromiter(counts.keys(), dtype=np.int64)
+    vector[buckets] = np.log1p(np.fromiter(counts.values(), dtype=np.float32))
+    if weights is not None:
+        vector *= weights
+
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector /= norm
+    return vector
+
+
+def _load():
+    signature = _meta_signature()
+    if signature is not None and signature == _state['signature']:
+        return
+
+    paths = _paths()
+    if signature is None:
+        _state.update({'signature': None, 'vectors': None, 'doc_freq': None,
+                       'doc_keys': [], 'doc_rows': {}, 'count': 0})
+        return
+
+    with open(paths['meta'], 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+
+    if meta.get('dimensions') != VECTOR_DIMENSIONS:
+        raise Exception(
+            f"Vector index at {VECTOR_INDEX_DIR} has {meta.get('dimensions')} dimensions, "
+            f"expected {VECTOR_DIMENSIONS}. Delete the directory to rebuild it."
+        )
+
+    with open(paths['keys'], 'r', encoding='utf-8') as f:
+        doc_keys = [line.rstrip('\n') for line in f][:meta['count']]
+
+    _state.update({
+        'signature': signature,
+        'vectors': np.load(paths['vectors'], mmap_mode='r+'),
+        'doc_freq': np.load(paths['doc_freq'], mmap_mode='r+'),
+        'doc_keys': doc_keys,
+        'doc_rows': {key: row for row, key in enumerate(doc_keys)},
+        'count': len(doc_keys)
+    })
+
+
+def _write_meta():
+    paths = _paths()
+    tmp_path = paths['meta'] + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'dimensions': VECTOR_DIMENSIONS,
+            'count': _state['count'],
+            'capacity': _state['vectors'].shape[0]
+        }, f)
+    os.replace(tmp_path, paths['meta'])
+    _state['signature'] = _meta_signature()
+
+
+def _create_index():
+    paths = _paths()
+    os.makedirs(VECTOR_INDEX_DIR, exist_ok=True)
+
+    vectors = np.lib.format.open_memmap(
+        paths['vectors'], mode='w+', dtype=np.float32, shape=(INITIAL_CAPACITY, VECTOR_DIMENSIONS)
+    )
+    doc_freq = np.lib.format.open_memmap(
+        paths['doc_freq'], mode='w+', dtype=np.int32, shape=(VECTOR_DIMENSIONS,)
+    )
+    open(paths['keys'], 'w', encoding='utf-8').close()
+
+    _state.update({'vectors': vectors, 'doc_freq': doc_freq, 'doc_keys': [], 'doc_rows': {}, 'count': 0})
+    _write_meta()
+
+
+def _grow_index():
+    paths = _paths()
+    old_vectors = _state['vectors']
+    tmp_path = paths['vectors'] + '.tmp'
+
+    vectors = np.lib.format.open_memmap(
+        tmp_path, mode='w+', dtype=np.float32, shape=(old_vectors.shape[0] * 2, VECTOR_DIMENSIONS)
+    )
+    vectors[:_state['count']] = old_vectors[:_state['count']]
+    vectors.flush()
+    del vectors, old_vectors
+    _state['vectors'] = None
+
+    os.replace(tmp_path, paths['vectors'])
+    _state['vectors'] = np.load(paths['vectors'], mmap_mode='r+')
+
+
+def add_document(doc_key, text):
+    with _lock:
+        _load()
+        if _state['vectors'] is None:
+            _create_index()
+
+        counts = _hashed_counts(text)
+        vector = _to_vector(counts)
+        doc_freq = _state['doc_freq']
+
+        row = _state['doc_rows'].get(doc_key)
+        if row is not None:
+            previous = np.flatnonzero(_state['vectors'][row])
+            doc_freq[previous] -= 1
+        else:
+            if _state['count'] >= _state['vectors'].shape[0]:
+                _grow_index()
+            row = _state['count']
+
+        _state['vectors'][row] = vector
+        _state['vectors'].flush()
+        doc_freq[np.fromiter(counts.keys(), dtype=np.int64)] += 1
+        doc_freq.flush()
+
+        if doc_key not in _state['doc_rows']:
+            with open(_paths()['keys'], 'a', encoding='utf-8') as f:
+                f.write(doc_key + '\n')
+            _state['doc_keys'].append(doc_key)
+            _state['doc_rows'][doc_key] = row
+            _state['count'] += 1
+
+        _write_meta()
+        return row
+
+
+def search_similar(query, top_k=20):
+    with _lock:
+        _load()
+        count = _state['count']
+        if not count:
+            return []
+
+        counts = _hashed_counts(query)
+        if not counts:
+            return []
+
+        doc_freq = np.asarray(_state['doc_freq'], dtype=np.float32)
+        idf = np.log((count + 1) / (doc_freq + 1)) + 1
+        query_vector = _to_vector(counts, idf)
+
+        scores = _state['vectors'][:count] @ query_vector
+        doc_keys = _state['doc_keys']
+
+    if top_k and count > top_k:
+        rows = np.argpartition(-scores, top_k - 1)[:top_k]
+    else:
+        rows = np.arange(count)
+    rows = rows[np.argsort(-scores[rows], kind='stable')]
+
+    return [(doc_keys[row], float(scores[row])) for row in rows if scores[row] > 0]
+
+
+def get_index_size():
+    with _lock:
+        _load()
+        return _state['count']
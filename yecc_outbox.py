@@ -0,0 +1,196 @@
+import json
+import time
+import random
+import sqlite3
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from config import (
+    YECC_OUTBOX_FILE, YECC_OUTBOX_WORKERS, YECC_SYNC_RATE_PER_MINUTE, YECC_RETRY_BASE_DELAY,
+    YECC_RETRY_MAX_DELAY, YECC_MAX_ATTEMPTS, YECC_CLAIM_LEASE
+)
+from yecc_sync import sync_to_yecc_api
+from database import update_yecc_ids
+
+
+POLL_INTERVAL = 2
+
+_local = threading.local()
+_worker_lock = threading.Lock()
+_worker = {'thread': None, 'executor': None, 'wake': threading.Event(), 'slots': None, 'next_start': 0.0}
+
+
+def _get_connection():
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect(YECC_OUTBOX_FILE, timeout=30, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS yecc_outbox (ID INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "Resume_ID INTEGER NOT NULL, Payload TEXT NOT NULL, Status TEXT NOT NULL DEFAULT 'pending', "
+            "Attempts INTEGER NOT NULL DEFAULT 0, Next_Attempt REAL NOT NULL DEFAULT 0, "
+            "Claimed_At REAL, Last_Error TEXT DEFAULT '', Progress TEXT NOT NULL DEFAULT '{}', "
+            "Created REAL NOT NULL, Updated REAL NOT NULL)"
+        )
+        columns = [row[1] for row in conn.execute('PRAGMA table_info(yecc_outbox)')]
+        if 'Progress' not in columns:
+            conn.execute("ALTER TABLE yecc_outbox ADD COLUMN Progress TEXT NOT NULL DEFAULT '{}'")
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_yecc_outbox_due ON yecc_outbox (Status, Next_Attempt)')
+        _local.conn = conn
+    return conn
+
+
+@contextmanager
+def _transaction(conn):
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        yield conn
+        conn.execute('COMMIT')
+    except Exception:
+        conn.execute('ROLLBACK')
+        raise
+
+
+def enqueue_yecc_syncs(items):
+    if not items:
+        return
+
+    now = time.time()
+    conn = _get_connection()
+    with _transaction(conn):
+        conn.executemany(
+            'INSERT INTO yecc_outbox (Resume_ID, Payload, Created, Updated) VALUES (?, ?, ?, ?)',
+            [(resume_id, json.dumps(parsed_data), now, now) for resume_id, parsed_data in items]
+        )
+    print(f"📮 Queued {len(items)} YECC sync(s)")
+    _worker['wake'].set()
+
+
+def enqueue_yecc_sync(resume_id, parsed_data):
+    enqueue_yecc_syncs([(resume_id, parsed_data)])
+
+
+def _claim_due(limit):
+    now = time.time()
+    conn = _get_connection()
+    with _transaction(conn):
+        rows = conn.execute(
+            "SELECT ID, Resume_ID, Payload, Progress, Attempts FROM yecc_outbox "
+            "WHERE (Status = 'pending' AND Next_Attempt <= ?) OR (Status = 'in_progress' AND Claimed_At <= ?) "
+            "ORDER BY Next_Attempt, ID LIMIT ?",
+            (now, now - YECC_CLAIM_LEASE, limit)
+        ).fetchall()
+        conn.executemany(
+            "UPDATE yecc_outbox SET Status = 'in_progress', Claimed_At = ?, Updated = ? WHERE ID = ?",
+            [(now, now, row[0]) for row in rows]
+        )
+    return rows
+
+
+def _retry_delay(attempts):
+    delay = min(YECC_RETRY_BASE_DELAY * (2 ** (attempts - 1)), YECC_RETRY_MAX_DELAY)
+    return delay * random.uniform(0.5, 1.0)
+
+
+def _finish(outbox_id, status, attempts, error='', next_attempt=0):
+    conn = _get_connection()
+    conn.execute(
+        'UPDATE yecc_outbox SET Status = ?, Attempts = ?, Last_Error = ?, Next_Attempt = ?, '
+        'Claimed_At = NULL, Updated = ? WHERE ID = ?',
+        (status, attempts, error, next_attempt, time.time(), outbox_id)
+    )
+
+
+def _save_progress(outbox_id, progress):
+    _get_connection().execute(
+        'UPDATE yecc_outbox SET Progress = ?, Updated = ? WHERE ID = ?',
+        (json.dumps(progress), time.time(), outbox_id)
+    )
+
+
+def _process(outbox_id, resume_id, payload, progress, attempts):
+    attempts += 1
+    try:
+        result = sync_to_yecc_api(
+            json.loads(payload), json.loads(progress or '{}'),
+            lambda completed: _save_progress(outbox_id, completed)
+        )
+        if not result:
+            raise Exception('YECC sync returned no result')
+
+        update_yecc_ids(resume_id, result.get('user_id'), result.get('resume_url'), result.get('yecc_profile_url'))
+        _finish(outbox_id, 'done', attempts)
+        print(f"✅ YECC sync for candidate #{resume_id} complete")
+    except Exception as e:
+        if attempts >= YECC_MAX_ATTEMPTS:
+            _finish(outbox_id, 'failed', attempts, str(e))
+            print(f"❌ YECC sync for candidate #{resume_id} failed after {attempts} attempts: {str(e)}")
+        else:
+            delay = _retry_delay(attempts)
+            _finish(outbox_id, 'pending', attempts, str(e), time.time() + delay)
+            print(f"⚠️ YECC sync for candidate #{resume_id} failed (attempt {attempts}), retrying in {delay:.0f}s")
+    finally:
+        _worker['slots'].release()
+        _worker['wake'].set()
+
+
+def _wait_for_rate_limit():
+    if YECC_SYNC_RATE_PER_MINUTE <= 0:
+        return
+    now = time.time()
+    if _worker['next_start'] > now:
+        time.sleep(_worker['next_start'] - now)
+    _worker['next_start'] = max(now, _worker['next_start']) + 60.0 / YECC_SYNC_RATE_PER_MINUTE
+
+
+def _run_worker():
+    while True:
+        _worker['wake'].wait(POLL_INTERVAL)
+        _worker['wake'].clear()
+
+        try:
+            while _worker['slots'].acquire(blocking=False):
+                rows = _claim_due(1)
+                if not rows:
+                    _worker['slots'].release()
+                    break
+                _wait_for_rate_limit()
+                _worker['executor'].submit(_process, *rows[0])
+        except Exception as e:
+            print(f"⚠️ YECC outbox worker error: {str(e)}")
+
+
+def start_outbox_worker():
+    with _worker_lock:
+        if _worker['thread'] is not None:
+            return
+
+        _worker['executor'] = ThreadPoolExecutor(max_workers=YECC_OUTBOX_WORKERS, thread_name_prefix='yecc-outbox')
+        _worker['slots'] = threading.BoundedSemaphore(YECC_OUTBOX_WORKERS)
+        _worker['thread'] = threading.Thread(target=_run_worker, name='yecc-outbox-dispatcher', daemon=True)
+        _worker['thread'].start()
+        print(f"📮 YECC outbox worker started ({YECC_OUTBOX_WORKERS} workers)")
+
+
+def retry_failed_syncs():
+    conn = _get_connection()
+    cursor = conn.execute(
+        "UPDATE yecc_outbox SET Status = 'pending', Attempts = 0, Next_Attempt = 0, Updated = ? WHERE Status = 'failed'",
+        (time.time(),)
+    )
+    if cursor.rowcount:
+        start_outbox_worker()
+        _worker['wake'].set()
+    return cursor.rowcount
+
+
+def get_outbox_stats():
+    try:
+        counts = dict(_get_connection().execute(
+            'SELECT Status, COUNT(*) FROM yecc_outbox GROUP BY Status'
+        ).fetchall())
+    except Exception as e:
+        print(f"⚠️ YECC outbox stats failed: {str(e)}")
+        counts = {}
+    return {status: counts.get(status, 0) for status in ('pending', 'in_progress', 'done', 'failed')}
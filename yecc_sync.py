@@ -1,22 +1,131 @@
+import os
 import json
+import time
+import threading
 import requests
-from config import YECC_BASE_URL, YECC_HEADERS
+from concurrent.futures import ThreadPoolExecutor, wait
+from requests.adapters import HTTPAdapter
+from title_index import build_title_index, match_title, normalize_title
+from config import YECC_BASE_URL, YECC_HEADERS, YECC_SYNC_WORKERS, YECC_REFERENCE_TTL, YECC_REFERENCE_CACHE_FILE
 
-def _get_lookup_id(endpoint, match_text, key_field="Title"):
+
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=YECC_SYNC_WORKERS))
+_session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=YECC_SYNC_WORKERS))
+
+_executor = ThreadPoolExecutor(max_workers=YECC_SYNC_WORKERS, thread_name_prefix='yecc')
+
+LOOKUP_DEFAULTS = {
+    "country_id": ("resumeCountry", "India", 3),
+    "state_id": ("resumeState", "Gujarat", 1),
+    "city_id": ("resumeCity", "Ahmedabad", 1),
+    "degree_id": ("resumeDegree", "Bachelor", 1),
+    "university_id": ("resumeUniversity", "University", 1),
+    "lang_id": ("resumeLanguages", "English", 1),
+    "company_id": ("resumeCompany", "Infosys", 1),
+    "position_id": ("resumePosition", "Consultant", 1)
+}
+
+_reference_lock = threading.Lock()
+_reference_fetch_locks = {}
+_reference_cache = {}
+
+
+def _load_reference_cache():
+    if not YECC_REFERENCE_CACHE_FILE or not os.path.exists(YECC_REFERENCE_CACHE_FILE):
+        return
+    try:
+        with open(YECC_REFERENCE_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get("base_url") != YECC_BASE_URL:
+            return
+        for endpoint, entry in cached.get("lists", {}).items():
+            if time.time() - entry["fetched"] < YECC_REFERENCE_TTL:
+                _reference_cache[endpoint] = _reference_entry(entry["items"], entry["fetched"])
+        print(f"📚 Loaded {len(_reference_cache)} YECC reference lists from {YECC_REFERENCE_CACHE_FILE}")
+    except Exception as e:
+        print(f"⚠️ Could not load YECC reference cache: {e}")
+
+
+def _save_reference_cache():
+    if not YECC_REFERENCE_CACHE_FILE:
+        return
+    try:
+        with _reference_lock:
+            lists = {
+                endpoint: {"fetched": entry["fetched"], "items": entry["items"]}
+                for endpoint, entry in _reference_cache.items()
+            }
+        tmp_path = YECC_REFERENCE_CACHE_FILE + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"base_url": YECC_BASE_URL, "lists": lists}, f)
+        os.replace(tmp_path, YECC_REFERENCE_CACHE_FILE)
+    except Exception as e:
+        print(f"⚠️ Could not save YECC reference cache: {e}")
+
+
+def _reference_entry(items, fetched):
+    return {"fetched": fetched, "items": items, "index": build_title_index(items)}
+
+
+def _get_reference(endpoint, headers=None):
+    entry = _reference_cache.get(endpoint)
+    if entry is not None and time.time() - entry["fetched"] < YECC_REFERENCE_TTL:
+        return entry
+
+    with _reference_lock:
+        fetch_lock = _reference_fetch_locks.setdefault(endpoint, threading.Lock())
+
+    with fetch_lock:
+        entry = _reference_cache.get(endpoint)
+        if entry is not None and time.time() - entry["fetched"] < YECC_REFERENCE_TTL:
+            return entry
+
+        try:
+            res = _session.get(f"{YECC_BASE_URL}/{endpoint}", headers=headers or YECC_HEADERS, timeout=30)
+            if res.status_code != 200:
+                return entry
+            entry = _reference_entry(res.json().get("data", []) or [], time.time())
+        except Exception as e:
+            print(f"⚠️ Could not fetch YECC reference list {endpoint}: {e}")
+            return entry
+
+        with _reference_lock:
+            _reference_cache[endpoint] = entry
+        print(f"📚 Cached YECC reference list {endpoint} ({len(entry['items'])} items)")
+
+    _save_reference_cache()
+    return entry
+
+
+def _get_reference_index(endpoint, headers=None):
+    entry = _get_reference(endpoint, headers)
+    return entry["index"] if entry is not None else None
+
+
+def _match_reference_id(index, name, fallback_name=None):
+    item, _ = match_title(index, name)
+    if item is None and fallback_name:
+        item, _ = match_title(index, fallback_name)
+    if item is None and index["items"]:
+        item = index["items"][0]
+    return item.get("ID") if item is not None else None
+
+
+_load_reference_cache()
+
+
+def _get_lookup_id(endpoint, match_text):
     try:
-        res = requests.get(f"{YECC_BASE_URL}/{endpoint}", headers=YECC_HEADERS, timeout=30)
-        if res.status_code != 200:
+        index = _get_reference_index(endpoint)
+        if index is None:
             return None
-        items = res.json().get("data", [])
-        for item in items:
-            if match_text.lower() in item.get(key_field, "").lower():
-                return item.get("ID")
-        return items[0].get("ID") if items else None
+        return _match_reference_id(index, match_text)
     except Exception:
         return None
 
 
-def sync_to_yecc_api(parsed_data):
+def sync_to_yecc_api(parsed_data, progress=None, on_progress=None):
     try:
         print("\n🔄 Syncing to YECC API...")
 
@@ -35,22 +144,31 @@ def sync_to_yecc_api(parsed_data):
             "isGetUSERID": True
         }
 
-        print("📤 Step 1: Creating user...")
-        res = requests.post(f"{YECC_BASE_URL}/users", headers=YECC_HEADERS, json=user_payload, timeout=30)
-        print(f"Response ({res.status_code}): {res.text}")
-        if res.status_code != 200:
-            print("⚠️ User creation failed.")
-            return None
+        progress = progress if progress is not None else {}
+        user_id = progress.get("user_id")
+        user_token = progress.get("token")
+        if user_id:
+            print(f"⏭️ Step 1: Reusing UserID {user_id} from an earlier attempt")
+        else:
+            print("📤 Step 1: Creating user...")
+            res = _session.post(f"{YECC_BASE_URL}/users", headers=YECC_HEADERS, json=user_payload, timeout=30)
+            print(f"Response ({res.status_code}): {res.text}")
+            if res.status_code != 200:
+                print("⚠️ User creation failed.")
+                return None
+
+            response_data = res.json().get("data", {})
+            user_id = response_data.get("UserID")
+            user_token = response_data.get("token")
+
+            if not user_id:
+                print("⚠️ No UserID in response.")
+                return None
+            print(f"✅ User created with UserID: {user_id}")
+            progress.update({"user_id": user_id, "token": user_token})
+            if on_progress:
+                on_progress(progress)
 
-        response_data = res.json().get("data", {})
-        user_id = response_data.get("UserID")
-        user_token = response_data.get("token")
-        
-        if not user_id:
-            print("⚠️ No UserID in response.")
-            return None
-        print(f"✅ User created with UserID: {user_id}")
-        
         if user_token:
             print(f"🔑 Using user's token for resume builder calls...")
             user_headers = YECC_HEADERS.copy()
@@ -59,25 +177,32 @@ def sync_to_yecc_api(parsed_data):
             print("⚠️ No user token returned, using admin token...")
             user_headers = YECC_HEADERS
 
-        print(f"\n📤 Step 2: Generating resume URL for UserID {user_id}...")
-        res = requests.post(
-            f"{YECC_BASE_URL}/ResumeBuilder/generateResumeUrl/{user_id}",
-            headers=user_headers,
-            timeout=30
-        )
-        print(f"Response ({res.status_code}): {res.text}")
-        if res.status_code != 200:
-            print("⚠️ Resume URL generation failed.")
-            return None
-
-        resume_url = res.json().get("data")
-        if not resume_url:
-            print("⚠️ No resume URL in response.")
-            return None
-        print(f"✅ Resume URL generated: {resume_url}")
+        resume_url = progress.get("resume_url")
+        if resume_url:
+            print(f"\n⏭️ Step 2: Reusing resume URL {resume_url} from an earlier attempt")
+        else:
+            print(f"\n📤 Step 2: Generating resume URL for UserID {user_id}...")
+            res = _session.post(
+                f"{YECC_BASE_URL}/ResumeBuilder/generateResumeUrl/{user_id}",
+                headers=user_headers,
+                timeout=30
+            )
+            print(f"Response ({res.status_code}): {res.text}")
+            if res.status_code != 200:
+                print("⚠️ Resume URL generation failed.")
+                return None
+
+            resume_url = res.json().get("data")
+            if not resume_url:
+                print("⚠️ No resume URL in response.")
+                return None
+            print(f"✅ Resume URL generated: {resume_url}")
+            progress["resume_url"] = resume_url
+            if on_progress:
+                on_progress(progress)
 
         print(f"\n📡 Initializing resume data for URL: {resume_url}")
-        init_res = requests.get(
+        init_res = _session.get(
             f"{YECC_BASE_URL}/ResumeBuilder/{resume_url}",
             headers=user_headers,
             timeout=30
@@ -89,25 +214,37 @@ def sync_to_yecc_api(parsed_data):
             print("✅ Resume context initialized successfully.")
 
         print("\n📡 Fetching reference IDs...")
+        lookup_futures = {
+            key: _executor.submit(_get_lookup_id, endpoint, match_text)
+            for key, (endpoint, match_text, _) in LOOKUP_DEFAULTS.items()
+        }
         lookups = {
-            "country_id": _get_lookup_id("resumeCountry", "India") or 3,
-            "state_id": _get_lookup_id("resumeState", "Gujarat") or 1,
-            "city_id": _get_lookup_id("resumeCity", "Ahmedabad") or 1,
-            "degree_id": _get_lookup_id("resumeDegree", "Bachelor") or 1,
-            "university_id": _get_lookup_id("resumeUniversity", "University") or 1,
-            "lang_id": _get_lookup_id("resumeLanguages", "English") or 1,
-            "company_id": _get_lookup_id("resumeCompany", "Infosys") or 1,
-            "position_id": _get_lookup_id("resumePosition", "Consultant") or 1
+            key: lookup_futures[key].result() or default
+            for key, (_, _, default) in LOOKUP_DEFAULTS.items()
         }
         print(f"✅ Lookup IDs: {json.dumps(lookups, indent=2)}")
 
-        print("\n📤 Step 5: Updating resume sections...")
-        _update_personal_info(parsed_data, resume_url, user_payload, lookups, user_headers)
-        _update_skills(parsed_data, resume_url, lookups, user_headers)
-        _update_experience(parsed_data, resume_url, lookups, user_headers)
-        _update_erp_projects(parsed_data, resume_url, lookups, user_headers)
-        _update_education(parsed_data, resume_url, lookups, user_headers)
-        _update_certifications(parsed_data, resume_url, user_headers)
+        sections = {
+            "personal_info": (_update_personal_info, parsed_data, resume_url, user_payload, lookups, user_headers),
+            "skills": (_update_skills, parsed_data, resume_url, lookups, user_headers),
+            "experience": (_update_experience, parsed_data, resume_url, lookups, user_headers),
+            "erp_projects": (_update_erp_projects, parsed_data, resume_url, lookups, user_headers),
+            "education": (_update_education, parsed_data, resume_url, lookups, user_headers),
+            "certifications": (_update_certifications, parsed_data, resume_url, user_headers)
+        }
+        completed = progress.setdefault("sections", [])
+        pending = [name for name in sections if name not in completed]
+        print(f"\n📤 Step 5: Updating resume sections ({', '.join(pending) or 'none left'})...")
+        futures = {name: _executor.submit(*sections[name]) for name in pending}
+        wait(list(futures.values()))
+
+        failed = [name for name, future in futures.items() if not future.result()]
+        completed.extend(name for name in pending if name not in failed)
+        if pending and on_progress:
+            on_progress(progress)
+        if failed:
+            print(f"⚠️ YECC section updates failed: {', '.join(failed)}")
+            return None
 
         print("✅ YECC sync complete!")
         return {
@@ -147,11 +284,13 @@ def _update_personal_info(parsed_data, resume_url, user_payload, lookups, header
         }
 
         print("   → Updating personal info...")
-        res = requests.put(f"{YECC_BASE_URL}/ResumeBuilder/PersonalInfo/{resume_url}",
-                           headers=headers, json=personal_info_payload, timeout=30)
+        res = _session.put(f"{YECC_BASE_URL}/ResumeBuilder/PersonalInfo/{resume_url}",
+                          headers=headers, json=personal_info_payload, timeout=30)
         print(f"   Response: {res.status_code} {res.text[:200]}")
+        return res.status_code == 200
     except Exception as e:
         print(f"   ⚠️ Personal info error: {e}")
+        return False
 
 
 def _update_skills(parsed_data, resume_url, lookups, headers):
@@ -174,11 +313,13 @@ def _update_skills(parsed_data, resume_url, lookups, headers):
         payload = {"Skills": skills, "Languages": [{"Title": "English", "LanguageID": lookups["lang_id"]}]}
 
         print(f"   → Updating skills ({len(skills)} skills)...")
-        res = requests.put(f"{YECC_BASE_URL}/ResumeBuilder/ContactInfo/{resume_url}",
-                           headers=headers, json=payload, timeout=30)
+        res = _session.put(f"{YECC_BASE_URL}/ResumeBuilder/ContactInfo/{resume_url}",
+                          headers=headers, json=payload, timeout=30)
         print(f"   Response: {res.status_code} {res.text[:200]}")
+        return res.status_code == 200
     except Exception as e:
         print(f"   ⚠️ Skills error: {e}")
+        return False
 
 
 def _update_experience(parsed_data, resume_url, lookups, headers):
@@ -265,16 +406,19 @@ def _update_experience(parsed_data, resume_url, lookups, headers):
         
         if not exps:
             print("   ⚠️ No experience data to update.")
-            return
+            return True
         print(f"   → Updating experience ({len(exps)} entries)...")
-        res = requests.put(f"{YECC_BASE_URL}/ResumeBuilder/Experiences/{resume_url}",
-                           headers=headers, json=exps, timeout=30)
+        res = _session.put(f"{YECC_BASE_URL}/ResumeBuilder/Experiences/{resume_url}",
+                          headers=headers, json=exps, timeout=30)
         print(f"   Response: {res.status_code} {res.text[:200]}")
+        return res.status_code == 200
     except Exception as e:
         print(f"   ⚠️ Experience error: {e}")
+        return False
 
 
 def _update_education(parsed_data, resume_url, lookups, headers):
+    ok = True
     try:
         educations = []
         for edu in parsed_data.get("education", [])[:3]:
@@ -294,12 +438,12 @@ def _update_education(parsed_data, resume_url, lookups, headers):
 
         if not educations:
             print("   ⚠️ No education data to update.")
-            return
+            return True
 
         payload = {"EducationCertifications": educations}
 
         print(f"   → Updating education ({len(educations)} entries)...")
-        res = requests.put(
+        res = _session.put(
             f"{YECC_BASE_URL}/ResumeBuilder/EducationCertifications/{resume_url}",
             headers=headers,
             json=payload,
@@ -311,9 +455,11 @@ def _update_education(parsed_data, resume_url, lookups, headers):
             print("   ✅ Education updated successfully")
         else:
             print("   ⚠️ Education update failed")
+            ok = False
 
     except Exception as e:
         print(f"   ⚠️ Education error: {e}")
+        ok = False
 
     try:
         edus = []
@@ -336,13 +482,15 @@ def _update_education(parsed_data, resume_url, lookups, headers):
             })
         if not edus:
             print("   ⚠️ No education data to update.")
-            return
+            return ok
         print(f"   → Updating education ({len(edus)} entries)...")
-        res = requests.put(f"{YECC_BASE_URL}/ResumeBuilder/EducationCertifications/{resume_url}",
-                           headers=headers, json=edus, timeout=30)
+        res = _session.put(f"{YECC_BASE_URL}/ResumeBuilder/EducationCertifications/{resume_url}",
+                          headers=headers, json=edus, timeout=30)
         print(f"   Response: {res.status_code} {res.text[:200]}")
+        return ok and res.status_code == 200
     except Exception as e:
         print(f"   ⚠️ Education error: {e}")
+        return False
 
 
 def _update_certifications(parsed_data, resume_url, headers):
@@ -363,67 +511,60 @@ def _update_certifications(parsed_data, resume_url, headers):
             })
         if not certs:
             print("   ⚠️ No certifications to update.")
-            return
+            return True
         print(f"   → Updating certifications ({len(certs)} entries)...")
-        res = requests.put(f"{YECC_BASE_URL}/ResumeBuilder/Certifications/{resume_url}",
-                           headers=headers, json=certs, timeout=30)
+        res = _session.put(f"{YECC_BASE_URL}/ResumeBuilder/Certifications/{resume_url}",
+                          headers=headers, json=certs, timeout=30)
         print(f"   Response: {res.status_code} {res.text[:200]}")
+        return res.status_code == 200
     except Exception as e:
         print(f"   ⚠️ Certifications error: {e}")
+        return False
+
 
+TRACK_ALIASES = {
+    "scm": "supply chain management",
+    "fin": "financials",
+    "hcm": "human capital management"
+}
 
 def _get_track_id(headers, track_name):
     try:
-        res = requests.get(f"{YECC_BASE_URL}/resumeTrack", headers=headers, timeout=10)
-        if res.status_code == 200:
-            tracks = res.json().get("data", [])
-            track_lower = track_name.lower() if track_name else ""
-            for t in tracks:
-                title = t.get("Title", "").lower()
-                if track_lower in title or (track_lower == "scm" and "supply chain" in title):
-                    return t.get("ID")
-                if track_lower == "fin" and "financ" in title:
-                    return t.get("ID")
-                if track_lower == "hcm" and "human capital" in title:
-                    return t.get("ID")
-            return tracks[0].get("ID") if tracks else "1"
+        tracks = _get_reference_index("resumeTrack", headers)
+        if tracks is not None:
+            track_lower = (track_name or "").strip().lower()
+            return _match_reference_id(tracks, track_name, TRACK_ALIASES.get(track_lower)) or "1"
     except:
         pass
     return "1"
 
 def _get_product_id(headers, product_name):
     try:
-        res = requests.get(f"{YECC_BASE_URL}/resumeProduct", headers=headers, timeout=10)
-        if res.status_code == 200:
-            products = res.json().get("data", [])
-            product_lower = product_name.lower() if product_name else ""
-            for p in products:
-                title = p.get("Title", "").lower()
-                if product_lower and product_lower in title:
-                    return p.get("ID")
-                if "oracle" in product_lower and "oracle" in title:
-                    return p.get("ID")
-            return products[0].get("ID") if products else "1"
+        products = _get_reference_index("resumeProduct", headers)
+        if products is not None:
+            item, _ = match_title(products, product_name)
+            vendor = normalize_title(product_name).split()[:1]
+            if item is None and vendor and vendor[0] in products["tokens"]:
+                item = products["items"][products["tokens"][vendor[0]][0]]
+            return item.get("ID") if item is not None else None
     except:
         pass
     return "1"
 
 def _get_module_objects(headers, module_names, track_id, product_id):
     try:
-        res = requests.get(f"{YECC_BASE_URL}/resumeModules", headers=headers, timeout=10)
-        if res.status_code == 200:
-            all_modules = res.json().get("data", [])
+        all_modules = _get_reference_index("resumeModules", headers)
+        if all_modules is not None:
             matched = []
+            seen = set()
             for mod_name in module_names:
-                mod_lower = mod_name.lower() if mod_name else ""
-                for m in all_modules:
-                    title = m.get("Title", "").lower()
-                    if mod_lower in title or title in mod_lower:
-                        matched.append({
-                            "Title": m.get("Title"),
-                            "ModuleID": m.get("ID")
-                        })
-                        break
+                m, _ = match_title(all_modules, mod_name)
+                if m is not None and m.get("ID") not in seen:
+                    seen.add(m.get("ID"))
+                    matched.append({
+                        "Title": m.get("Title"),
+                        "ModuleID": m.get("ID")
+                    })
             return matched if matched else [{"Title": module_names[0], "ModuleID": None}] if module_names else []
     except:
         pass
@@ -431,28 +572,18 @@ def _get_module_objects(headers, module_names, track_id, product_id):
 
 def _get_domain_id(headers, domain_name):
     try:
-        res = requests.get(f"{YECC_BASE_URL}/resumeDomain", headers=headers, timeout=10)
-        if res.status_code == 200:
-            domains = res.json().get("data", [])
-            domain_lower = domain_name.lower() if domain_name else ""
-            for d in domains:
-                if domain_lower in d.get("Title", "").lower():
-                    return d.get("ID")
-            return domains[0].get("ID") if domains else None
+        domains = _get_reference_index("resumeDomain", headers)
+        if domains is not None:
+            return _match_reference_id(domains, domain_name)
     except:
         pass
     return None
 
 def _get_role_id(headers, role_name):
     try:
-        res = requests.get(f"{YECC_BASE_URL}/resumeRole", headers=headers, timeout=10)
-        if res.status_code == 200:
-            roles = res.json().get("data", [])
-            role_lower = role_name.lower() if role_name else ""
-            for r in roles:
-                if role_lower in r.get("Title", "").lower() or "consultant" in r.get("Title", "").lower():
-                    return r.get("ID")
-            return roles[0].get("ID") if roles else None
+        roles = _get_reference_index("resumeRole", headers)
+        if roles is not None:
+            return _match_reference_id(roles, role_name, "consultant")
     except:
         pass
     return None
@@ -463,7 +594,7 @@ def _update_erp_projects(parsed_data, resume_url, lookups, headers):
         
         if not erp_projects:
             print("   ⚠️ No ERP projects to update.")
-            return
+            return True
         
         projects = []
         for idx, proj in enumerate(erp_projects[:5]):
@@ -487,6 +618,7 @@ def _update_erp_projects(parsed_data, resume_url, lookups, headers):
             all_modules.extend(proj.get("hcm_modules", []))
             
             module_objects = _get_module_objects(headers, all_modules, track_id, product_id)
+            product_key = str(product_id) if product_id is not None else ""
             
             project_types = proj.get("project_type", [])
             if not project_types:
@@ -536,10 +668,10 @@ def _update_erp_projects(parsed_data, resume_url, lookups, headers):
                     "Title": track,
                     "label": track,
                     "value": track,
-                    "ProductID": str(product_id)
+                    "ProductID": product_key
                 },
                 "ProductObject": {
-                    "ID": str(product_id),
+                    "ID": product_key,
                     "Title": product,
                     "label": product,
                     "value": product,
@@ -552,7 +684,7 @@ def _update_erp_projects(parsed_data, resume_url, lookups, headers):
                         "label": m.get("Title", ""),
                         "value": m.get("Title", ""),
                         "TrackID": str(track_id),
-                        "ProductID": str(product_id)
+                        "ProductID": product_key
                     } for m in module_objects
                 ]
             }
@@ -562,19 +694,21 @@ def _update_erp_projects(parsed_data, resume_url, lookups, headers):
         print(f"   → Updating ERP projects ({len(projects)} entries)...")
         print(f"   Payload sample: {json.dumps(projects[0], indent=2)[:800]}")
         
-        res = requests.put(f"{YECC_BASE_URL}/ResumeBuilder/ProjectExperiences/{resume_url}",
-                           headers=headers, json=projects, timeout=30)
+        res = _session.put(f"{YECC_BASE_URL}/ResumeBuilder/ProjectExperiences/{resume_url}",
+                          headers=headers, json=projects, timeout=30)
         print(f"   ProjectExperiences Response: {res.status_code} {res.text[:300]}")
         
         if res.status_code == 200:
             print("   ✅ Projects updated successfully!")
-        else:
-            print(f"   ⚠️ Projects update failed: {res.text[:200]}")
+            return True
+        print(f"   ⚠️ Projects update failed: {res.text[:200]}")
+        return False
         
     except Exception as e:
         import traceback
         print(f"   ⚠️ ERP Projects error: {e}")
         traceback.print_exc()
+        return False
 
 def import_time():
     import time